@@ -0,0 +1,93 @@
+# benchmarks/bench_connection_pool.py
+"""
+CoupangApiClient의 요청당 지연 시간을 keep-alive 연결 풀 사용 여부에 따라 비교합니다.
+로컬에 자체 서명 인증서로 TLS 서버를 띄워 API Gateway를 흉내내므로 네트워크가 필요 없습니다.
+
+실행 방법 (프로젝트 루트에서, openssl 명령어 필요):
+    python -m benchmarks.bench_connection_pool --calls 200
+"""
+import argparse
+import json
+import ssl
+import statistics
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from coupang_lib.api_client import CoupangApiClient
+from coupang_lib.mock_gateway import generate_self_signed_cert
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """모든 요청에 작은 성공 응답을 돌려주는 API Gateway 대역입니다."""
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 delayed ACK로 인한 40ms 지연 방지
+
+    def _reply(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        payload = json.dumps({"code": 200, "message": "OK", "data": {"success": True, "content": {"status": "REQUESTED"}}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _reply
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _start_tls_server(cert_path: str, key_path: str) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    ctx.load_cert_chain(cert_path, key_path)
+    server.socket = ctx.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _measure(client: CoupangApiClient, calls: int) -> list[float]:
+    latencies_ms = []
+    for i in range(calls):
+        started = time.perf_counter()
+        client.get(f"/v2/providers/fms/apis/api/v1/vendors/A00000000/requested/{i}")
+        latencies_ms.append((time.perf_counter() - started) * 1000)
+    return latencies_ms
+
+
+def _summarize(latencies_ms: list[float]) -> dict:
+    ordered = sorted(latencies_ms)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="keep-alive 연결 풀 지연 시간 벤치마크")
+    parser.add_argument("--calls", type=int, default=200, help="모드별 요청 횟수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        server = _start_tls_server(*generate_self_signed_cert(tmp_dir))
+        gateway_url = f"https://127.0.0.1:{server.server_address[1]}"
+        try:
+            results = {}
+            for mode, keep_alive in (("per_call_connection", False), ("keep_alive_pool", True)):
+                client = CoupangApiClient("bench-access-key", "bench-secret-key", gateway_url, keep_alive=keep_alive)
+                _measure(client, 5)  # 워밍업
+                results[mode] = _summarize(_measure(client, args.calls))
+                client.close()
+        finally:
+            server.shutdown()
+
+    print(json.dumps({"calls": args.calls, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
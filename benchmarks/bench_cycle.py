@@ -0,0 +1,217 @@
+# benchmarks/bench_cycle.py
+"""
+run_coupon_cycle 전체 사이클을 로컬 API Gateway 대역 서버(coupang_lib/mock_gateway.py)에 대해 실행하고,
+단계별 소요 시간, HTTP 호출 수, 주고받은 바이트 수, 요청 지연 시간(p50/p99)을 JSON으로 출력합니다.
+남아 있는 자동 쿠폰 수와 적용 품목 수를 바꿔 가며 여러 시나리오를 측정하므로 릴리스 간 성능 변화를 비교할 수 있습니다.
+
+- 단계(phases)는 기존 쿠폰 비활성화(deactivate), 쿠폰 생성 및 완료 확인(create), 품목 적용(apply)이며,
+  fixed_wait는 단계 사이 고정 대기(POST_CREATE_WAIT_SEC, PRE_APPLY_WAIT_SEC)의 합계입니다. (create 시간에 일부 포함)
+- Git 업데이트 확인과 Discord 알림은 측정에서 제외합니다.
+- 요청 속도 제한기는 실제 실행과 같은 설정(API_RATE_LIMIT_PER_SEC 등)을 사용합니다.
+
+실행 방법 (프로젝트 루트에서, openssl 명령어 필요):
+    python -m benchmarks.bench_cycle
+    python -m benchmarks.bench_cycle --scenario 1:400 --scenario 100:100000 --fixed-wait-sec 0 --output cycle.json
+"""
+import argparse
+import contextlib
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Tuple
+
+BENCH_ACCESS_KEY = "bench-access-key"
+BENCH_SECRET_KEY = "bench-secret-key"
+BENCH_VENDOR_ID = "A00000000"
+DEFAULT_SCENARIOS = ("1:400", "10:10000", "100:100000")
+
+
+def _prepare_environment(state_dir: str, fixed_wait_sec: float | None):
+    """main 모듈을 불러오기 전에 실제 계정, 상태 파일, 알림 설정을 사용하지 않도록 환경 변수를 지정합니다."""
+    os.environ.update({
+        "ACCESS_KEY": BENCH_ACCESS_KEY,
+        "SECRET_KEY": BENCH_SECRET_KEY,
+        "VENDOR_ID": BENCH_VENDOR_ID,
+        "STATE_DB_PATH": os.path.join(state_dir, "bench_state.db"),
+        "DISCORD_WEBHOOK_URL": "",
+    })
+    if fixed_wait_sec is not None:
+        os.environ["POST_CREATE_WAIT_SEC"] = str(fixed_wait_sec)
+        os.environ["PRE_APPLY_WAIT_SEC"] = str(fixed_wait_sec)
+
+
+def _parse_scenario(value: str) -> Tuple[int, int]:
+    coupons, items = value.split(":")
+    return int(coupons), int(items)
+
+
+def _percentile(ordered: List[float], ratio: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * ratio))]
+
+
+def _latency_summary(latencies_ms: List[float]) -> Dict[str, float]:
+    if not latencies_ms:
+        return {"mean_ms": 0.0, "p50_ms": 0.0, "p99_ms": 0.0, "max_ms": 0.0}
+    ordered = sorted(latencies_ms)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(_percentile(ordered, 0.5), 3),
+        "p99_ms": round(_percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+class _PhaseTimer:
+    """main 모듈의 단계 함수를 감싸 호출별 소요 시간을 누적합니다."""
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    def wrap(self, module, attribute: str, phase: str):
+        original = getattr(module, attribute)
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                self.seconds[phase] = self.seconds.get(phase, 0.0) + time.perf_counter() - started
+
+        setattr(module, attribute, timed)
+        return original
+
+
+def _instrument_client(client) -> List[float]:
+    """클라이언트의 HTTP 왕복 시간(속도 제한 대기 제외)을 기록할 리스트를 반환합니다."""
+    latencies_ms: List[float] = []
+    original_open = client._open
+
+    def timed_open(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return original_open(*args, **kwargs)
+        finally:
+            latencies_ms.append((time.perf_counter() - started) * 1000)
+
+    client._open = timed_open
+    return latencies_ms
+
+
+def _run_scenario(main_module, options, leftover_coupons: int, item_count: int) -> Dict[str, Any]:
+    from coupang_lib.api_client import CoupangApiClient
+    from coupang_lib.item_loader import VendorItemIndex
+    from coupang_lib.config import API_KEEP_ALIVE, API_POOL_MAX_SIZE, API_POOL_IDLE_TIMEOUT_SEC, API_THROTTLE_MAX_RETRIES
+    from coupang_lib.mock_gateway import MockCoupangGateway
+
+    with MockCoupangGateway(BENCH_ACCESS_KEY, BENCH_SECRET_KEY, options) as gateway:
+        gateway.seed_coupons(leftover_coupons, name_prefix="자동쿠폰_bench")
+        # 시나리오마다 속도 제한기와 연결 풀을 새로 만들어 이전 시나리오의 감속 상태가 이어지지 않게 합니다.
+        client = CoupangApiClient(
+            BENCH_ACCESS_KEY, BENCH_SECRET_KEY, gateway.url,
+            keep_alive=API_KEEP_ALIVE, pool_max_size=API_POOL_MAX_SIZE, pool_idle_timeout_sec=API_POOL_IDLE_TIMEOUT_SEC,
+            rate_limiter=main_module.create_api_rate_limiter(), max_throttle_retries=API_THROTTLE_MAX_RETRIES
+        )
+        latencies_ms = _instrument_client(client)
+        tenant = main_module.get_default_tenant()
+        tenant.api_client = client
+        tenant.vendor_items = VendorItemIndex(range(1_000_000_000, 1_000_000_000 + item_count))
+
+        started = time.perf_counter()
+        # 알림 모듈 등의 print 출력이 결과 JSON(표준 출력)에 섞이지 않도록 표준 에러로 보냅니다.
+        with contextlib.redirect_stdout(sys.stderr):
+            main_module.run_coupon_cycle()
+        wall_time_sec = time.perf_counter() - started
+
+        active_coupons = gateway.active_coupons()
+        stats = gateway.stats()
+        client.close()
+
+    # 사이클이 끝난 뒤 새 쿠폰 하나만 활성 상태이고 모든 품목이 적용되어 있어야 성공으로 봅니다.
+    succeeded = len(active_coupons) == 1 and active_coupons[0]["items"] == item_count
+    return {
+        "leftover_coupons": leftover_coupons,
+        "items": item_count,
+        "succeeded": succeeded,
+        "wall_time_sec": round(wall_time_sec, 3),
+        "http": {
+            "calls": stats["total_calls"],
+            "calls_by_endpoint": stats["calls"],
+            "responses": stats["responses"],
+            "bytes_sent": stats["bytes_received"],  # 클라이언트 기준: 서버가 받은 바이트 = 클라이언트가 보낸 바이트
+            "bytes_received": stats["bytes_sent"],
+            "latency": _latency_summary(latencies_ms),
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="쿠폰 갱신 사이클 전체 벤치마크")
+    parser.add_argument("--scenario", action="append", help="'남은 자동 쿠폰 수:적용 품목 수' (여러 번 지정 가능, 기본값: 1:400, 10:10000, 100:100000)")
+    parser.add_argument("--latency-ms", type=float, default=20.0, help="대역 서버 응답 지연(밀리초)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=10.0, help="응답 지연에 더할 무작위 시간(밀리초)")
+    parser.add_argument("--done-delay-sec", type=float, default=1.0, help="요청이 REQUESTED에서 DONE으로 바뀌는 시간(초)")
+    parser.add_argument("--item-failure-rate", type=float, default=0.0, help="품목 적용 시 품목별 실패 확률 (실패 품목 재적용 경로 측정용)")
+    parser.add_argument("--fixed-wait-sec", type=float, default=None, help="단계 사이 고정 대기 시간 재정의(초). 지정하지 않으면 설정값 사용")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일 경로 (지정하지 않으면 표준 출력)")
+    parser.add_argument("--verbose", action="store_true", help="사이클 로그를 INFO 수준으로 출력")
+    args = parser.parse_args()
+
+    scenarios = [_parse_scenario(value) for value in (args.scenario or DEFAULT_SCENARIOS)]
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        _prepare_environment(state_dir, args.fixed_wait_sec)
+        import main as main_module
+        from coupang_lib.config import POST_CREATE_WAIT_SEC, PRE_APPLY_WAIT_SEC
+        from coupang_lib.logger import logger
+        from coupang_lib.mock_gateway import MockGatewayOptions
+
+        logger.setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+        phase_timer = _PhaseTimer()
+        phase_timer.wrap(main_module, "_handle_deactivation_phase", "deactivate")
+        phase_timer.wrap(main_module, "_create_and_poll_coupon", "create")
+        phase_timer.wrap(main_module, "_apply_coupon_with_retries", "apply")
+        phase_timer.wrap(main_module, "_fixed_wait", "fixed_wait")
+
+        results = []
+        for leftover_coupons, item_count in scenarios:
+            options = MockGatewayOptions(
+                latency_ms=args.latency_ms, latency_jitter_ms=args.latency_jitter_ms,
+                done_delay_sec=args.done_delay_sec, item_failure_rate=args.item_failure_rate, seed=args.seed
+            )
+            phase_timer.seconds = {}
+            result = _run_scenario(main_module, options, leftover_coupons, item_count)
+            result["phases_sec"] = {phase: round(seconds, 3) for phase, seconds in phase_timer.seconds.items()}
+            results.append(result)
+            logger.warning(f"[벤치마크] 쿠폰 {leftover_coupons}개 / 품목 {item_count}개: {result['wall_time_sec']}초, HTTP {result['http']['calls']}회")
+        main_module.get_state_store().close()
+
+    report = {
+        "benchmark": "coupon_cycle",
+        "settings": {
+            "latency_ms": args.latency_ms,
+            "latency_jitter_ms": args.latency_jitter_ms,
+            "done_delay_sec": args.done_delay_sec,
+            "item_failure_rate": args.item_failure_rate,
+            "post_create_wait_sec": POST_CREATE_WAIT_SEC,
+            "pre_apply_wait_sec": PRE_APPLY_WAIT_SEC,
+            "apply_batch_size": main_module.APPLY_BATCH_SIZE,
+            "apply_incremental": main_module.APPLY_INCREMENTAL,
+            "rotation_mode": main_module.COUPON_ROTATION_MODE,
+        },
+        "scenarios": results,
+    }
+    output = json.dumps(report, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# benchmarks/bench_request_encoding.py
+"""
+CoupangApiClient가 요청마다 하는 준비 작업(서명 생성, 바디 JSON 변환)의 CPU 비용을 품목 수별로 측정합니다.
+네트워크 없이 변환 함수만 반복 실행하며, 이전 방식(요청마다 HMAC 키 생성/strftime 2회, 바디 직렬화 + 디버그 로그용 indent=2 재직렬화)과
+현재 방식(json_codec 백엔드별, VendorItemIndex가 만드는 바이트)을 함께 출력합니다.
+
+실행 방법 (프로젝트 루트에서):
+    python -m benchmarks.bench_request_encoding --items 1000,10000,50000
+"""
+import argparse
+import hashlib
+import hmac
+import json
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+from coupang_lib import json_codec
+from coupang_lib.api_client import CoupangApiClient
+from coupang_lib.item_loader import VendorItemIndex
+from coupang_lib.logger import logger
+
+_METHOD = "POST"
+_PATH = "/v2/providers/fms/apis/api/v1/vendors/A00000000/coupons/10000001/items"
+
+
+def _legacy_signature(access_key: str, secret_key: str, method: str, path: str, query: str) -> str:
+    """이전 CoupangApiClient._generate_signature와 같은 방식 (요청마다 키 인코딩, strftime 2회, HMAC 객체 생성)"""
+    current_utc_time = datetime.now(timezone.utc)
+    gmt_time_str = current_utc_time.strftime('%y%m%d') + 'T' + current_utc_time.strftime('%H%M%S') + 'Z'
+    message_bytes = f"{gmt_time_str}{method}{path}{query}".encode('utf-8')
+    signature = hmac.new(secret_key.encode('utf-8'), message_bytes, hashlib.sha256).hexdigest()
+    return f"CEA algorithm=HmacSHA256, access-key={access_key}, signed-date={gmt_time_str}, signature={signature}"
+
+
+def _legacy_body(body: Dict[str, Any]) -> bytes:
+    """이전 send_request 방식: 전송용 직렬화 + 디버그 로그용 indent=2 직렬화 (로그 스레드에서 실행되던 작업 포함)"""
+    req_body = json.dumps(body).encode('utf-8')
+    json.dumps(body, indent=2, ensure_ascii=False)
+    return req_body
+
+
+def _per_call_us(func: Callable[[], Any], min_duration_sec: float) -> float:
+    func()  # 워밍업
+    calls = 0
+    started = time.perf_counter()
+    while True:
+        func()
+        calls += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_duration_sec:
+            return round(elapsed / calls * 1_000_000, 2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 요청 서명/바디 변환 비용 마이크로벤치마크")
+    parser.add_argument("--items", default="1000,10000,50000", help="품목 수 목록 (쉼표로 구분)")
+    parser.add_argument("--min-duration-sec", type=float, default=0.5, help="항목별 최소 측정 시간(초)")
+    args = parser.parse_args()
+
+    # 서명 함수 안의 DEBUG 로그 비용은 제외하고 변환 작업만 측정합니다.
+    logger.setLevel(logging.INFO)
+    client = CoupangApiClient("bench-access-key", "bench-secret-key", "https://127.0.0.1")
+
+    signing = {
+        "legacy": _per_call_us(lambda: _legacy_signature("bench-access-key", "bench-secret-key", _METHOD, _PATH, ""), args.min_duration_sec),
+        "cached_hmac": _per_call_us(lambda: client._generate_signature(_METHOD, _PATH, ""), args.min_duration_sec),
+    }
+
+    backends = {"json": json_codec._stdlib_dumps}
+    try:
+        import orjson
+        backends["orjson"] = orjson.dumps
+    except ImportError:
+        pass
+
+    bodies = {}
+    for item_count in (int(value) for value in args.items.split(",") if value.strip()):
+        index = VendorItemIndex(range(1_000_000_000, 1_000_000_000 + item_count))
+        body = {"vendorItems": index.to_id_strings()}
+        results = {"legacy_json_with_debug_dump": _per_call_us(lambda: _legacy_body(body), args.min_duration_sec)}
+        for name, dumps in backends.items():
+            results[f"json_codec_{name}"] = _per_call_us(lambda: dumps(body), args.min_duration_sec)
+        results["vendor_item_index_bytes"] = _per_call_us(index.apply_request_body, args.min_duration_sec)
+        bodies[item_count] = {"body_bytes": len(index.apply_request_body()), "per_call_us": results}
+
+    print(json.dumps({"active_json_backend": json_codec.BACKEND, "signing_per_call_us": signing, "body_encoding": bodies}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# benchmarks/bench_startup.py
+"""
+프로세스 시작 비용을 측정합니다. 새 Python 프로세스에서 main 모듈을 불러오는 시간과,
+이어서 API 클라이언트/판매자 품목/상태 저장소를 처음 만드는 시간(첫 사이클 준비 시간)을 반복 측정하고,
+import 시간이 가장 큰 모듈 목록(python -X importtime)과 함께 JSON으로 출력합니다.
+
+실행 방법 (프로젝트 루트에서):
+    python -m benchmarks.bench_startup --runs 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+# 자식 프로세스에서 실행할 측정 코드. 결과를 JSON 한 줄로 출력합니다.
+_PROBE = """
+import json, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+main.get_api_client(); main.get_vendor_items(); main.get_state_store()
+ready = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "first_use_ms": (ready - imported) * 1000}))
+"""
+
+
+def _child_env(state_dir: str) -> Dict[str, str]:
+    env = dict(os.environ)
+    env.update({"STATE_DB_PATH": os.path.join(state_dir, "bench_state.db"), "VENDOR_ID": env.get("VENDOR_ID") or "A00000000"})
+    return env
+
+
+def _run_probe(env: Dict[str, str]) -> Dict[str, float]:
+    started = time.perf_counter()
+    completed = subprocess.run([sys.executable, "-c", _PROBE], env=env, capture_output=True, text=True, check=True)
+    process_ms = (time.perf_counter() - started) * 1000
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_ms"] = process_ms
+    return result
+
+
+def _top_imports(env: Dict[str, str], limit: int) -> List[Dict[str, object]]:
+    """python -X importtime 출력에서 누적 import 시간이 큰 모듈을 반환합니다."""
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"], env=env, capture_output=True, text=True, check=True)
+    modules = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace("import time:", "|", 1).split("|")]
+        if not cumulative_us.isdigit():
+            continue
+        modules.append({"module": name, "cumulative_ms": round(int(cumulative_us) / 1000, 2), "self_ms": round(int(self_us) / 1000, 2)})
+    modules.sort(key=lambda module: module["cumulative_ms"], reverse=True)
+    return modules[:limit]
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "mean_ms": round(statistics.fmean(ordered), 2),
+        "p50_ms": round(ordered[len(ordered) // 2], 2),
+        "min_ms": round(ordered[0], 2),
+        "max_ms": round(ordered[-1], 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프로세스 시작(import) 시간 벤치마크")
+    parser.add_argument("--runs", type=int, default=10, help="측정 반복 횟수")
+    parser.add_argument("--top", type=int, default=15, help="출력할 import 시간 상위 모듈 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as state_dir:
+        env = _child_env(state_dir)
+        _run_probe(env)  # 워밍업 (.pyc 생성)
+        samples = [_run_probe(env) for _ in range(args.runs)]
+        top_imports = _top_imports(env, args.top)
+
+    report = {
+        "benchmark": "startup",
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        "import_main": _summarize([sample["import_ms"] for sample in samples]),
+        "first_use": _summarize([sample["first_use_ms"] for sample in samples]),
+        "process_total": _summarize([sample["process_ms"] for sample in samples]),
+        "top_imports": top_imports,
+    }
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,116 +1,373 @@
+import collections
+import email.utils
+import http.client
+import io
 import json
 import hmac
+import logging
 import hashlib
 import os
+import socket
+import threading
 import time
 import urllib.request
 import urllib.parse
 import ssl
 from datetime import datetime, timezone
 
+from typing import Tuple
+
 from coupang_lib.config import ACCESS_KEY, SECRET_KEY, API_GATEWAY_URL
-from coupang_lib.logger import logger
+from coupang_lib.logger import logger, LazyText
+from coupang_lib import json_codec
+from coupang_lib.response_decoder import ResponseDecoder
+from coupang_lib.metrics import API_REQUESTS_TOTAL, API_REQUEST_DURATION_SECONDS
+from coupang_lib.rate_limiter import AdaptiveRateLimiter
+from coupang_lib.circuit_breaker import CircuitBreaker, CircuitOpenError
+
+REQUEST_TIMEOUT_SEC = 60
+CONTENT_TYPE_JSON = "application/json;charset=UTF-8"
+
+# 같은 초 안의 요청은 signed-date 문자열을 다시 만들지 않습니다. (초, "YYMMDDTHHMMSSZ")
+_signed_date_cache: Tuple[int, str] = (-1, "")
+
+
+def signed_date(now: float | None = None) -> str:
+    """
+    서명에 사용할 UTC 기준 signed-date(YYMMDDTHHMMSSZ)를 반환합니다.
+    값은 초 단위로만 바뀌므로 마지막으로 만든 문자열을 같은 초 동안 재사용합니다.
+    """
+    global _signed_date_cache
+    second = int(time.time() if now is None else now)
+    cached_second, cached_value = _signed_date_cache
+    if cached_second != second:
+        cached_value = time.strftime('%y%m%dT%H%M%SZ', time.gmtime(second))
+        _signed_date_cache = (second, cached_value)
+    return cached_value
+
+
+def endpoint_template(method: str, path_without_query: str) -> str:
+    """
+    요청 경로에서 판매자 ID와 숫자 ID를 자리표시자로 바꾼 엔드포인트 키를 반환합니다.
+    예: ("GET", "/v2/.../vendors/A001/requested/123") → "GET /v2/.../vendors/{vendorId}/requested/{id}"
+    """
+    segments = path_without_query.split('/')
+    for index, segment in enumerate(segments):
+        if index > 0 and segments[index - 1] == 'vendors':
+            segments[index] = '{vendorId}'
+        elif segment.isdigit():
+            segments[index] = '{id}'
+    return f"{method} {'/'.join(segments)}"
+
+
+def _retry_after_sec(headers) -> float | None:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 초 단위로 변환합니다."""
+    value = headers.get('Retry-After') if headers is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        try:
+            return max(0.0, (email.utils.parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            return None
+
+
+def _create_ssl_context() -> ssl.SSLContext:
+    """API Gateway 호출에 사용할 SSL 컨텍스트를 생성합니다. (기존과 동일하게 인증서 검증 생략)"""
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+class _HttpsConnectionPool:
+    """
+    하나의 호스트에 대한 HTTPS keep-alive 연결 풀입니다.
+    SSL 컨텍스트 하나를 모든 연결이 공유하고, 동시에 사용 가능한 연결 수를 max_size로 제한하며,
+    idle_timeout_sec 이상 사용되지 않은 연결은 폐기합니다.
+    재사용한 연결이 서버 측에서 이미 끊어져 있었다면(stale socket) 새 연결로 한 번 재시도합니다. (POST는 요청을 보내기 전에 끊어진 경우만)
+    """
+    # 재사용한 연결에서 이 예외가 발생하면 서버가 유휴 연결을 닫은 것으로 보고 새 연결로 재시도합니다.
+    _STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, http.client.BadStatusLine, ConnectionResetError, BrokenPipeError)
+    # 응답을 받는 중에 끊어졌을 때도 다시 보내도 되는 메서드 (POST는 서버가 이미 처리했을 수 있어 다시 보내지 않음)
+    _IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+    def __init__(self, host: str, port: int | None, ssl_context: ssl.SSLContext, max_size: int = 4,
+                 idle_timeout_sec: float = 30.0, timeout: float = REQUEST_TIMEOUT_SEC):
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.max_size = max(1, max_size)
+        self.idle_timeout_sec = idle_timeout_sec
+        self.timeout = timeout
+        self._idle = collections.deque()  # (connection, 마지막 사용 시각) - 오른쪽이 가장 최근
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+
+    def _checkout(self) -> Tuple[http.client.HTTPSConnection, bool]:
+        """유휴 연결을 꺼내거나 새 연결을 만듭니다. (연결, 재사용 여부)를 반환합니다."""
+        now = time.monotonic()
+        with self._lock:
+            # 오래된 유휴 연결부터 만료 처리
+            while self._idle and now - self._idle[0][1] > self.idle_timeout_sec:
+                expired_conn, _ = self._idle.popleft()
+                expired_conn.close()
+            if self._idle:
+                conn, _ = self._idle.pop()
+                return conn, True
+        conn = http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout, context=self.ssl_context)
+        try:
+            conn.connect()
+            # 연결을 재사용하면 작은 요청이 연속되므로 Nagle 알고리즘으로 인한 지연을 끕니다.
+            conn.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            # 연결 거부/타임아웃/SSL 오류도 요청 중 네트워크 오류와 같이 URLError로 전달합니다.
+            conn.close()
+            raise urllib.error.URLError(e)
+        return conn, False
+
+    def _checkin(self, conn: http.client.HTTPSConnection, reusable: bool):
+        if not reusable:
+            conn.close()
+            return
+        with self._lock:
+            self._idle.append((conn, time.monotonic()))
+
+    def request(self, method: str, url: str, body: bytes | None, headers: dict):
+        """
+        요청을 보내고 (상태 코드, 사유, 응답 헤더, 응답 바이트)를 반환합니다.
+        네트워크 오류는 urllib 경로와 동일하게 urllib.error.URLError로 감싸서 발생시킵니다.
+        재사용한 연결이 끊어져 있었다면 요청을 보내는 도중에 실패한 경우나 멱등 메서드(GET/HEAD/PUT/DELETE)만 새 연결로 다시 보냅니다.
+        """
+        with self._slots:
+            for attempt in range(2):
+                conn, reused = self._checkout()
+                request_sent = False
+                try:
+                    conn.request(method, url, body=body, headers=headers)
+                    request_sent = True
+                    resp = conn.getresponse()
+                    data = resp.read()
+                except self._STALE_CONNECTION_ERRORS as e:
+                    conn.close()
+                    if reused and attempt == 0 and (not request_sent or method.upper() in self._IDEMPOTENT_METHODS):
+                        logger.debug(f"재사용한 연결이 끊어져 있어 새 연결로 재시도합니다: {e!r}")
+                        continue
+                    raise urllib.error.URLError(e)
+                except OSError as e:
+                    conn.close()
+                    raise urllib.error.URLError(e)
+                except Exception:
+                    conn.close()
+                    raise
+                self._checkin(conn, reusable=not resp.will_close)
+                return resp.status, resp.reason, resp.headers, data
+
+    def close(self):
+        """유휴 연결을 모두 닫습니다."""
+        with self._lock:
+            while self._idle:
+                conn, _ = self._idle.popleft()
+                conn.close()
+
+
+def create_connection_pool(api_gateway_url: str, max_size: int = 4, idle_timeout_sec: float = 30.0) -> _HttpsConnectionPool:
+    """
+    여러 CoupangApiClient가 함께 사용할 keep-alive 연결 풀을 만듭니다. (CoupangApiClient의 connection_pool 인자로 전달)
+    인증 정보는 요청 헤더에만 들어가므로, 판매자 계정이 달라도 같은 API Gateway 연결을 재사용할 수 있습니다.
+    """
+    parsed_url = urllib.parse.urlsplit(api_gateway_url)
+    return _HttpsConnectionPool(
+        parsed_url.hostname, parsed_url.port, _create_ssl_context(),
+        max_size=max_size, idle_timeout_sec=idle_timeout_sec
+    )
+
 
 class CoupangApiClient:
-    def __init__(self, access_key: str, secret_key: str, api_gateway_url: str):
+    def __init__(self, access_key: str, secret_key: str, api_gateway_url: str, keep_alive: bool = False,
+                 pool_max_size: int = 4, pool_idle_timeout_sec: float = 30.0,
+                 rate_limiter: AdaptiveRateLimiter | None = None, max_throttle_retries: int = 3,
+                 connection_pool: _HttpsConnectionPool | None = None, circuit_breaker: CircuitBreaker | None = None):
+        """
+        keep_alive=True이면 API Gateway와의 HTTPS 연결을 풀에 보관해 재사용합니다.
+        False이면 기존처럼 요청마다 urllib으로 새 연결을 맺습니다. (SSL 컨텍스트는 두 경우 모두 재사용)
+        connection_pool을 지정하면 새 풀을 만들지 않고 주어진 풀(create_connection_pool)을 다른 클라이언트와 함께 사용합니다.
+        rate_limiter를 지정하면 모든 요청이 해당 속도 제한기를 거치며, 429 응답은 max_throttle_retries번까지 재시도합니다.
+        circuit_breaker를 지정하면 게이트웨이 장애(네트워크 오류/시간 초과/5xx/느린 응답)가 이어질 때 요청을 보내지 않고
+        바로 CircuitOpenError를 발생시킵니다.
+        """
         self.access_key = access_key
         self.secret_key = secret_key
+        # 비밀 키를 넣은 HMAC 상태를 한 번만 만들어 두고 요청마다 복사해서 사용합니다.
+        self._hmac_template = hmac.new(secret_key.encode('utf-8'), digestmod=hashlib.sha256)
+        self._authorization_prefix = f"CEA algorithm=HmacSHA256, access-key={access_key}, signed-date="
         self.api_gateway_url = api_gateway_url
+        self.rate_limiter = rate_limiter
+        self.max_throttle_retries = max_throttle_retries
+        self.circuit_breaker = circuit_breaker
+        self.response_decoder = ResponseDecoder()
+        self._ssl_context = _create_ssl_context()
+        self._pool = connection_pool
+        self._url_prefix_path = urllib.parse.urlsplit(api_gateway_url).path.rstrip('/')
+        if keep_alive and self._pool is None:
+            self._pool = create_connection_pool(api_gateway_url, pool_max_size, pool_idle_timeout_sec)
+        # 이 클라이언트로 requestedId 상태를 조회하는 추적기 (판매자 ID별, main._get_status_tracker에서 생성)
+        self.status_trackers: dict = {}
+
+    def close(self):
+        """상태 추적기를 멈추고, keep-alive 모드에서 보관 중인 연결을 모두 닫습니다."""
+        for tracker in list(self.status_trackers.values()):
+            tracker.stop()
+        self.status_trackers.clear()
+        if self._pool is not None:
+            self._pool.close()
+
+    def _build_headers(self, method: str, path_without_query: str, query_string_encoded: str) -> dict:
+        return {
+            "Authorization": self._generate_signature(method, path_without_query, query_string_encoded),
+            "Content-Type": CONTENT_TYPE_JSON
+        }
+
+    def _open_with_rate_limit(self, method: str, path_without_query: str, query_string_encoded: str,
+                              path_with_query: str, full_url: str, req_body: bytes | None, headers: dict):
+        """
+        회로 차단기와 요청 속도 제한기를 거쳐 요청을 실행합니다.
+        회로가 열려 있으면 속도 제한 대기 없이 바로 CircuitOpenError를 발생시킵니다.
+        429 응답을 받으면 제한기에 반영한 뒤(Retry-After 준수) 최대 max_throttle_retries번까지 다시 시도합니다.
+        """
+        if self.rate_limiter is None and self.circuit_breaker is None:
+            return self._open(method, path_with_query, full_url, req_body, headers)
+
+        endpoint_key = endpoint_template(method, path_without_query)
+        for attempt in range(self.max_throttle_retries + 1):
+            probe_keys = ()
+            if self.circuit_breaker is not None:
+                probe_keys = self.circuit_breaker.before_request(endpoint_key)
+            if self.rate_limiter is not None:
+                try:
+                    self.rate_limiter.acquire(endpoint_key)
+                except BaseException:
+                    # 요청을 보내지 못했으므로 맡은 시험 요청을 반납합니다.
+                    if probe_keys:
+                        self.circuit_breaker.release(probe_keys)
+                    raise
+            started = time.monotonic()
+            try:
+                result = self._open(method, path_with_query, full_url, req_body, headers)
+            except urllib.error.HTTPError as e:
+                # 5xx만 게이트웨이 장애로 봅니다. (4xx와 429는 게이트웨이가 정상적으로 응답한 것)
+                self._record_circuit(endpoint_key, e.code < 500, started, probe_keys)
+                if self.rate_limiter is None:
+                    raise
+                self.rate_limiter.on_response(endpoint_key, e.code, _retry_after_sec(e.headers))
+                if e.code == 429 and attempt < self.max_throttle_retries:
+                    logger.warning(f"[요청 제한] {method} {path_without_query} 요청이 제한(429)되었습니다. 재시도 {attempt + 1}/{self.max_throttle_retries}...")
+                    # 대기 후 signed-date가 오래되지 않도록 서명을 다시 생성합니다.
+                    headers = self._build_headers(method, path_without_query, query_string_encoded)
+                    continue
+                raise
+            except Exception:
+                # 네트워크 오류와 시간 초과
+                self._record_circuit(endpoint_key, False, started, probe_keys)
+                raise
+            self._record_circuit(endpoint_key, True, started, probe_keys)
+            if self.rate_limiter is not None:
+                self.rate_limiter.on_response(endpoint_key, result[0])
+            return result
+
+    def _record_circuit(self, endpoint_key: str, succeeded: bool, started: float, probe_keys: Tuple[str, ...] = ()):
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(endpoint_key, succeeded, time.monotonic() - started, probe_keys)
+
+    def _open(self, method: str, path_with_query: str, full_url: str, req_body: bytes | None, headers: dict):
+        """
+        HTTP 요청을 실행하고 (상태 코드, 응답 헤더, 응답 바이트)를 반환합니다.
+        HTTP 오류 상태는 두 모드 모두 urllib.error.HTTPError로 발생시킵니다.
+        """
+        if self._pool is not None:
+            status, reason, resp_headers, raw_response_bytes = self._pool.request(
+                method, f"{self._url_prefix_path}{path_with_query}", req_body, headers
+            )
+            if status >= 400:
+                raise urllib.error.HTTPError(full_url, status, reason, resp_headers, io.BytesIO(raw_response_bytes))
+            return status, resp_headers, raw_response_bytes
+
+        req = urllib.request.Request(full_url, data=req_body, headers=headers, method=method) if req_body else urllib.request.Request(full_url, headers=headers, method=method)
+        with urllib.request.urlopen(req, context=self._ssl_context, timeout=REQUEST_TIMEOUT_SEC) as resp:
+            return resp.getcode(), resp.headers, resp.read()
 
     def _generate_signature(self, method: str, path_without_query: str, query_string_encoded: str = "") -> str:
         """
         쿠팡 API 호출을 위한 HMAC SHA256 서명을 생성합니다.
         signed-date를 명시적으로 UTC 기준으로 생성합니다 (공식 가이드의 YYMMDDTHHMMSSZ 패턴).
         """
-        current_utc_time = datetime.now(timezone.utc)
-        gmt_time_str = current_utc_time.strftime('%y%m%d') + 'T' + current_utc_time.strftime('%H%M%S') + 'Z'
+        gmt_time_str = signed_date()
         
         message_to_sign = f"{gmt_time_str}{method}{path_without_query}{query_string_encoded}"
-        logger.debug(f"Signature Message String: {message_to_sign}")
+        logger.debug("Signature Message String: %s", message_to_sign)
         
-        message_bytes = message_to_sign.encode('utf-8')
-        signature = hmac.new(self.secret_key.encode('utf-8'), message_bytes, hashlib.sha256).hexdigest()
+        mac = self._hmac_template.copy()
+        mac.update(message_to_sign.encode('utf-8'))
         
-        return f"CEA algorithm=HmacSHA256, access-key={self.access_key}, signed-date={gmt_time_str}, signature={signature}"
+        return f"{self._authorization_prefix}{gmt_time_str}, signature={mac.hexdigest()}"
 
-    def send_request(self, method: str, path_without_query: str, query_params: dict = None, body: dict = None):
+    def send_request(self, method: str, path_without_query: str, query_params: dict = None, body: dict | bytes | bytearray | memoryview = None):
         if query_params is None:
             query_params = {}
         query_string_encoded = urllib.parse.urlencode(query_params)
-        full_url = f"{self.api_gateway_url}{path_without_query}"
+        path_with_query = path_without_query
         if query_string_encoded:
-            full_url += f"?{query_string_encoded}"
+            path_with_query += f"?{query_string_encoded}"
+        full_url = f"{self.api_gateway_url}{path_with_query}"
         
-        authorization_header = self._generate_signature(method, path_without_query, query_string_encoded)
-        headers = {
-            "Authorization": authorization_header,
-            "Content-Type": "application/json;charset=UTF-8"
-        }
-        req_body = json.dumps(body).encode('utf-8') if body else None
+        headers = self._build_headers(method, path_without_query, query_string_encoded)
+        # 바디는 여기서 한 번만 JSON 바이트로 만들고, 429 재시도와 디버그 로그에서도 같은 바이트를 사용합니다.
+        # bytes 바디는 이미 JSON으로 인코딩된 것으로 보고 복사하지 않고 그대로 전송합니다. (예: VendorItemIndex.apply_request_body)
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            req_body = body if len(body) else None
+        else:
+            req_body = json_codec.dumps(body) if body else None
         
-        # 변경: API 요청 상세 로그를 DEBUG 레벨로 변경
-        logger.debug(f"\n--- API 요청 상세 ({method} {path_without_query}) ---")
-        logger.debug(f"요청 URL: {full_url}")
-        logger.debug(f"요청 메소드: {method}")
-        logger.debug(f"요청 헤더 Authorization: {headers['Authorization']}") # 민감 정보이므로 DEBUG로
-        if req_body:
-            # 바디가 있을 경우에만 로깅 (POST/PUT 등에 해당)
-            logger.debug(f"요청 바디: {json.dumps(body, indent=2, ensure_ascii=False)}") # 상세 정보이므로 DEBUG로
-        logger.debug("---------------------------------------------")
+        # API 요청 상세 로그 (DEBUG). 바디는 전송할 JSON 바이트 앞부분을 로그 스레드에서 문자열로 바꿔 기록합니다. (LazyText)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "\n--- API 요청 상세 (%s %s) ---\n요청 URL: %s\n요청 메소드: %s\n요청 헤더 Authorization: %s", # 민감 정보이므로 DEBUG로
+                method, path_without_query, full_url, method, headers['Authorization']
+            )
+            if req_body:
+                # 바디가 있을 경우에만 로깅 (POST/PUT 등에 해당)
+                logger.debug("요청 바디 (%d바이트): %s", len(req_body), LazyText(req_body)) # 상세 정보이므로 DEBUG로
         
+        # 호출 수와 소요 시간을 엔드포인트 템플릿(ID를 자리표시자로 바꾼 경로)별로 기록합니다.
+        endpoint = endpoint_template(method, path_without_query)
+        endpoint_key = endpoint.split(" ", 1)[1]
+        metric_status = "error"
+        raw_response_bytes = b""
+        started = time.perf_counter()
         try:
-            req = urllib.request.Request(full_url, data=req_body, headers=headers, method=method) if req_body else urllib.request.Request(full_url, headers=headers, method=method)
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
+            status_code, resp_headers, raw_response_bytes = self._open_with_rate_limit(
+                method, path_without_query, query_string_encoded, path_with_query, full_url, req_body, headers
+            )
+            metric_status = str(status_code)
+            charset = resp_headers.get_content_charset()
             
-            with urllib.request.urlopen(req, context=ctx, timeout=60) as resp:
-                raw_response_bytes = resp.read()
-                charset = resp.headers.get_content_charset() or 'utf-8'
-                
-                response_body = ""
-                try:
-                    response_body = raw_response_bytes.decode(charset)
-                except UnicodeDecodeError:
-                    logger.warning(f"WARNING: '{charset}' 디코딩 실패, 'cp949'로 재시도.")
-                    try:
-                        response_body = raw_response_bytes.decode('cp949')
-                    except UnicodeDecodeError:
-                        logger.warning(f"WARNING: 'cp949' 디코딩 실패, 'euc-kr'로 재시도.")
-                        try:
-                            response_body = raw_response_bytes.decode('euc-kr')
-                        except UnicodeDecodeError:
-                            response_body = raw_response_bytes.decode('latin-1', errors='ignore')
-                            logger.warning(f"WARNING: 모든 디코딩 시도 실패, 'latin-1'으로 디코딩 (데이터 손실 가능).")
-                except Exception as decode_e:
-                    logger.error(f"ERROR: 응답 본문 디코딩 중 예상치 못한 오류: {decode_e}")
-                    response_body = raw_response_bytes.decode('latin-1', errors='ignore')
-
-
-                res = json.loads(response_body)
-                
-                # 변경: API 응답 상세 로그를 DEBUG 레벨로 변경
-                logger.debug(f"\n--- API 응답 ({method} {path_without_query}) ---")
-                logger.debug(f"HTTP 상태 코드: {resp.getcode()}")
-                logger.debug(f"응답 본문: {json.dumps(res, indent=2, ensure_ascii=False)}") # 상세 정보이므로 DEBUG로
-                logger.debug("--------------------")
-                return res
+            # UTF-8 응답은 문자열로 바꾸지 않고 바이트에서 바로 파싱합니다. (그 외 charset은 엔드포인트별로 성공한 charset을 기억)
+            res = self.response_decoder.parse_json(raw_response_bytes, charset, endpoint)
+            
+            # API 응답 상세 로그 (DEBUG, 받은 바이트 앞부분을 로그 스레드에서 문자열로 변환)
+            logger.debug("\n--- API 응답 (%s %s) ---\nHTTP 상태 코드: %s\n응답 본문: %s", method, path_without_query, status_code,
+                         LazyText(raw_response_bytes, encoding=self.response_decoder.charset_for(endpoint) or 'utf-8'))
+            return res
+        except CircuitOpenError as e:
+            # 게이트웨이 장애로 요청을 보내지 않았습니다. (호출한 쪽에서 사이클을 다시 예약)
+            metric_status = "circuit_open"
+            logger.warning(f"[회로 차단] {method} {path_without_query} 요청을 보내지 않았습니다: {e}")
+            raise
         except urllib.error.HTTPError as e:
-            error_response_body = e.read()
-            charset = e.headers.get_content_charset() or 'utf-8'
-            try:
-                error_response_text = error_response_body.decode(charset)
-            except UnicodeDecodeError:
-                try:
-                    error_response_text = error_response_body.decode('cp949')
-                except UnicodeDecodeError:
-                    error_response_text = error_response_body.decode('euc-kr')
-                except Exception:
-                    error_response_text = error_response_body.decode('latin-1', errors='ignore')
-                    logger.error(f"ERROR: 오류 응답 본문 디코딩 중 예상치 못한 오류 발생, latin-1으로 처리.")
-            except Exception as decode_e:
-                error_response_text = error_response_body.decode('latin-1', errors='ignore')
-                logger.error(f"ERROR: 오류 응답 본문 디코딩 중 예상치 못한 오류: {decode_e}")
+            metric_status = str(e.code)
+            error_response_text = self.response_decoder.decode_text(e.read(), e.headers.get_content_charset(), endpoint)
 
             logger.error(f"\n[실패] HTTP 오류: {e.code} - {e.reason}")
             logger.error(f"오류 응답 본문: {error_response_text}")
@@ -121,21 +378,21 @@ class CoupangApiClient:
             raise
         except json.JSONDecodeError as e:
             logger.error(f"\n[실패] JSON 디코딩 오류: {e}")
-            try:
-                logger.error(f"응답을 파싱할 수 없습니다. 수신된 본문: {response_body[:500]}...")
-            except NameError:
-                logger.error("응답 본문을 가져올 수 없어 파싱할 수 없습니다.")
+            logger.error("응답을 파싱할 수 없습니다. 수신된 본문: %s", LazyText(raw_response_bytes, limit=500, encoding=self.response_decoder.charset_for(endpoint) or 'utf-8'))
             raise
         except Exception as e:
             logger.error(f"\n[실패] 예상치 못한 오류가 발생했습니다: {e}")
             raise
+        finally:
+            API_REQUESTS_TOTAL.inc(method=method, endpoint=endpoint_key, status=metric_status)
+            API_REQUEST_DURATION_SECONDS.observe(time.perf_counter() - started, method=method, endpoint=endpoint_key)
 
     # 래핑된 HTTP 메서드 수정 (인자 전달 방식 개선)
     def get(self, path: str, query_params: dict = None) -> dict:
         """GET 요청을 보냅니다."""
         return self.send_request("GET", path, query_params=query_params, body=None)
 
-    def post(self, path: str, body: dict = None) -> dict:
+    def post(self, path: str, body: dict | bytes = None) -> dict:
         """POST 요청을 보냅니다."""
         # POST 요청에서는 쿼리 파라미터가 일반적으로 없으므로 빈 딕셔너리 전달
         return self.send_request("POST", path, query_params={}, body=body)
@@ -0,0 +1,77 @@
+# coupang_lib/async_api_client.py
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from coupang_lib.api_client import CoupangApiClient
+
+
+class AsyncCoupangApiClient:
+    """
+    CoupangApiClient와 같은 get/post/put/delete 메서드를 asyncio 코루틴으로 제공합니다.
+    실제 요청은 내부의 CoupangApiClient(서명, keep-alive 연결 풀, 로깅 포함)가 전용 스레드 풀에서 처리하므로,
+    여러 API 호출을 asyncio.gather 등으로 동시에 보낼 수 있습니다.
+    동시에 진행되는 요청 수는 max_concurrency로 제한됩니다.
+    """
+    def __init__(self, access_key: str, secret_key: str, api_gateway_url: str, max_concurrency: int = 8,
+                 keep_alive: bool = True, pool_idle_timeout_sec: float = 30.0):
+        # 동시 요청 수만큼 연결을 보관할 수 있도록 풀 크기를 맞춥니다.
+        sync_client = CoupangApiClient(
+            access_key, secret_key, api_gateway_url,
+            keep_alive=keep_alive, pool_max_size=max_concurrency, pool_idle_timeout_sec=pool_idle_timeout_sec
+        )
+        self._init_from_client(sync_client, max_concurrency)
+        self._owns_sync_client = True
+
+    @classmethod
+    def wrap(cls, sync_client: CoupangApiClient, max_concurrency: int = 8) -> "AsyncCoupangApiClient":
+        """기존 CoupangApiClient를 감싸 연결 풀과 인증 정보를 공유하는 비동기 클라이언트를 만듭니다."""
+        instance = cls.__new__(cls)
+        instance._init_from_client(sync_client, max_concurrency)
+        instance._owns_sync_client = False
+        return instance
+
+    def _init_from_client(self, sync_client: CoupangApiClient, max_concurrency: int):
+        self.sync_client = sync_client
+        self.max_concurrency = max(1, max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="coupang-api")
+
+    @property
+    def access_key(self) -> str:
+        return self.sync_client.access_key
+
+    @property
+    def api_gateway_url(self) -> str:
+        return self.sync_client.api_gateway_url
+
+    def _generate_signature(self, method: str, path_without_query: str, query_string_encoded: str = "") -> str:
+        """CoupangApiClient._generate_signature와 동일한 HMAC 서명을 생성합니다."""
+        return self.sync_client._generate_signature(method, path_without_query, query_string_encoded)
+
+    async def send_request(self, method: str, path_without_query: str, query_params: dict = None, body: dict | bytes = None):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            lambda: self.sync_client.send_request(method, path_without_query, query_params=query_params, body=body)
+        )
+
+    async def get(self, path: str, query_params: dict = None) -> dict:
+        """GET 요청을 보냅니다."""
+        return await self.send_request("GET", path, query_params=query_params, body=None)
+
+    async def post(self, path: str, body: dict | bytes = None) -> dict:
+        """POST 요청을 보냅니다."""
+        return await self.send_request("POST", path, query_params={}, body=body)
+
+    async def put(self, path: str, query_params: dict = None, body: dict = None) -> dict:
+        """PUT 요청을 보냅니다."""
+        return await self.send_request("PUT", path, query_params=query_params, body=body)
+
+    async def delete(self, path: str, query_params: dict = None) -> dict:
+        """DELETE 요청을 보냅니다."""
+        return await self.send_request("DELETE", path, query_params=query_params, body=None)
+
+    def close(self):
+        """작업 스레드를 정리합니다. (wrap으로 감싼 동기 클라이언트의 연결 풀은 닫지 않습니다.)"""
+        self._executor.shutdown(wait=False)
+        if self._owns_sync_client:
+            self.sync_client.close()
@@ -0,0 +1,178 @@
+# coupang_lib/circuit_breaker.py
+import collections
+import threading
+import time
+from typing import Dict, Tuple
+
+from coupang_lib.logger import logger
+from coupang_lib.metrics import CIRCUIT_TRANSITIONS_TOTAL
+
+# 회로 상태
+STATE_CLOSED = "CLOSED"  # 정상: 모든 요청 허용
+STATE_OPEN = "OPEN"  # 차단: 요청을 보내지 않고 바로 CircuitOpenError 발생
+STATE_HALF_OPEN = "HALF_OPEN"  # 시험: 시험 요청 하나만 허용하고 결과에 따라 닫거나 다시 엶
+
+# 게이트웨이 전체 요청을 모아 판단하는 회로의 키
+GATEWAY_KEY = "*"
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 요청을 보내지 않았을 때 발생합니다. retry_after_sec 후에 시험 요청이 허용됩니다."""
+    def __init__(self, endpoint_key: str, retry_after_sec: float):
+        super().__init__(f"API Gateway 회로 차단 중 ({endpoint_key}), {retry_after_sec:.0f}초 후 재시도 가능")
+        self.endpoint_key = endpoint_key
+        self.retry_after_sec = retry_after_sec
+
+
+class _Circuit:
+    def __init__(self, window_size: int, open_sec: float):
+        self.state = STATE_CLOSED
+        self.outcomes = collections.deque(maxlen=window_size)  # 최근 요청의 실패 여부 (True = 실패)
+        self.consecutive_failures = 0
+        self.open_sec = open_sec
+        self.opened_until = 0.0
+        self.probe_in_flight = False
+
+    def failure_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class CircuitBreaker:
+    """
+    API Gateway 요청의 최근 실패율과 응답 시간을 엔드포인트별, 그리고 게이트웨이 전체로 추적하는 회로 차단기입니다.
+
+    - 최근 window_size개 요청 중 min_calls개 이상이 쌓였고 실패율이 failure_rate_threshold 이상이거나,
+      연속 consecutive_failure_threshold번 실패하면 회로를 엽니다. (게이트웨이가 확실히 내려갔으면 빠르게 차단)
+    - 실패는 네트워크 오류/시간 초과, 5xx 응답, slow_call_sec 이상 걸린 응답입니다. (4xx와 429는 게이트웨이가 살아 있는 것으로 봄)
+    - 열린 회로는 open_sec 동안 요청을 바로 거부(CircuitOpenError)하고, 그 뒤 시험 요청 하나를 보냅니다(HALF_OPEN).
+      시험 요청이 성공하면 닫고, 실패하면 대기 시간을 두 배로 늘려(max_open_sec까지) 다시 엽니다.
+      회로를 닫거나 다시 여는 것은 시험 요청의 결과뿐이며, 그 전에 보낸 요청의 결과는 실패율 기록에만 반영합니다.
+    - 게이트웨이 전체 회로가 열리면 모든 엔드포인트 요청을 거부합니다.
+    """
+    def __init__(self, window_size: int = 20, min_calls: int = 5, failure_rate_threshold: float = 0.5,
+                 consecutive_failure_threshold: int = 3, slow_call_sec: float = 20.0,
+                 open_sec: float = 30.0, max_open_sec: float = 300.0):
+        self.window_size = max(1, window_size)
+        self.min_calls = max(1, min_calls)
+        self.failure_rate_threshold = failure_rate_threshold
+        self.consecutive_failure_threshold = max(1, consecutive_failure_threshold)
+        self.slow_call_sec = slow_call_sec
+        self.open_sec = open_sec
+        self.max_open_sec = max(open_sec, max_open_sec)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _circuit_for(self, key: str) -> _Circuit:
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = _Circuit(self.window_size, self.open_sec)
+            self._circuits[key] = circuit
+        return circuit
+
+    def before_request(self, endpoint_key: str) -> Tuple[str, ...]:
+        """
+        요청을 보내도 되는지 확인합니다. 회로가 열려 있으면 CircuitOpenError를 발생시킵니다.
+        이 요청이 시험 요청을 맡은 회로의 키 목록을 반환하며, 결과와 함께 record()에 넘겨야 합니다.
+        (요청을 보내지 못했으면 release()로 시험 요청을 반납)
+        """
+        keys = (GATEWAY_KEY, endpoint_key)
+        with self._lock:
+            now = time.monotonic()
+            circuits = [self._circuit_for(key) for key in keys]
+            for key, circuit in zip(keys, circuits):
+                if circuit.state == STATE_OPEN and now >= circuit.opened_until:
+                    self._transition(key, circuit, STATE_HALF_OPEN)
+            # 모든 회로가 요청을 허용할 때만 시험 요청을 맡습니다. (한 회로라도 거부하면 아무 회로의 시험 요청도 맡지 않음)
+            for key, circuit in zip(keys, circuits):
+                if circuit.state == STATE_OPEN:
+                    raise CircuitOpenError(key, max(0.0, circuit.opened_until - now))
+                if circuit.state == STATE_HALF_OPEN and circuit.probe_in_flight:
+                    raise CircuitOpenError(key, 0.0)
+            probe_keys = []
+            for key, circuit in zip(keys, circuits):
+                if circuit.state == STATE_HALF_OPEN:
+                    circuit.probe_in_flight = True
+                    probe_keys.append(key)
+                    logger.info(f"[회로 차단] {key} 시험 요청을 보냅니다.")
+            return tuple(probe_keys)
+
+    def release(self, probe_keys: Tuple[str, ...]):
+        """before_request로 맡은 시험 요청을 보내지 못했을 때 반납합니다. (다음 요청이 시험 요청을 맡을 수 있음)"""
+        with self._lock:
+            for key in probe_keys:
+                self._circuit_for(key).probe_in_flight = False
+
+    def record(self, endpoint_key: str, succeeded: bool, latency_sec: float, probe_keys: Tuple[str, ...] = ()):
+        """
+        요청 결과를 반영합니다. 성공 응답이라도 slow_call_sec 이상 걸렸으면 실패로 봅니다.
+        probe_keys(before_request의 반환값)에 포함된 회로만 이 결과로 닫거나 다시 엽니다.
+        """
+        failed = not succeeded or latency_sec >= self.slow_call_sec
+        with self._lock:
+            for key in (GATEWAY_KEY, endpoint_key):
+                circuit = self._circuit_for(key)
+                circuit.outcomes.append(failed)
+                circuit.consecutive_failures = circuit.consecutive_failures + 1 if failed else 0
+
+                if circuit.state == STATE_HALF_OPEN and key in probe_keys:
+                    circuit.probe_in_flight = False
+                    if failed:
+                        circuit.open_sec = min(self.max_open_sec, circuit.open_sec * 2)
+                        self._open(key, circuit)
+                    else:
+                        circuit.open_sec = self.open_sec
+                        circuit.outcomes.clear()
+                        self._transition(key, circuit, STATE_CLOSED)
+                elif circuit.state == STATE_CLOSED and failed and self._should_open(circuit):
+                    self._open(key, circuit)
+
+    def _should_open(self, circuit: _Circuit) -> bool:
+        if circuit.consecutive_failures >= self.consecutive_failure_threshold:
+            return True
+        return len(circuit.outcomes) >= self.min_calls and circuit.failure_rate() >= self.failure_rate_threshold
+
+    def _open(self, key: str, circuit: _Circuit):
+        circuit.opened_until = time.monotonic() + circuit.open_sec
+        logger.warning(
+            f"[회로 차단] {key} 회로를 엽니다. 최근 실패율 {circuit.failure_rate():.0%}, 연속 실패 {circuit.consecutive_failures}회. "
+            f"{circuit.open_sec:.0f}초 동안 요청을 바로 실패 처리합니다."
+        )
+        self._transition(key, circuit, STATE_OPEN)
+
+    def _transition(self, key: str, circuit: _Circuit, state: str):
+        if circuit.state == state:
+            return
+        circuit.state = state
+        CIRCUIT_TRANSITIONS_TOTAL.inc(endpoint=key, state=state)
+        if state == STATE_CLOSED:
+            logger.info(f"[회로 차단] {key} 시험 요청 성공. 회로를 닫습니다.")
+
+    def gateway_open(self) -> bool:
+        """게이트웨이 전체 회로가 열려 있어 요청이 바로 거부되는 상태인지 반환합니다. (시험 요청 대기 중 포함)"""
+        with self._lock:
+            circuit = self._circuit_for(GATEWAY_KEY)
+            if circuit.state == STATE_OPEN:
+                return time.monotonic() < circuit.opened_until
+            return circuit.state == STATE_HALF_OPEN and circuit.probe_in_flight
+
+    def seconds_until_probe(self) -> float:
+        """게이트웨이 전체 회로에 시험 요청을 보낼 수 있을 때까지 남은 시간(초)입니다. 닫혀 있으면 0입니다."""
+        with self._lock:
+            circuit = self._circuit_for(GATEWAY_KEY)
+            if circuit.state != STATE_OPEN:
+                return 0.0
+            return max(0.0, circuit.opened_until - time.monotonic())
+
+    def snapshot(self) -> Dict[str, Dict[str, float | int | str]]:
+        """엔드포인트별 회로 상태, 최근 실패율, 연속 실패 수, 남은 차단 시간을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                key: {
+                    "state": circuit.state,
+                    "failure_rate": round(circuit.failure_rate(), 3),
+                    "consecutive_failures": circuit.consecutive_failures,
+                    "open_for_sec": round(max(0.0, circuit.opened_until - now), 3) if circuit.state == STATE_OPEN else 0.0,
+                }
+                for key, circuit in self._circuits.items()
+            }
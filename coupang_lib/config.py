@@ -14,19 +14,108 @@ CONTRACT_ID = os.getenv("CONTRACT_ID") # .env 파일에 유효한 값이 채워
 COUPANG_ID = os.getenv("COUPANG_ID")
 COUPANG_PW = os.getenv("COUPANG_PW")
 
-# API Gateway 기본 URL
-API_GATEWAY_URL = "https://api-gateway.coupang.com"
+# API Gateway 기본 URL (로컬 대역 서버 coupang_lib/mock_gateway.py로 실행할 때는 환경 변수로 변경)
+API_GATEWAY_URL = os.getenv("API_GATEWAY_URL", "https://api-gateway.coupang.com").rstrip("/")
 
 # Selenium 옵션 (GUI 없이 실행)
 SELENIUM_HEADLESS = True
 SELENIUM_WINDOW_SIZE = "1920,1080"
+# 로그인 쿠키를 다음 실행까지 유지하기 위한 Chrome 프로필 폴더, chromedriver 경로(비우면 자동 설치 후 경로 재사용), 화면 요소 대기 최대 시간(초)
+SELENIUM_PROFILE_DIR = os.getenv("SELENIUM_PROFILE_DIR", os.path.join("state", "wing_profile"))
+SELENIUM_DRIVER_PATH = os.getenv("SELENIUM_DRIVER_PATH", "")
+SELENIUM_WAIT_SEC = float(os.getenv("SELENIUM_WAIT_SEC", "20"))
 
 # DISCORD Webhook 설정
 WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
+# 알림은 백그라운드 스레드가 전송합니다. 대기열 최대 알림 수(초과분은 버림), 짧은 시간에 몰린 알림을 한 메시지로 묶기 위해 기다리는 시간(초),
+# 웹훅 요청 제한 시간(초)과 429(요청 과다) 응답 시 재시도 횟수
+DISCORD_QUEUE_MAX_SIZE = int(os.getenv("DISCORD_QUEUE_MAX_SIZE", "100"))
+DISCORD_COALESCE_SEC = float(os.getenv("DISCORD_COALESCE_SEC", "2"))
+DISCORD_REQUEST_TIMEOUT_SEC = float(os.getenv("DISCORD_REQUEST_TIMEOUT_SEC", "10"))
+DISCORD_MAX_RATE_LIMIT_RETRIES = int(os.getenv("DISCORD_MAX_RATE_LIMIT_RETRIES", "3"))
 
 # --- 추가된 쿠폰 및 스케줄 설정 ---
 # getenv로 값을 가져올 때, 정수형으로 변환하고 기본값을 설정하여 안전성을 높입니다.
 # .env 파일에 값이 없거나 잘못된 형식일 경우를 대비합니다.
 COUPON_DISCOUNT_RATE = int(os.getenv("COUPON_DISCOUNT_RATE", "50"))
 COUPON_MAX_DISCOUNT_PRICE = int(os.getenv("COUPON_MAX_DISCOUNT_PRICE", "5000"))
-COUPON_CYCLE_MINUTES = int(os.getenv("COUPON_CYCLE_MINUTES", "60"))
\ No newline at end of file
+COUPON_CYCLE_MINUTES = int(os.getenv("COUPON_CYCLE_MINUTES", "60"))
+
+# 쿠폰 교체 방식
+# - "expire_first": 기존 쿠폰을 먼저 비활성화한 뒤 새 쿠폰을 생성/적용합니다. (기본값)
+# - "overlap": 새 쿠폰을 먼저 생성/적용하고 완료를 확인한 뒤 기존 쿠폰을 비활성화합니다. (할인 공백 없음)
+COUPON_ROTATION_MODE = os.getenv("COUPON_ROTATION_MODE", "expire_first").strip().lower()
+# overlap 모드에서 쿠폰 유효 기간(endAt)을 갱신 주기보다 더 길게 잡는 시간(분). 다음 사이클의 생성/적용 시간보다 길어야 합니다.
+COUPON_OVERLAP_MINUTES = int(os.getenv("COUPON_OVERLAP_MINUTES", "30"))
+
+# --- 사이클 스케줄 설정 ---
+# true이면 자정 기준으로 갱신 주기의 배수가 되는 시각(예: 60분 주기 → 매시 정각)에 사이클을 실행합니다.
+# 기본값은 false(기존과 같이 프로그램 시작 시각부터 갱신 주기마다 실행)입니다.
+SCHEDULE_ALIGN_TO_WALL_CLOCK = os.getenv("SCHEDULE_ALIGN_TO_WALL_CLOCK", "false").lower() == "true"
+# 이전 사이클이 끝나지 않았을 때 대기시켜 둘 수 있는 최대 회차 수 (실행 중인 회차 포함, 초과하면 해당 회차는 건너뜀)
+# 같은 테넌트의 사이클은 항상 하나씩 차례로 실행되며, 기본값 1이면 이전 사이클이 실행 중일 때 온 회차는 건너뜁니다.
+SCHEDULE_MAX_CONCURRENT_CYCLES = int(os.getenv("SCHEDULE_MAX_CONCURRENT_CYCLES", "1"))
+
+# --- API 연결 설정 ---
+# API_KEEP_ALIVE가 true이면 API Gateway와의 HTTPS 연결을 재사용합니다. (매 요청마다 TCP/TLS 핸드셰이크 생략)
+# 기본값은 false(기존과 같이 요청마다 새 연결)입니다.
+API_KEEP_ALIVE = os.getenv("API_KEEP_ALIVE", "false").lower() == "true"
+API_POOL_MAX_SIZE = int(os.getenv("API_POOL_MAX_SIZE", "8"))
+API_POOL_IDLE_TIMEOUT_SEC = int(os.getenv("API_POOL_IDLE_TIMEOUT_SEC", "30"))
+# API 요청 속도 제한 (초당 요청 수). 429/5xx 응답을 받으면 자동으로 속도를 낮추고 점차 다시 올립니다.
+API_RATE_LIMIT_PER_SEC = float(os.getenv("API_RATE_LIMIT_PER_SEC", "10"))  # 전체 요청 합계
+API_STATUS_RATE_LIMIT_PER_SEC = float(os.getenv("API_STATUS_RATE_LIMIT_PER_SEC", "8"))  # 요청 상태(requestedId) 조회
+API_COUPON_CREATE_RATE_LIMIT_PER_SEC = float(os.getenv("API_COUPON_CREATE_RATE_LIMIT_PER_SEC", "2"))  # 쿠폰 생성
+API_THROTTLE_MAX_RETRIES = int(os.getenv("API_THROTTLE_MAX_RETRIES", "3"))  # 429 응답 시 재시도 횟수
+# API Gateway 회로 차단기. 최근 요청의 실패율(네트워크 오류/시간 초과/5xx/느린 응답)이 높으면 요청을 보내지 않고 바로 실패 처리하며,
+# 사이클은 남은 단계를 포기하고 시험 요청이 가능해지는 시각에 다시 예약됩니다.
+# 기본값은 false(기존과 같이 장애 중에도 요청을 보내고 각 단계의 재시도 규칙을 따름)입니다.
+API_CIRCUIT_BREAKER_ENABLED = os.getenv("API_CIRCUIT_BREAKER_ENABLED", "false").lower() == "true"
+API_CIRCUIT_WINDOW_SIZE = int(os.getenv("API_CIRCUIT_WINDOW_SIZE", "20"))  # 실패율을 계산할 최근 요청 수
+API_CIRCUIT_MIN_CALLS = int(os.getenv("API_CIRCUIT_MIN_CALLS", "5"))  # 실패율로 판단하기 위한 최소 요청 수
+API_CIRCUIT_FAILURE_RATE = float(os.getenv("API_CIRCUIT_FAILURE_RATE", "0.5"))  # 회로를 여는 실패율 (0~1)
+API_CIRCUIT_CONSECUTIVE_FAILURES = int(os.getenv("API_CIRCUIT_CONSECUTIVE_FAILURES", "3"))  # 이 횟수만큼 연속 실패하면 바로 엶
+API_CIRCUIT_SLOW_CALL_SEC = float(os.getenv("API_CIRCUIT_SLOW_CALL_SEC", "20"))  # 이보다 오래 걸린 응답은 실패로 봄
+API_CIRCUIT_OPEN_SEC = float(os.getenv("API_CIRCUIT_OPEN_SEC", "30"))  # 시험 요청까지 대기 시간 (시험 실패 시 두 배씩 증가)
+API_CIRCUIT_MAX_OPEN_SEC = float(os.getenv("API_CIRCUIT_MAX_OPEN_SEC", "300"))
+# API 요청 바디 JSON 변환 방식: "auto"(orjson이 설치되어 있으면 사용), "orjson", "json"(표준 라이브러리)
+JSON_BACKEND = os.getenv("JSON_BACKEND", "auto").strip().lower()
+# 비동기 클라이언트(AsyncCoupangApiClient)에서 동시에 진행할 수 있는 최대 API 요청 수
+API_MAX_CONCURRENCY = int(os.getenv("API_MAX_CONCURRENCY", "8"))
+
+# --- 요청 상태(requestedId) 폴링 설정 ---
+# 상태 추적기가 대기 중인 요청들을 모아 조회하는 주기(초)와 한 번에 보낼 수 있는 최대 조회 요청 수
+STATUS_POLL_TICK_SEC = float(os.getenv("STATUS_POLL_TICK_SEC", "1"))
+STATUS_POLL_MAX_REQUESTS_PER_TICK = int(os.getenv("STATUS_POLL_MAX_REQUESTS_PER_TICK", "20"))
+
+# --- 쿠폰 품목 적용 설정 ---
+# 품목을 이 개수만큼 나누어 동시에 적용 요청합니다. (0 이하이면 한 번에 모두 전송)
+APPLY_BATCH_SIZE = int(os.getenv("APPLY_BATCH_SIZE", "1000"))
+# 판매자 품목 파일 경로와, 파일 변경을 확인하는 주기(초). 바뀐 품목은 프로세스 재시작 없이 다음 사이클부터 적용됩니다. (0이면 감시 안 함)
+VENDOR_ITEMS_PATH = os.getenv("VENDOR_ITEMS_PATH", "vendor_items.csv")
+VENDOR_ITEMS_RELOAD_INTERVAL_SEC = float(os.getenv("VENDOR_ITEMS_RELOAD_INTERVAL_SEC", "30"))
+# 여러 판매자 계정을 한 프로세스에서 운영할 때 계정별 설정을 적은 JSON 파일 경로 (coupang_lib/tenants.py 참고)
+# 지정하지 않으면 위 ACCESS_KEY/SECRET_KEY/VENDOR_ID/CONTRACT_ID로 계정 하나만 운영합니다.
+TENANTS_FILE = os.getenv("TENANTS_FILE", "")
+# 증분 적용: 쿠폰별 품목 적용 결과를 상태 저장소에 기록하고, 재시도 시 아직 적용되지 않았거나 실패한 품목만 보냅니다.
+# 기본값은 false(기존과 같이 매번 전체 품목 전송)입니다.
+APPLY_INCREMENTAL = os.getenv("APPLY_INCREMENTAL", "false").lower() == "true"
+
+# 쿠폰 생성 요청 직후, 그리고 생성 완료 확인 후 품목 적용 전에 기다리는 시간(초)
+POST_CREATE_WAIT_SEC = float(os.getenv("POST_CREATE_WAIT_SEC", "5"))
+PRE_APPLY_WAIT_SEC = float(os.getenv("PRE_APPLY_WAIT_SEC", "5"))
+
+# 활성 쿠폰 목록 조회 시 한 페이지에 요청할 쿠폰 수 (모든 페이지를 차례로 조회합니다)
+COUPON_LIST_PAGE_SIZE = int(os.getenv("COUPON_LIST_PAGE_SIZE", "100"))
+
+# 사이클 진행 상태를 기록하는 SQLite 파일 경로 (재시작 시 진행 중이던 사이클을 이어서 처리)
+STATE_DB_PATH = os.getenv("STATE_DB_PATH", os.path.join("state", "coupon_state.db"))
+
+# 원격 업데이트(git) 확인 주기(분). 백그라운드에서 확인하고, 사이클 알림에는 마지막 확인 결과를 붙입니다. (0이면 확인 안 함)
+GIT_UPDATE_CHECK_INTERVAL_MINUTES = float(os.getenv("GIT_UPDATE_CHECK_INTERVAL_MINUTES", "60"))
+
+# 파일 로그 형식: "text"(기본값) 또는 "json"(한 줄에 하나의 JSON, 사이클 ID/테넌트/requestedId 필드 포함 - 로그 수집 도구용)
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").strip().lower()
+
+# 실행 지표(Prometheus 형식) 조회 서버 포트. 0이면 서버를 띄우지 않습니다. (예: 9108 → http://127.0.0.1:9108/metrics)
+METRICS_PORT = int(os.getenv("METRICS_PORT", "0"))
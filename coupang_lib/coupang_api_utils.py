@@ -1,42 +1,140 @@
-from typing import List, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Iterator, List, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from coupang_lib.logger import logger
 from coupang_lib.api_client import CoupangApiClient
-from coupang_lib.config import VENDOR_ID, CONTRACT_ID, COUPON_DISCOUNT_RATE, COUPON_MAX_DISCOUNT_PRICE, COUPON_CYCLE_MINUTES
+from coupang_lib.circuit_breaker import CircuitOpenError
+from coupang_lib.item_loader import VendorItemIndex
+from coupang_lib.config import VENDOR_ID, CONTRACT_ID, COUPON_DISCOUNT_RATE, COUPON_MAX_DISCOUNT_PRICE, COUPON_CYCLE_MINUTES, COUPON_ROTATION_MODE, COUPON_OVERLAP_MINUTES, COUPON_LIST_PAGE_SIZE
+
+if TYPE_CHECKING:
+    # asyncio는 import 비용이 커서, 비동기 클라이언트는 실제로 사용하는 곳(main.py)에서만 불러옵니다.
+    from coupang_lib.async_api_client import AsyncCoupangApiClient
+
+
+# 쿠폰 파기 요청에 사용하는 쿼리 파라미터
+EXPIRE_QUERY_PARAMS = {"action": "expire"}
+# 회로 차단으로 요청 상태를 조회하지 못했을 때의 상태 값
+STATUS_GATEWAY_UNAVAILABLE = "GATEWAY_UNAVAILABLE"
+
+
+class CouponListPageError(Exception):
+    """활성 쿠폰 목록의 두 번째 이후 페이지 조회가 실패 코드를 반환했을 때 발생합니다. (일부 페이지만 조회된 목록을 성공으로 처리하지 않기 위함)"""
+
+
+def split_into_batches(items: List[Any], batch_size: int) -> List[List[Any]]:
+    """품목 목록을 batch_size개씩 나눕니다. batch_size가 0 이하이면 나누지 않습니다."""
+    if batch_size <= 0 or len(items) <= batch_size:
+        return [items] if items else []
+    return [items[start:start + batch_size] for start in range(0, len(items), batch_size)]
+
+
+def _new_coupon_path(vendor_id: str) -> str:
+    return f"/v2/providers/fms/apis/api/v2/vendors/{vendor_id}/coupon"
+
+
+def _coupon_path(vendor_id: str, coupon_id: int) -> str:
+    return f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/coupons/{coupon_id}"
+
+
+def _coupon_items_path(vendor_id: str, coupon_id: int) -> str:
+    return f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/coupons/{coupon_id}/items"
+
+
+def _requested_path(vendor_id: str, requested_id: str) -> str:
+    return f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/requested/{requested_id}"
 
 
 def get_active_coupons_by_keyword(api: CoupangApiClient, vendor_id: str, keyword: str) -> List[Dict[str, Any]] | None:
     """
-    현재 활성화된 쿠폰 목록을 조회하고, 특정 키워드로 필터링하여 반환합니다.
+    현재 활성화된 쿠폰 목록을 모든 페이지에 걸쳐 조회하고, 특정 키워드로 필터링하여 반환합니다.
     API 호출 중 오류 발생 시 None을 반환합니다.
     """
     logger.info(f"[API 조회] 활성 쿠폰 목록 (키워드: '{keyword}') 조회 시도 중...")
 
+    try:
+        filtered_coupons = list(iter_active_coupons_by_keyword(api, vendor_id, keyword))
+        logger.info(f"[성공] 활성 쿠폰 목록 조회 성공. '{keyword}' 포함 쿠폰 {len(filtered_coupons)}개 발견.")
+        return filtered_coupons
+    except Exception as e:
+        logger.error(f"[실패] 활성 쿠폰 목록 조회 중 오류 발생: {e}", exc_info=True)
+        return None
+
+
+def iter_active_coupons_by_keyword(
+    api: CoupangApiClient,
+    vendor_id: str,
+    keyword: str,
+    page_size: int = COUPON_LIST_PAGE_SIZE,
+    prefetch: bool = True,
+    stop_when: Callable[[Dict[str, Any]], bool] | None = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    활성 쿠폰 목록의 모든 페이지를 차례로 조회하며, 이름에 keyword가 포함된 쿠폰을 하나씩 반환하는 제너레이터입니다.
+    한 번에 한 페이지만 메모리에 유지합니다.
+
+    Args:
+        prefetch: True이면 현재 페이지를 처리하는 동안 다음 페이지를 미리 조회합니다.
+        stop_when: 반환한 쿠폰에 대해 True를 돌려주면 이후 페이지는 조회하지 않고 종료합니다.
+
+    첫 페이지 응답이 실패 코드이면 경고를 남기고 종료하며, 이후 페이지가 실패 코드이면 CouponListPageError를 발생시킵니다.
+    네트워크 오류 등의 예외는 호출자에게 전달됩니다.
+    """
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="coupon-list-prefetch") if prefetch else None
+    next_page_future = None
+    page = 1
+    try:
+        while True:
+            res = next_page_future.result() if next_page_future else _fetch_active_coupon_page(api, vendor_id, page, page_size)
+            next_page_future = None
+
+            if not (res.get('code') == 200 and res.get('data')):
+                message = f"활성 쿠폰 목록 {page}페이지 조회 실패: {res.get('message', '알 수 없는 오류')}"
+                if page > 1:
+                    # 앞 페이지의 쿠폰만 반환하면 이후 페이지의 오래된 쿠폰이 파기되지 않고 남습니다.
+                    raise CouponListPageError(message)
+                logger.warning(f"[실패] {message}")
+                return
+
+            page_coupons = res['data'].get('content') or []
+            has_next_page = _has_next_coupon_page(res['data'], page, page_size, len(page_coupons))
+            logger.debug(f"활성 쿠폰 목록 {page}페이지 조회 완료 ({len(page_coupons)}개, 다음 페이지: {has_next_page})")
+            if executor and has_next_page:
+                next_page_future = executor.submit(_fetch_active_coupon_page, api, vendor_id, page + 1, page_size)
+
+            for coupon in page_coupons:
+                if coupon.get('promotionName') and keyword in coupon['promotionName']:
+                    yield coupon
+                    if stop_when and stop_when(coupon):
+                        return
+
+            if not has_next_page:
+                return
+            page += 1
+    finally:
+        if executor:
+            if next_page_future:
+                next_page_future.cancel()
+            executor.shutdown(wait=False)
+
+
+def _fetch_active_coupon_page(api: CoupangApiClient, vendor_id: str, page: int, page_size: int) -> dict:
     query_params = {
         "status": "APPLIED",
-        "page": 1,
-        "size": 100,
+        "page": page,
+        "size": page_size,
         "sort": "desc"
     }
+    return api.get(f"/v2/providers/fms/apis/api/v2/vendors/{vendor_id}/coupons", query_params)
 
-    try:
-        res = api.get(f"/v2/providers/fms/apis/api/v2/vendors/{vendor_id}/coupons", query_params)
-
-        if res.get('code') == 200 and res.get('data') and res['data'].get('content'):
-            all_active_coupons = res['data']['content']
-            filtered_coupons = [
-                c for c in all_active_coupons
-                if c.get('promotionName') and keyword in c['promotionName']
-            ]
-            logger.info(f"[성공] 활성 쿠폰 목록 조회 성공. '{keyword}' 포함 쿠폰 {len(filtered_coupons)}개 발견.")
-            return filtered_coupons
-        else:
-            logger.warning(f"[실패] 활성 쿠폰 목록 조회 실패: {res.get('message', '알 수 없는 오류')}")
-            return []
-    except Exception as e:
-        logger.error(f"[실패] 활성 쿠폰 목록 조회 중 오류 발생: {e}", exc_info=True)
-        return None
+
+def _has_next_coupon_page(data: dict, page: int, page_size: int, page_item_count: int) -> bool:
+    """응답의 pagination 정보(없으면 페이지가 가득 찼는지 여부)로 다음 페이지 존재 여부를 판단합니다."""
+    total_pages = (data.get('pagination') or {}).get('totalPages')
+    if total_pages is not None:
+        return page < int(total_pages)
+    return page_item_count >= page_size
 
 
 def deactivate_coupon(api: CoupangApiClient, vendor_id: str, coupon_id: int, coupon_name: str = "알 수 없는 쿠폰") -> str | None:
@@ -45,64 +143,87 @@ def deactivate_coupon(api: CoupangApiClient, vendor_id: str, coupon_id: int, cou
     """
     logger.info(f"[API 파기] 쿠폰 {coupon_id} 비활성화 시도 중...")
 
-    query_params = {"action": "expire"}
-    body = {} # 이 API 호출에서는 빈 바디를 보냅니다.
-
     try:
-        res = api.put(f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/coupons/{coupon_id}", query_params, body)
-
-        if res.get('code') == 200 and res.get('data') and res['data'].get('content'):
-            requested_id = res['data']['content'].get('requestedId')
-            if requested_id:
-                logger.info(f"[성공] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 완료. Requested ID: {requested_id}")
-                return requested_id
-            else:
-                logger.warning(f"[주의] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 성공했으나 Requested ID 없음: {res}")
-                return None
-        else:
-            logger.warning(f"[실패] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 실패: {res.get('message', '알 수 없는 오류')}")
-            return None
+        res = api.put(_coupon_path(vendor_id, coupon_id), EXPIRE_QUERY_PARAMS, {}) # 이 API 호출에서는 빈 바디를 보냅니다.
+        return _handle_deactivate_response(res, coupon_id, coupon_name)
     except Exception as e:
         logger.error(f"[실패] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 중 오류: {e}", exc_info=True)
         return None
 
 
-def create_new_coupon_util(api: CoupangApiClient, vendor_id: str) -> str | None:
+def _handle_deactivate_response(res: dict, coupon_id: int, coupon_name: str) -> str | None:
+    """쿠폰 파기 API 응답에서 요청 ID를 추출합니다."""
+    if res.get('code') == 200 and res.get('data') and res['data'].get('content'):
+        requested_id = res['data']['content'].get('requestedId')
+        if requested_id:
+            logger.info(f"[성공] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 완료. Requested ID: {requested_id}", extra={"requested_id": requested_id})
+            return requested_id
+        else:
+            logger.warning(f"[주의] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 성공했으나 Requested ID 없음: {res}")
+            return None
+    else:
+        logger.warning(f"[실패] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 요청 실패: {res.get('message', '알 수 없는 오류')}")
+        return None
+
+
+def create_new_coupon_util(api: CoupangApiClient, vendor_id: str, scheduled_at: datetime | None = None,
+                           coupon_options: Dict[str, Any] | None = None) -> str | None:
     """
     Coupang API를 통해 새로운 쿠폰을 생성합니다.
+    scheduled_at(사이클 예정 실행 시각)을 주면 쿠폰 종료 시각(endAt)을 실제 실행 시각이 아닌 예정 시각 기준으로 계산합니다.
+    coupon_options로 계약 ID, 할인율 등 쿠폰 설정을 판매자 계정별로 지정할 수 있습니다. (_build_new_coupon_body 참고)
     """
     logger.info("[API 생성] 새로운 쿠폰 생성 요청 시도 중...")
 
+    try:
+        res = api.post(_new_coupon_path(vendor_id), _build_new_coupon_body(scheduled_at, coupon_options))
+        return _handle_create_coupon_response(res)
+    except Exception as e:
+        logger.error(f"[실패] 쿠폰 생성 중 오류 발생: {e}", exc_info=True)
+        return None
+
+
+def _build_new_coupon_body(scheduled_at: datetime | None = None, coupon_options: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """
+    새 쿠폰 생성 요청 바디를 구성합니다. 시작 시각(startAt)은 현재 시각이며,
+    종료 시각(endAt)은 scheduled_at(없으면 현재 시각)에 갱신 주기를 더해 계산합니다.
+    사이클이 늦게 시작되어도 종료 시각이 다음 예정 사이클 기준으로 고정되므로 지연이 누적되지 않습니다.
+    coupon_options의 contract_id, discount_rate, max_discount_price, cycle_minutes, rotation_mode, overlap_minutes 값이
+    있으면 해당 설정값 대신 사용합니다.
+    """
+    options = coupon_options or {}
+    cycle_minutes = options.get("cycle_minutes", COUPON_CYCLE_MINUTES)
+    rotation_mode = options.get("rotation_mode", COUPON_ROTATION_MODE)
     now_kst = datetime.now()
     start_at_str = now_kst.strftime("%Y-%m-%d %H:%M:%S")
-    end_at_str = (now_kst + timedelta(minutes=COUPON_CYCLE_MINUTES + 1)).strftime("%Y-%m-%d %H:%M:%S")
+    cycle_anchor = scheduled_at or now_kst
+    # overlap 모드에서는 다음 사이클의 새 쿠폰이 적용될 때까지 유지되도록 여유 시간을 더 둡니다.
+    extra_minutes = options.get("overlap_minutes", COUPON_OVERLAP_MINUTES) if rotation_mode == "overlap" else 1
+    end_at_str = (cycle_anchor + timedelta(minutes=cycle_minutes + extra_minutes)).strftime("%Y-%m-%d %H:%M:%S")
 
     logger.debug(f"DEBUG: 쿠폰 startAt (로컬 KST): {start_at_str}")
     logger.debug(f"DEBUG: 쿠폰 endAt (로컬 KST): {end_at_str}")
 
-    request_body = {
-        "contractId": CONTRACT_ID,
+    return {
+        "contractId": options.get("contract_id", CONTRACT_ID),
         "name": f"자동쿠폰_{now_kst.strftime('%Y%m%d_%H%M%S')}",
-        "discount": COUPON_DISCOUNT_RATE,
-        "maxDiscountPrice": COUPON_MAX_DISCOUNT_PRICE,
+        "discount": options.get("discount_rate", COUPON_DISCOUNT_RATE),
+        "maxDiscountPrice": options.get("max_discount_price", COUPON_MAX_DISCOUNT_PRICE),
         "startAt": start_at_str,
         "endAt": end_at_str,
         "type": "RATE",
         "wowExclusive": False
     }
 
-    try:
-        res = api.post(f"/v2/providers/fms/apis/api/v2/vendors/{vendor_id}/coupon", request_body)
 
-        if res.get('data', {}).get('success'):
-            requested_id = res['data']['content']['requestedId']
-            logger.info(f"[성공] 쿠폰 생성 요청 완료 (Requested ID: {requested_id})")
-            return requested_id
-        else:
-            logger.warning(f"[실패] 쿠폰 생성 API 응답 실패: {res.get('code', 'N/A')} - {res.get('message', '알 수 없는 오류')}")
-            return None
-    except Exception as e:
-        logger.error(f"[실패] 쿠폰 생성 중 오류 발생: {e}", exc_info=True)
+def _handle_create_coupon_response(res: dict) -> str | None:
+    """쿠폰 생성 API 응답에서 요청 ID를 추출합니다."""
+    if res.get('data', {}).get('success'):
+        requested_id = res['data']['content']['requestedId']
+        logger.info(f"[성공] 쿠폰 생성 요청 완료 (Requested ID: {requested_id})", extra={"requested_id": requested_id})
+        return requested_id
+    else:
+        logger.warning(f"[실패] 쿠폰 생성 API 응답 실패: {res.get('code', 'N/A')} - {res.get('message', '알 수 없는 오류')}")
         return None
 
 
@@ -118,49 +239,111 @@ def check_coupon_status_util(api: CoupangApiClient, vendor_id: str, requested_id
 
     Returns:
         튜플 (status_string, coupon_id_or_none)을 반환합니다.
-        - status_string: "DONE", "FAIL", "REQUESTED", "ERROR" 중 하나.
+        - status_string: "DONE", "FAIL", "REQUESTED", "ERROR", "GATEWAY_UNAVAILABLE" 중 하나.
         - coupon_id_or_none: 요청이 성공적으로 완료(DONE)되었을 경우 쿠폰 ID(int), 그 외의 경우 None.
     """
+    return _status_tuple(check_coupon_status_detail_util(api, vendor_id, requested_id))
+
+
+def check_coupon_status_detail_util(api: CoupangApiClient, vendor_id: str, requested_id: str) -> Dict[str, Any]:
+    """
+    check_coupon_status_util과 같지만 처리 건수까지 포함한 딕셔너리를 반환합니다.
+
+    Returns:
+        {"requestedId", "status", "couponId", "type", "succeeded", "failed", "total", "failedItems"} 키를 가진 딕셔너리.
+        status는 "DONE", "FAIL", "REQUESTED", "ERROR", "GATEWAY_UNAVAILABLE"(회로 차단으로 조회하지 못함) 중 하나입니다.
+        failedItems는 응답의 failedVendorItems에 담긴 실패 품목 ID(int) 목록이며, 응답에 없으면 빈 리스트입니다.
+    """
     logger.info(f"[API 조회] 쿠폰 요청 {requested_id} 상태 확인 중...")
-    
 
     try:
-        res = api.get(f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/requested/{requested_id}")
-
-        if res.get('code') == 200 and res.get('data') and res['data'].get('content'):
-            content = res['data']['content']
-            status = content.get('status')
-            coupon_id = content.get('couponId')
-            request_type = content.get('type')
-            succeeded_count = content.get('succeeded', 0)
-            failed_count = content.get('failed', 0)
-            total_count = content.get('total', 0)
-
-            if status == "DONE":
-                logger.info(f"[성공] 쿠폰 요청 {requested_id} (타입: {request_type}) 성공. 상태: DONE, 쿠폰 ID: {coupon_id}, 성공: {succeeded_count}/{total_count}")
-                return "DONE", coupon_id
-            elif status == "FAIL":
-                fail_reason = content.get('reason', '상세 이유 없음')
-                error_message_from_data = res['data'].get('errorMessage', 'N/A')
-                logger.warning(f"[실패] 쿠폰 요청 {requested_id} (타입: {request_type}) 실패. 상태: FAIL, 실패 개수: {failed_count}/{total_count}, 이유: {fail_reason}, API응답 오류메시지: {error_message_from_data}")
-                return "FAIL", None
-            elif status == "REQUESTED":
-                logger.info(f"[확인중] 쿠폰 요청 {requested_id} (타입: {request_type}) 진행 중. 현재 상태: {status}")
-                return "REQUESTED", None
-            else:
-                logger.warning(f"[경고] 쿠폰 요청 {requested_id} (타입: {request_type}) 알 수 없는 상태: {status}")
-                return "ERROR", None
-        else:
-            error_message_from_res = res.get('message', '알 수 없는 오류')
-            error_details_from_data = res.get('data', {}).get('errorMessage', '')
-            logger.warning(f"[실패] 쿠폰 요청 {requested_id} 상태 조회 실패. API 응답 코드: {res.get('code', 'N/A')}, 메시지: {error_message_from_res}, 상세: {error_details_from_data}")
-            return "ERROR", None
+        res = api.get(_requested_path(vendor_id, requested_id))
+        return _handle_status_response(res, requested_id)
+    except CircuitOpenError as e:
+        return _deferred_status_detail(requested_id, e)
     except Exception as e:
         logger.error(f"[실패] 쿠폰 요청 {requested_id} 상태 조회 중 예외 발생: {e}", exc_info=True)
-        return "ERROR", None
+        return _status_detail(requested_id, "ERROR")
+
+
+def _deferred_status_detail(requested_id: str, error: CircuitOpenError) -> Dict[str, Any]:
+    """
+    회로 차단으로 상태 조회를 보내지 못했을 때의 결과입니다. (status: "GATEWAY_UNAVAILABLE", retryAfterSec: 시험 요청까지 남은 시간)
+    요청 처리는 계속 진행 중일 수 있으므로 실패로 확정하지 않으며, 호출한 쪽은 회로가 닫힌 뒤 다시 조회해야 합니다.
+    """
+    logger.warning(f"[회로 차단] 쿠폰 요청 {requested_id} 상태 조회를 미룹니다: {error}", extra={"requested_id": requested_id})
+    return dict(_status_detail(requested_id, STATUS_GATEWAY_UNAVAILABLE), retryAfterSec=error.retry_after_sec)
+
+
+def _status_detail(requested_id: str, status: str, content: dict | None = None) -> Dict[str, Any]:
+    content = content or {}
+    return {
+        "requestedId": requested_id,
+        "status": status,
+        "couponId": content.get('couponId'),
+        "type": content.get('type'),
+        "succeeded": content.get('succeeded', 0),
+        "failed": content.get('failed', 0),
+        "total": content.get('total', 0),
+        "failedItems": _failed_item_ids(content),
+    }
+
+
+def _failed_item_ids(content: dict) -> List[int]:
+    """요청 상태 응답의 failedVendorItems에서 실패한 품목 ID를 추출합니다. ({"vendorItemId": ...} 또는 ID 값 목록)"""
+    failed_item_ids = []
+    for failed_item in content.get('failedVendorItems') or []:
+        item_id = failed_item.get('vendorItemId') if isinstance(failed_item, dict) else failed_item
+        if str(item_id).isascii() and str(item_id).isdigit():
+            failed_item_ids.append(int(item_id))
+    return failed_item_ids
+
 
+def _status_tuple(detail: Dict[str, Any]) -> Tuple[str, int | None]:
+    """상태 딕셔너리를 기존 (status_string, coupon_id_or_none) 형태로 변환합니다."""
+    return detail['status'], detail['couponId'] if detail['status'] == "DONE" else None
 
-def apply_coupon_to_items_util(api: CoupangApiClient, vendor_id: str, coupon_id: int, vendor_items: List[Dict[str, Any]]) -> str | None:
+
+def _handle_status_response(res: dict, requested_id: str) -> Dict[str, Any]:
+    """요청 상태 조회 API 응답을 상태 딕셔너리로 변환합니다."""
+    if res.get('code') == 200 and res.get('data') and res['data'].get('content'):
+        content = res['data']['content']
+        status = content.get('status')
+        coupon_id = content.get('couponId')
+        request_type = content.get('type')
+        succeeded_count = content.get('succeeded', 0)
+        failed_count = content.get('failed', 0)
+        total_count = content.get('total', 0)
+
+        if status == "DONE":
+            logger.info(f"[성공] 쿠폰 요청 {requested_id} (타입: {request_type}) 성공. 상태: DONE, 쿠폰 ID: {coupon_id}, 성공: {succeeded_count}/{total_count}", extra={"requested_id": requested_id})
+            return _status_detail(requested_id, "DONE", content)
+        elif status == "FAIL":
+            fail_reason = content.get('reason', '상세 이유 없음')
+            error_message_from_data = res['data'].get('errorMessage', 'N/A')
+            logger.warning(f"[실패] 쿠폰 요청 {requested_id} (타입: {request_type}) 실패. 상태: FAIL, 실패 개수: {failed_count}/{total_count}, 이유: {fail_reason}, API응답 오류메시지: {error_message_from_data}", extra={"requested_id": requested_id})
+            return _status_detail(requested_id, "FAIL", content)
+        elif status == "REQUESTED":
+            logger.info(f"[확인중] 쿠폰 요청 {requested_id} (타입: {request_type}) 진행 중. 현재 상태: {status}", extra={"requested_id": requested_id})
+            return _status_detail(requested_id, "REQUESTED", content)
+        else:
+            logger.warning(f"[경고] 쿠폰 요청 {requested_id} (타입: {request_type}) 알 수 없는 상태: {status}", extra={"requested_id": requested_id})
+            return _status_detail(requested_id, "ERROR", content)
+    else:
+        error_message_from_res = res.get('message', '알 수 없는 오류')
+        error_details_from_data = res.get('data', {}).get('errorMessage', '')
+        logger.warning(f"[실패] 쿠폰 요청 {requested_id} 상태 조회 실패. API 응답 코드: {res.get('code', 'N/A')}, 메시지: {error_message_from_res}, 상세: {error_details_from_data}", extra={"requested_id": requested_id})
+        return _status_detail(requested_id, "ERROR")
+
+
+def _apply_request_body(vendor_items) -> dict | bytes:
+    """품목 적용 요청 바디를 만듭니다. VendorItemIndex는 JSON 바이트를 직접 생성합니다."""
+    if isinstance(vendor_items, VendorItemIndex):
+        return vendor_items.apply_request_body()
+    return {"vendorItems": vendor_items}
+
+
+def apply_coupon_to_items_util(api: CoupangApiClient, vendor_id: str, coupon_id: int, vendor_items: List[Dict[str, Any]] | VendorItemIndex) -> str | None:
     """
     생성된 쿠폰을 특정 품목에 적용하고, 요청 ID를 반환합니다.
     """
@@ -171,22 +354,85 @@ def apply_coupon_to_items_util(api: CoupangApiClient, vendor_id: str, coupon_id:
         return None
 
     # body를 명확히 분리
-    request_body = {"vendorItems": vendor_items}
+    request_body = _apply_request_body(vendor_items)
 
     try:
-        res = api.post(f"/v2/providers/fms/apis/api/v1/vendors/{vendor_id}/coupons/{coupon_id}/items", request_body)
-
-        if res.get('data', {}).get('success'):
-            requested_id = res['data']['content'].get('requestedId')
-            if requested_id:
-                logger.info(f"[성공] 쿠폰 {coupon_id} 품목 적용 요청 완료. Requested ID: {requested_id}")
-                return requested_id
-            else:
-                logger.warning(f"[주의] 쿠폰 {coupon_id} 품목 적용 요청 성공했으나 Requested ID 없음: {res}")
-                return None
+        res = api.post(_coupon_items_path(vendor_id, coupon_id), request_body)
+        return _handle_apply_response(res, coupon_id)
+    except Exception as e:
+        logger.error(f"[실패] 쿠폰 {coupon_id} 품목 적용 중 오류 발생: {e}", exc_info=True)
+        return None
+
+
+def _handle_apply_response(res: dict, coupon_id: int) -> str | None:
+    """쿠폰 품목 적용 API 응답에서 요청 ID를 추출합니다."""
+    if res.get('data', {}).get('success'):
+        requested_id = res['data']['content'].get('requestedId')
+        if requested_id:
+            logger.info(f"[성공] 쿠폰 {coupon_id} 품목 적용 요청 완료. Requested ID: {requested_id}", extra={"requested_id": requested_id})
+            return requested_id
         else:
-            logger.warning(f"[실패] 쿠폰 {coupon_id} 품목 적용 API 응답 실패: {res}")
+            logger.warning(f"[주의] 쿠폰 {coupon_id} 품목 적용 요청 성공했으나 Requested ID 없음: {res}")
             return None
+    else:
+        logger.warning(f"[실패] 쿠폰 {coupon_id} 품목 적용 API 응답 실패: {res}")
+        return None
+
+
+# --- asyncio 버전 ---
+# AsyncCoupangApiClient와 함께 사용하며, 응답 처리와 로깅은 위 동기 버전과 동일한 함수를 공유합니다.
+# 여러 요청을 asyncio.gather 등으로 동시에 보낼 수 있습니다. (동시 실행 수는 클라이언트의 max_concurrency로 제한)
+
+async def create_new_coupon_util_async(api: "AsyncCoupangApiClient", vendor_id: str, scheduled_at: datetime | None = None,
+                                       coupon_options: Dict[str, Any] | None = None) -> str | None:
+    """create_new_coupon_util의 asyncio 버전입니다."""
+    logger.info("[API 생성] 새로운 쿠폰 생성 요청 시도 중...")
+
+    try:
+        res = await api.post(_new_coupon_path(vendor_id), _build_new_coupon_body(scheduled_at, coupon_options))
+        return _handle_create_coupon_response(res)
+    except Exception as e:
+        logger.error(f"[실패] 쿠폰 생성 중 오류 발생: {e}", exc_info=True)
+        return None
+
+
+async def check_coupon_status_util_async(api: "AsyncCoupangApiClient", vendor_id: str, requested_id: str) -> Tuple[str, int | None]:
+    """check_coupon_status_util의 asyncio 버전입니다."""
+    logger.info(f"[API 조회] 쿠폰 요청 {requested_id} 상태 확인 중...")
+
+    try:
+        res = await api.get(_requested_path(vendor_id, requested_id))
+        return _status_tuple(_handle_status_response(res, requested_id))
+    except CircuitOpenError as e:
+        return _status_tuple(_deferred_status_detail(requested_id, e))
+    except Exception as e:
+        logger.error(f"[실패] 쿠폰 요청 {requested_id} 상태 조회 중 예외 발생: {e}", exc_info=True)
+        return "ERROR", None
+
+
+async def deactivate_coupon_async(api: "AsyncCoupangApiClient", vendor_id: str, coupon_id: int, coupon_name: str = "알 수 없는 쿠폰") -> str | None:
+    """deactivate_coupon의 asyncio 버전입니다."""
+    logger.info(f"[API 파기] 쿠폰 {coupon_id} 비활성화 시도 중...")
+
+    try:
+        res = await api.put(_coupon_path(vendor_id, coupon_id), EXPIRE_QUERY_PARAMS, {})
+        return _handle_deactivate_response(res, coupon_id, coupon_name)
+    except Exception as e:
+        logger.error(f"[실패] 쿠폰 {coupon_id} (이름: '{coupon_name}') 비활성화 중 오류: {e}", exc_info=True)
+        return None
+
+
+async def apply_coupon_to_items_util_async(api: "AsyncCoupangApiClient", vendor_id: str, coupon_id: int, vendor_items: List[Dict[str, Any]] | VendorItemIndex) -> str | None:
+    """apply_coupon_to_items_util의 asyncio 버전입니다."""
+    logger.info(f"[API 적용] 쿠폰 {coupon_id}를 {len(vendor_items)}개 품목에 적용 시도 중...")
+
+    if not vendor_items:
+        logger.warning("적용할 VENDOR_ITEMS가 없어 쿠폰 적용을 건너뛰니다.")
+        return None
+
+    try:
+        res = await api.post(_coupon_items_path(vendor_id, coupon_id), _apply_request_body(vendor_items))
+        return _handle_apply_response(res, coupon_id)
     except Exception as e:
         logger.error(f"[실패] 쿠폰 {coupon_id} 품목 적용 중 오류 발생: {e}", exc_info=True)
         return None
\ No newline at end of file
@@ -1,95 +1,202 @@
 # coupang_lib/coupang_wing_selenium.py
-import time
+import atexit
+import os
+import threading
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 # config.py에서 변수 임포트 (상대 경로를 절대 경로로 변경)
 from coupang_lib.config import COUPANG_ID, COUPANG_PW, SELENIUM_HEADLESS, SELENIUM_WINDOW_SIZE # 절대 경로 임포트로 변경
+from coupang_lib.config import SELENIUM_PROFILE_DIR, SELENIUM_DRIVER_PATH, SELENIUM_WAIT_SEC
+
+WING_COUPONS_URL = "https://wing.coupang.com/tenants/seller-promotion-platform/v2/seller-funding-coupon/coupons"
+
+# 목록이 로딩 중일 때 표시되는 요소 (사라질 때까지 기다림)
+_LOADING_SELECTOR = ".n-spin, .n-data-table__loading"
+_STATUS_CELL_SELECTOR = "td[data-col-key='status']"
+_DISCARD_BUTTON_XPATH = "//button[text()='사용중지']"
+_CONFIRM_BUTTON_XPATH = "//span[text()='확인하다']/ancestor::button"
+
+# '사용중' 상태인 행의 체크박스를 한 번에 선택하고 선택한 행 수를 반환합니다. (이미 선택된 체크박스는 건드리지 않음)
+_SELECT_ACTIVE_ROWS_SCRIPT = """
+let selected = 0;
+for (const row of Array.from(document.querySelectorAll("tr")).slice(1)) {
+    const statusCell = row.querySelector("td[data-col-key='status']");
+    if (!statusCell || statusCell.textContent.trim() !== "사용중") continue;
+    const checkbox = row.querySelector("div.n-checkbox");
+    if (!checkbox) continue;
+    if (!checkbox.classList.contains("n-checkbox--checked")) checkbox.click();
+    selected++;
+}
+return selected;
+"""
+
+# ChromeDriverManager().install()은 매번 버전 확인 요청을 보내므로 프로세스당 한 번만 실행합니다.
+_driver_path: str | None = None
+
+
+def _resolve_driver_path() -> str:
+    """chromedriver 경로를 반환합니다. SELENIUM_DRIVER_PATH가 있으면 그대로 쓰고, 없으면 한 번만 내려받아 경로를 기억합니다."""
+    global _driver_path
+    if _driver_path is None:
+        if SELENIUM_DRIVER_PATH:
+            _driver_path = SELENIUM_DRIVER_PATH
+        else:
+            # webdriver_manager는 사용할 때만 불러옵니다.
+            from webdriver_manager.chrome import ChromeDriverManager
+            _driver_path = ChromeDriverManager().install()
+        print(f"chromedriver 경로: {_driver_path}")
+    return _driver_path
 
-def check_and_disable_coupons():
-    print("[쿠폰 자동화] 기존 쿠폰 비활성화 시도 중...")
-    options = Options()
-    if SELENIUM_HEADLESS:
-        options.add_argument('--headless')
-    options.add_argument(f'--window-size={SELENIUM_WINDOW_SIZE}')
 
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-    wait = WebDriverWait(driver, 20)
+class WingBrowserSession:
+    """
+    쿠팡 WING에 로그인된 상태를 유지하는 브라우저 세션입니다.
 
-    try:
-        driver.get("https://wing.coupang.com/login")
-        wait.until(EC.presence_of_element_located((By.ID, "username"))).send_keys(COUPANG_ID)
-        driver.find_element(By.ID, "password").send_keys(COUPANG_PW)
-        driver.find_element(By.ID, "kc-login").click()
-        time.sleep(3)
+    - Chrome 프로필(SELENIUM_PROFILE_DIR)을 디스크에 보관하므로 로그인 쿠키가 다음 실행까지 유지되며,
+      쿠폰 페이지로 이동했을 때 로그인 화면이 나올 때만 다시 로그인합니다.
+    - 고정 대기(sleep) 대신 문서 로딩 완료, 로딩 표시 사라짐, 버튼 활성화 같은 조건을 기다립니다.
+    - '사용중' 쿠폰 행은 스크립트 한 번으로 모두 선택한 뒤 일괄 사용중지합니다.
+    """
+    def __init__(self, profile_dir: str = SELENIUM_PROFILE_DIR, wait_sec: float = SELENIUM_WAIT_SEC):
+        self.profile_dir = os.path.abspath(profile_dir)
+        self.wait_sec = wait_sec
+        self.driver = None
+        self._wait = None
 
-        driver.get("https://wing.coupang.com/tenants/seller-promotion-platform/v2/seller-funding-coupon/coupons")
-        time.sleep(3)
+    def start(self):
+        """브라우저를 실행합니다. 이미 실행 중이면 그대로 사용합니다."""
+        if self.driver is not None:
+            return
+        os.makedirs(self.profile_dir, exist_ok=True)
+        options = Options()
+        if SELENIUM_HEADLESS:
+            options.add_argument('--headless')
+        options.add_argument(f'--window-size={SELENIUM_WINDOW_SIZE}')
+        options.add_argument(f'--user-data-dir={self.profile_dir}')
+        self.driver = webdriver.Chrome(service=Service(_resolve_driver_path()), options=options)
+        self._wait = WebDriverWait(self.driver, self.wait_sec)
 
+    def close(self):
+        """브라우저를 종료합니다. (프로필과 로그인 쿠키는 남아 있음)"""
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            finally:
+                self.driver = None
+                self._wait = None
+
+    def _wait_for_page_ready(self):
+        """문서 로딩이 끝나고 목록 로딩 표시가 사라질 때까지 기다립니다."""
+        self._wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+        self._wait.until(EC.invisibility_of_element_located((By.CSS_SELECTOR, _LOADING_SELECTOR)))
+
+    def _wait_for_coupon_rows(self):
+        """쿠폰 목록의 상태 열이 나타날 때까지 기다립니다. (쿠폰이 하나도 없으면 제한 시간 후 그대로 진행)"""
         try:
-            close_btn = WebDriverWait(driver, 5).until(
+            WebDriverWait(self.driver, min(5, self.wait_sec)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, _STATUS_CELL_SELECTOR))
+            )
+        except TimeoutException:
+            pass
+
+    def _login(self):
+        print("WING 로그인 중...")
+        username = self._wait.until(EC.presence_of_element_located((By.ID, "username")))
+        username.clear()
+        username.send_keys(COUPANG_ID)
+        password = self.driver.find_element(By.ID, "password")
+        password.clear()
+        password.send_keys(COUPANG_PW)
+        self.driver.find_element(By.ID, "kc-login").click()
+        # 로그인 화면을 벗어날 때까지 기다립니다.
+        self._wait.until(EC.staleness_of(username))
+        self._wait_for_page_ready()
+
+    def open_coupon_page(self):
+        """쿠폰 목록 페이지를 엽니다. 로그인이 만료되었으면 다시 로그인한 뒤 이동합니다."""
+        self.start()
+        self.driver.get(WING_COUPONS_URL)
+        self._wait_for_page_ready()
+        if self.driver.find_elements(By.ID, "username"):
+            self._login()
+            self.driver.get(WING_COUPONS_URL)
+            self._wait_for_page_ready()
+
+        try:
+            close_btn = WebDriverWait(self.driver, 3).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, ".n-dialog__action button"))
             )
             close_btn.click()
-            time.sleep(1)
-        except:
+            WebDriverWait(self.driver, 5).until(EC.staleness_of(close_btn))
+        except TimeoutException:
             pass
+        self._wait_for_coupon_rows()
+
+    def _confirm_dialogs(self):
+        """사용중지 확인 창(최대 2단계)을 차례로 확인합니다."""
+        for _ in range(2):
+            try:
+                confirm = WebDriverWait(self.driver, 5).until(EC.element_to_be_clickable((By.XPATH, _CONFIRM_BUTTON_XPATH)))
+            except TimeoutException:
+                return
+            confirm.click()
+            WebDriverWait(self.driver, self.wait_sec).until(EC.staleness_of(confirm))
 
-        for attempt in range(3):
-            rows = driver.find_elements(By.CSS_SELECTOR, "tr")
-            print(f"행 발견: {len(rows)}개 (시도 {attempt + 1})")
-
-            checked_any_coupon = False
-            for idx, row in enumerate(rows[1:], 1):
-                try:
-                    status_cell = row.find_element(By.CSS_SELECTOR, "td[data-col-key='status']")
-                    status = status_cell.text.strip()
-                    if status == "사용중":
-                        checkbox = row.find_element(By.CSS_SELECTOR, "div.n-checkbox")
-                        driver.execute_script("arguments[0].click()", checkbox)
-                        print(f"쿠폰 체크박스 클릭 완료 (행 {idx})")
-                        checked_any_coupon = True
-                        time.sleep(0.5)
-                except Exception as e:
-                    print(f"행 {idx} 처리 중 실패: {e}")
-
-            if not checked_any_coupon:
+    def disable_active_coupons(self, max_attempts: int = 3) -> int:
+        """'사용중' 쿠폰을 모두 선택해 한 번에 사용중지하고, 사용중지를 요청한 쿠폰 수를 반환합니다."""
+        self.open_coupon_page()
+        disabled_count = 0
+        for attempt in range(max_attempts):
+            selected = self.driver.execute_script(_SELECT_ACTIVE_ROWS_SCRIPT)
+            print(f"'사용중' 쿠폰 {selected}개 선택 (시도 {attempt + 1})")
+            if not selected:
                 print("비활성화할 '사용중' 쿠폰이 없습니다.")
                 break
 
             try:
-                discard_btn = driver.find_element(By.XPATH, "//button[text()='사용중지']")
-                if discard_btn.get_attribute("disabled"):
-                    print("사용중지 버튼이 비활성화 상태입니다. (모든 쿠폰이 비활성화되었거나 선택된 쿠폰 없음)")
-                    break
-                discard_btn.click()
-                print("사용중지 버튼 클릭 완료")
-                time.sleep(1)
-
-                for _ in range(2):
-                    try:
-                        confirm = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable((By.XPATH, "//span[text()='확인하다']/ancestor::button"))
-                        )
-                        confirm.click()
-                        time.sleep(1)
-                    except:
-                        pass
-
-                driver.refresh()
-                time.sleep(3)
-                print("쿠폰 비활성화 및 페이지 새로고침 완료.")
-
-            except Exception as e:
-                print(f"사용중지 버튼 클릭 또는 확인 실패: {e}")
-                driver.save_screenshot("사용중지_실패.png")
+                discard_btn = self._wait.until(EC.element_to_be_clickable((By.XPATH, _DISCARD_BUTTON_XPATH)))
+            except TimeoutException:
+                print("사용중지 버튼이 비활성화 상태입니다. (모든 쿠폰이 비활성화되었거나 선택된 쿠폰 없음)")
                 break
-    except Exception as e:
-        print(f"쿠폰 비활성화 전역 오류: {e}")
-        driver.save_screenshot("비활성화_전역_오류.png")
-    finally:
-        driver.quit()
\ No newline at end of file
+            discard_btn.click()
+            print("사용중지 버튼 클릭 완료")
+            self._confirm_dialogs()
+            disabled_count += selected
+
+            self.driver.refresh()
+            self._wait_for_page_ready()
+            self._wait_for_coupon_rows()
+            print("쿠폰 비활성화 및 페이지 새로고침 완료.")
+        return disabled_count
+
+
+_session: WingBrowserSession | None = None
+_session_lock = threading.Lock()
+
+
+def get_wing_session() -> WingBrowserSession:
+    """여러 번 호출해도 같은 브라우저 세션을 반환합니다. (프로세스 종료 시 브라우저 종료)"""
+    global _session
+    if _session is None:
+        _session = WingBrowserSession()
+        atexit.register(_session.close)
+    return _session
+
+
+def check_and_disable_coupons():
+    print("[쿠폰 자동화] 기존 쿠폰 비활성화 시도 중...")
+    with _session_lock:
+        session = get_wing_session()
+        try:
+            session.disable_active_coupons()
+        except Exception as e:
+            print(f"쿠폰 비활성화 전역 오류: {e}")
+            if session.driver is not None:
+                session.driver.save_screenshot("비활성화_전역_오류.png")
+            # 브라우저 상태를 알 수 없으므로 종료하고, 다음 호출 때 새로 실행합니다. (로그인 쿠키는 프로필에 남아 있음)
+            session.close()
@@ -0,0 +1,196 @@
+# coupang_lib/cycle_scheduler.py
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List
+
+from coupang_lib.logger import logger
+
+# 한 번에 잠드는 최대 시간(초). 시스템 시계가 바뀌어도 다음 마감 시각을 다시 계산할 수 있도록 나누어 대기합니다.
+_MAX_SLEEP_CHUNK_SEC = 30
+
+
+class _ScheduledJob:
+    def __init__(self, name: str, job: Callable[[datetime], None], interval: timedelta, next_run_at: datetime, max_concurrent_runs: int,
+                 on_skip: Callable[[datetime], None] | None = None):
+        self.name = name
+        self.job = job
+        self.on_skip = on_skip
+        self.interval = interval
+        self.next_run_at = next_run_at
+        self.max_concurrent_runs = max_concurrent_runs
+        self.running: List[threading.Thread] = []
+        self.last_lateness_sec: float | None = None
+        self.skipped_runs = 0
+        # run_once()로 예약한 1회성 재실행 (실행 시각, 작업에 넘길 예정 시각)
+        self.retry_at: datetime | None = None
+        self.retry_scheduled_at: datetime | None = None
+
+    def next_wakeup_at(self) -> datetime:
+        return min(self.next_run_at, self.retry_at) if self.retry_at is not None else self.next_run_at
+
+
+class CycleScheduler:
+    """
+    정해진 마감 시각마다 작업을 실행하는 스케줄러입니다.
+
+    - 다음 실행 시각은 "이전 마감 시각 + 주기"로 계산하므로, 작업 실행 시간이 길어도 일정이 밀리지 않습니다.
+    - align_to_wall_clock=True이면 자정을 기준으로 주기의 배수가 되는 시각(예: 60분 주기 → 매시 정각)에 맞춥니다.
+    - 작업은 별도 스레드에서 실행되므로, 이전 사이클의 폴링이 길어져도 다음 사이클은 제시간에 시작합니다.
+      (작업별 동시 실행 수는 max_concurrent_runs로 제한하며, 초과하면 해당 회차는 건너뜁니다.)
+    - 매 회차마다 예정 시각 대비 실제 시작 지연(lateness)을 로그로 남깁니다.
+    - run_once()로 정규 회차 사이에 1회성 재실행을 예약할 수 있습니다. (예: API Gateway 장애로 미룬 사이클)
+    """
+    def __init__(self, align_to_wall_clock: bool = False):
+        self.align_to_wall_clock = align_to_wall_clock
+        self._jobs: Dict[str, _ScheduledJob] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+
+    def add_job(self, name: str, job: Callable[[datetime], None], interval_minutes: float,
+                run_immediately: bool = False, max_concurrent_runs: int = 1,
+                on_skip: Callable[[datetime], None] | None = None):
+        """
+        작업을 등록합니다. job은 예정 실행 시각(datetime)을 인자로 받습니다.
+        run_immediately=True이면 첫 회차를 바로 실행하고, 이후에는 다음 마감 시각부터 주기적으로 실행합니다.
+        on_skip은 이전 회차가 실행 중이어서 회차(또는 재실행)를 건너뛸 때 해당 회차의 예정 시각으로 호출됩니다. (예: 지표 기록)
+        """
+        interval = timedelta(minutes=interval_minutes)
+        now = datetime.now()
+        next_run_at = now if run_immediately else self._next_deadline_after(now, interval)
+        with self._lock:
+            self._jobs[name] = _ScheduledJob(name, job, interval, next_run_at, max(1, max_concurrent_runs), on_skip)
+        self._wakeup.set()
+        logger.info(f"[스케줄러] 작업 '{name}' 등록: {interval_minutes}분 주기, 첫 실행 예정 {next_run_at.strftime('%Y-%m-%d %H:%M:%S')}")
+
+    def run_once(self, name: str, delay_sec: float, scheduled_at: datetime):
+        """
+        등록된 작업을 delay_sec초 뒤에 한 번 더 실행하도록 예약합니다. job에는 scheduled_at을 그대로 넘깁니다.
+        다음 정규 회차가 그보다 먼저 오면 예약하지 않습니다. (이미 예약된 재실행은 새 예약으로 바뀝니다)
+        """
+        run_at = datetime.now() + timedelta(seconds=max(0.0, delay_sec))
+        with self._lock:
+            scheduled = self._jobs[name]
+            if run_at >= scheduled.next_run_at:
+                logger.info(f"[스케줄러] 작업 '{name}'의 다음 정규 회차({scheduled.next_run_at.strftime('%H:%M:%S')})가 먼저 오므로 재실행을 예약하지 않습니다.")
+                return
+            scheduled.retry_at = run_at
+            scheduled.retry_scheduled_at = scheduled_at
+        self._wakeup.set()
+        logger.info(f"[스케줄러] 작업 '{name}' 재실행 예약: {run_at.strftime('%Y-%m-%d %H:%M:%S')} (예정 시각 {scheduled_at.strftime('%H:%M:%S')} 회차)")
+
+    def _next_deadline_after(self, moment: datetime, interval: timedelta) -> datetime:
+        if not self.align_to_wall_clock:
+            return moment + interval
+        midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+        elapsed_periods = (moment - midnight) // interval
+        return midnight + (elapsed_periods + 1) * interval
+
+    def lateness_report(self) -> Dict[str, Dict[str, float | int | None]]:
+        """작업별 마지막 시작 지연(초), 실행 중인 회차 수, 건너뛴 회차 수를 반환합니다."""
+        with self._lock:
+            return {
+                name: {
+                    "last_lateness_sec": scheduled.last_lateness_sec,
+                    "running": sum(1 for thread in scheduled.running if thread.is_alive()),
+                    "skipped_runs": scheduled.skipped_runs,
+                }
+                for name, scheduled in self._jobs.items()
+            }
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+
+    def run_forever(self):
+        """stop()이 호출될 때까지 마감 시각마다 작업을 실행합니다."""
+        while not self._stopped:
+            now = datetime.now()
+            with self._lock:
+                for scheduled in self._jobs.values():
+                    if scheduled.next_run_at <= now:
+                        # 정규 회차가 돌아왔으면 예약해 둔 재실행은 필요 없습니다.
+                        scheduled.retry_at = None
+                        self._dispatch(scheduled, now)
+                    elif scheduled.retry_at is not None and scheduled.retry_at <= now:
+                        self._dispatch_retry(scheduled)
+                next_deadline = min((scheduled.next_wakeup_at() for scheduled in self._jobs.values()), default=None)
+
+            if next_deadline is None:
+                wait_sec = _MAX_SLEEP_CHUNK_SEC
+            else:
+                wait_sec = min(_MAX_SLEEP_CHUNK_SEC, max(0.0, (next_deadline - datetime.now()).total_seconds()))
+            self._wakeup.wait(timeout=wait_sec)
+            self._wakeup.clear()
+
+    def _dispatch(self, scheduled: _ScheduledJob, now: datetime):
+        scheduled_at = scheduled.next_run_at
+        if self.align_to_wall_clock:
+            scheduled.next_run_at = self._next_deadline_after(now, scheduled.interval)
+        else:
+            while scheduled.next_run_at <= now:
+                scheduled.next_run_at += scheduled.interval
+        # 오래 멈춰 있다가 깨어난 경우 지난 회차를 몰아서 실행하지 않고 가장 최근 회차만 실행합니다.
+        latest_due_at = scheduled.next_run_at - scheduled.interval
+        if latest_due_at > scheduled_at:
+            missed_runs = round((latest_due_at - scheduled_at) / scheduled.interval)
+            scheduled_at = latest_due_at
+            scheduled.skipped_runs += missed_runs
+            logger.warning(f"[스케줄러] 작업 '{scheduled.name}' 실행 시각을 {missed_runs}회 놓쳐 가장 최근 회차만 실행합니다.")
+
+        lateness_sec = (now - scheduled_at).total_seconds()
+        scheduled.last_lateness_sec = lateness_sec
+        scheduled.running = [thread for thread in scheduled.running if thread.is_alive()]
+
+        if len(scheduled.running) >= scheduled.max_concurrent_runs:
+            scheduled.skipped_runs += 1
+            logger.warning(
+                f"[스케줄러] 작업 '{scheduled.name}'의 이전 회차 {len(scheduled.running)}개가 아직 실행 중이어서 "
+                f"{scheduled_at.strftime('%H:%M:%S')} 회차를 건너뜁니다."
+            )
+            self._notify_skip(scheduled, scheduled_at)
+            return
+
+        logger.info(
+            f"[스케줄러] 작업 '{scheduled.name}' 실행 (예정: {scheduled_at.strftime('%Y-%m-%d %H:%M:%S')}, 지연: {lateness_sec:.1f}초, "
+            f"다음 예정: {scheduled.next_run_at.strftime('%Y-%m-%d %H:%M:%S')})"
+        )
+        self._start_thread(scheduled, scheduled_at)
+
+    def _dispatch_retry(self, scheduled: _ScheduledJob):
+        scheduled_at = scheduled.retry_scheduled_at
+        scheduled.retry_at = None
+        scheduled.retry_scheduled_at = None
+        scheduled.running = [thread for thread in scheduled.running if thread.is_alive()]
+        if len(scheduled.running) >= scheduled.max_concurrent_runs:
+            logger.warning(f"[스케줄러] 작업 '{scheduled.name}'의 이전 회차가 아직 실행 중이어서 재실행을 건너뜁니다.")
+            self._notify_skip(scheduled, scheduled_at)
+            return
+        logger.info(f"[스케줄러] 작업 '{scheduled.name}' 재실행 (예정 시각 {scheduled_at.strftime('%Y-%m-%d %H:%M:%S')} 회차)")
+        self._start_thread(scheduled, scheduled_at)
+
+    def _notify_skip(self, scheduled: _ScheduledJob, scheduled_at: datetime):
+        if scheduled.on_skip is None:
+            return
+        try:
+            scheduled.on_skip(scheduled_at)
+        except Exception as e:
+            logger.error(f"[스케줄러] 작업 '{scheduled.name}' 건너뜀 처리 중 오류: {e}", exc_info=True)
+
+    def _start_thread(self, scheduled: _ScheduledJob, scheduled_at: datetime):
+        thread = threading.Thread(
+            target=self._run_job, args=(scheduled, scheduled_at),
+            name=f"cycle-{scheduled.name}-{scheduled_at.strftime('%H%M%S')}", daemon=True
+        )
+        scheduled.running.append(thread)
+        thread.start()
+
+    def _run_job(self, scheduled: _ScheduledJob, scheduled_at: datetime):
+        started = time.monotonic()
+        try:
+            scheduled.job(scheduled_at)
+        except Exception as e:
+            logger.error(f"[스케줄러] 작업 '{scheduled.name}' 실행 중 처리되지 않은 오류: {e}", exc_info=True)
+        finally:
+            logger.info(f"[스케줄러] 작업 '{scheduled.name}' ({scheduled_at.strftime('%H:%M:%S')} 회차) 종료. 소요 시간: {time.monotonic() - started:.1f}초")
@@ -1,37 +1,279 @@
-import requests
+import atexit
+import collections
 import os
+import threading
+import time
+from typing import List
+
+from coupang_lib.config import DISCORD_QUEUE_MAX_SIZE, DISCORD_COALESCE_SEC, DISCORD_REQUEST_TIMEOUT_SEC, DISCORD_MAX_RATE_LIMIT_RETRIES
+from coupang_lib.metrics import DISCORD_SENDS_TOTAL, DISCORD_SEND_DURATION_SECONDS, DISCORD_WEBHOOK_POSTS_TOTAL
+
+# Discord 메시지 content의 최대 글자 수
+DISCORD_CONTENT_LIMIT = 2000
+# 한 메시지로 묶은 알림 사이의 구분자
+_NOTIFICATION_SEPARATOR = "\n\n"
+# 코드 블록 구분자. 나뉜 조각마다 코드 블록을 닫고 다시 열기 위해 조각당 이만큼 글자 수를 남겨 둡니다.
+_CODE_FENCE = "```"
+_CODE_FENCE_RESERVE = len("\n" + _CODE_FENCE) + len(_CODE_FENCE + "\n")
+# 프로세스 종료 시 대기열에 남은 알림을 보내기 위해 기다리는 최대 시간(초)
+_EXIT_FLUSH_TIMEOUT_SEC = 10
+
+
+def _split_long_content(content: str, limit: int) -> List[str]:
+    """
+    limit보다 긴 알림을 줄 단위로(한 줄이 limit보다 길면 글자 수 기준으로) 나눕니다.
+    코드 블록(```) 중간에서 나뉘면 앞 조각 끝에서 블록을 닫고 다음 조각 앞에서 다시 엽니다.
+    """
+    if len(content) > limit and _CODE_FENCE in content:
+        limit -= _CODE_FENCE_RESERVE
+    parts = []
+    current = ""
+    for line in content.splitlines(keepends=True):
+        while len(line) > limit:
+            if current:
+                parts.append(current)
+                current = ""
+            parts.append(line[:limit])
+            line = line[limit:]
+        if len(current) + len(line) > limit:
+            parts.append(current)
+            current = ""
+        current += line
+    if current:
+        parts.append(current)
+    return _balance_code_fences([part.rstrip("\n") for part in parts if part.strip()])
+
+
+def _balance_code_fences(parts: List[str]) -> List[str]:
+    """조각 끝에서 열린 채로 남은 코드 블록을 닫고, 다음 조각 앞에서 다시 엽니다."""
+    balanced = []
+    in_code_block = False
+    for part in parts:
+        if in_code_block:
+            part = f"{_CODE_FENCE}\n{part}"
+        in_code_block = part.count(_CODE_FENCE) % 2 == 1
+        if in_code_block:
+            part = f"{part}\n{_CODE_FENCE}"
+        balanced.append(part)
+    return balanced
+
+
+def build_message_contents(notifications: List[str], limit: int = DISCORD_CONTENT_LIMIT) -> List[str]:
+    """알림 여러 개를 순서대로 이어 붙여, 각각 limit 글자 이하인 Discord 메시지 content 목록으로 묶습니다."""
+    contents = []
+    current = ""
+    for notification in notifications:
+        for part in _split_long_content(notification, limit):
+            if current and len(current) + len(_NOTIFICATION_SEPARATOR) + len(part) <= limit:
+                current += _NOTIFICATION_SEPARATOR + part
+                continue
+            if current:
+                contents.append(current)
+            current = part
+    if current:
+        contents.append(current)
+    return contents
+
+
+class DiscordNotificationQueue:
+    """
+    Discord 알림을 백그라운드 스레드에서 전송하는 대기열입니다. submit()은 대기열에 넣기만 하고 바로 반환합니다.
+
+    - 대기열에는 최대 max_size개까지 보관하며, 가득 차면 새 알림을 버립니다. (쿠폰 사이클이 알림 때문에 멈추지 않도록)
+    - 첫 알림이 들어온 뒤 coalesce_sec 동안 모인 알림을 2000자 이하의 메시지로 묶어 보냅니다.
+    - 웹훅 요청은 하나의 HTTP 세션(keep-alive)으로 보내며, 429 응답을 받으면 retry_after만큼 기다렸다가 재시도합니다.
+      응답 헤더의 남은 요청 수(X-RateLimit-Remaining)가 0이면 다음 요청 전에 초기화 시각까지 기다립니다.
+    """
+    def __init__(self, max_size: int = 100, coalesce_sec: float = 2.0, request_timeout_sec: float = 10.0,
+                 max_rate_limit_retries: int = 3):
+        self.max_size = max(1, max_size)
+        self.coalesce_sec = coalesce_sec
+        self.request_timeout_sec = request_timeout_sec
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self._pending = collections.deque()
+        self._in_flight = 0
+        self._flush_requests = 0  # flush()로 기다리는 호출 수 (0보다 크면 알림을 묶지 않고 바로 전송)
+        self._condition = threading.Condition()
+        self._session = None
+        self._next_request_at = 0.0  # 웹훅 요청 제한 초기화 시각 (time.monotonic 기준)
+        self._thread = threading.Thread(target=self._run, name="discord-notifier", daemon=True)
+        self._thread.start()
+
+    def submit(self, content: str) -> bool:
+        """알림을 대기열에 넣습니다. 대기열이 가득 차 버린 경우 False를 반환합니다."""
+        with self._condition:
+            if len(self._pending) >= self.max_size:
+                DISCORD_SENDS_TOTAL.inc(result="dropped")
+                print(f"[경고] Discord 알림 대기열이 가득 차(최대 {self.max_size}개) 알림을 버립니다.")
+                return False
+            self._pending.append(content)
+            self._condition.notify_all()
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """대기 중인 알림을 묶는 시간 없이 바로 보내고, 모두 전송될 때까지 최대 timeout초 기다립니다. 모두 전송되면 True를 반환합니다."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            self._flush_requests += 1
+            self._condition.notify_all()
+            try:
+                while self._pending or self._in_flight:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        return False
+                    self._condition.wait(remaining)
+            finally:
+                # 시간 초과로 돌아가더라도 이후 알림은 다시 묶어서 보내도록 요청을 해제합니다.
+                self._flush_requests -= 1
+        return True
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+                # 짧은 시간에 몰린 알림을 한 메시지로 묶기 위해 잠시 기다립니다.
+                coalesce_until = time.monotonic() + self.coalesce_sec
+                while not self._flush_requests and len(self._pending) < self.max_size:
+                    remaining = coalesce_until - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                notifications = list(self._pending)
+                self._pending.clear()
+                self._in_flight = len(notifications)
+
+            try:
+                self._send(notifications)
+            except Exception as e:
+                print(f"[오류] Discord 알림 전송 중 예상치 못한 오류: {e}")
+                DISCORD_SENDS_TOTAL.inc(len(notifications), result="failure")
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _send(self, notifications: List[str]):
+        webhook_url = os.getenv("DISCORD_WEBHOOK_URL")
+        contents = build_message_contents(notifications)
+        succeeded = all([self._post(webhook_url, content) for content in contents])
+        if len(notifications) > 1:
+            print(f"Discord 알림 {len(notifications)}개를 메시지 {len(contents)}개로 묶어 전송했습니다.")
+        DISCORD_SENDS_TOTAL.inc(len(notifications), result="success" if succeeded else "failure")
+
+    def _get_session(self):
+        if self._session is None:
+            # requests는 import 비용이 커서 실제로 알림을 보낼 때 불러옵니다.
+            import requests
+            self._session = requests.Session()
+            self._session.headers.update({'Content-Type': 'application/json'})
+        return self._session
+
+    def _post(self, webhook_url: str, content: str) -> bool:
+        """메시지 하나를 웹훅으로 보냅니다. 429 응답은 max_rate_limit_retries번까지 재시도합니다."""
+        import requests
+
+        # Discord에 보낼 JSON 데이터 구성
+        # content: 메시지 내용 (최대 2000자)
+        # username: 웹훅 메시지의 발신자 이름 (선택 사항)
+        payload = {
+            "username": "스크립트 실행 알림",
+            "content": content
+        }
+        for attempt in range(self.max_rate_limit_retries + 1):
+            wait_sec = self._next_request_at - time.monotonic()
+            if wait_sec > 0:
+                time.sleep(wait_sec)
+            try:
+                with DISCORD_SEND_DURATION_SECONDS.time():
+                    response = self._get_session().post(webhook_url, json=payload, timeout=self.request_timeout_sec)
+            except requests.exceptions.RequestException as e:
+                print(f"[오류] Discord 알림 전송 실패: {e}")
+                DISCORD_WEBHOOK_POSTS_TOTAL.inc(status="error")
+                return False
+
+            DISCORD_WEBHOOK_POSTS_TOTAL.inc(status=response.status_code)
+            self._update_rate_limit(response)
+            if response.status_code == 429:
+                retry_after_sec = self._retry_after_sec(response)
+                print(f"[경고] Discord 웹훅 요청 제한(429). {retry_after_sec:.1f}초 후 재시도합니다. (시도 {attempt + 1}/{self.max_rate_limit_retries + 1})")
+                self._next_request_at = max(self._next_request_at, time.monotonic() + retry_after_sec)
+                continue
+            try:
+                response.raise_for_status() # HTTP 오류(4xx, 5xx)가 발생하면 예외 발생
+            except requests.exceptions.RequestException as e:
+                print(f"[오류] Discord 알림 전송 실패: {e}")
+                return False
+            print(f"성공: Discord 알림 전송 완료. 상태 코드: {response.status_code}")
+            return True
+
+        print("[오류] Discord 알림 전송 실패: 요청 제한(429)이 계속되어 전송을 포기합니다.")
+        return False
+
+    def _update_rate_limit(self, response):
+        """남은 요청 수가 0이면 초기화될 때까지 다음 요청을 미룹니다."""
+        if response.headers.get("X-RateLimit-Remaining") != "0":
+            return
+        try:
+            reset_after_sec = float(response.headers.get("X-RateLimit-Reset-After", "0"))
+        except ValueError:
+            return
+        self._next_request_at = max(self._next_request_at, time.monotonic() + reset_after_sec)
+
+    @staticmethod
+    def _retry_after_sec(response) -> float:
+        """429 응답의 재시도 대기 시간(초). 본문의 retry_after, Retry-After 헤더 순으로 확인하고 없으면 1초입니다."""
+        try:
+            return max(0.0, float(response.json().get("retry_after")))
+        except (ValueError, TypeError, AttributeError):
+            pass
+        try:
+            return max(0.0, float(response.headers.get("Retry-After")))
+        except (ValueError, TypeError):
+            return 1.0
+
+
+_notification_queue: DiscordNotificationQueue | None = None
+_notification_queue_lock = threading.Lock()
+
+
+def get_notification_queue() -> DiscordNotificationQueue:
+    """알림 전송 대기열을 반환합니다. (처음 호출할 때 생성하고 백그라운드 전송 스레드를 시작)"""
+    global _notification_queue
+    if _notification_queue is None:
+        with _notification_queue_lock:
+            if _notification_queue is None:
+                _notification_queue = DiscordNotificationQueue(
+                    max_size=DISCORD_QUEUE_MAX_SIZE,
+                    coalesce_sec=DISCORD_COALESCE_SEC,
+                    request_timeout_sec=DISCORD_REQUEST_TIMEOUT_SEC,
+                    max_rate_limit_retries=DISCORD_MAX_RATE_LIMIT_RETRIES
+                )
+                atexit.register(_notification_queue.flush, _EXIT_FLUSH_TIMEOUT_SEC)
+    return _notification_queue
+
+
+def flush_discord_notifications(timeout: float | None = None) -> bool:
+    """대기 중인 Discord 알림을 바로 보내고, 모두 전송될 때까지 최대 timeout초 기다립니다."""
+    if _notification_queue is None:
+        return True
+    return _notification_queue.flush(timeout)
+
 
 def send_discord_notification(message: str, subject: str = "자동화 스크립트 알림"):
     """
-    Discord 웹훅을 통해 메시지를 전송합니다.
+    Discord 웹훅으로 보낼 메시지를 전송 대기열에 넣고 바로 반환합니다. (전송은 백그라운드 스레드에서 진행)
     웹훅 URL은 환경 변수 'DISCORD_WEBHOOK_URL'에서 가져옵니다.
+    대기열에 넣었으면 True, 웹훅 URL이 없거나 대기열이 가득 찼으면 False를 반환합니다.
     """
     WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL")
     if not WEBHOOK_URL:
         print("[경고] Discord 웹훅 URL 환경 변수(DISCORD_WEBHOOK_URL)가 설정되지 않았습니다. 알림을 보낼 수 없습니다.")
+        DISCORD_SENDS_TOTAL.inc(result="skipped")
         return False
 
-    # Discord에 보낼 JSON 데이터 구성
-    # content: 메시지 내용
-    # username: 웹훅 메시지의 발신자 이름 (선택 사항)
-    # avatar_url: 웹훅 메시지의 프로필 사진 URL (선택 사항)
-    # embeds: 더 구조화된 메시지를 보내고 싶을 때 사용 (선택 사항)
-    payload = {
-        "username": "스크립트 실행 알림",
-        "content": f"**[{subject}]**\n{message}" # 제목을 메시지 내용에 포함
-    }
-
-    headers = {'Content-Type': 'application/json'}
-
-    try:
-        response = requests.post(WEBHOOK_URL, headers=headers, json=payload)
-        response.raise_for_status() # HTTP 오류(4xx, 5xx)가 발생하면 예외 발생
-        print(f"성공: Discord 알림 전송 완료. 상태 코드: {response.status_code}")
-        return True
-    except requests.exceptions.RequestException as e:
-        print(f"[오류] Discord 알림 전송 실패: {e}")
-        return False
-    
+    return get_notification_queue().submit(f"**[{subject}]**\n{message}") # 제목을 메시지 내용에 포함
+
 def send_discord_success_notification(message: str, subject: str = "스크립트 성공 알림"):
     """
     Discord 웹훅을 통해 성공 알림 메시지를 전송합니다.
@@ -69,4 +311,6 @@ if __name__ == '__main__':
     test_message_failure = "중요한 스크립트 실행 중 오류가 발생했습니다. 즉시 확인해주세요!"
     send_discord_failure_notification(test_message_failure)
 
+    # 알림은 백그라운드에서 전송되므로 종료 전에 전송이 끝날 때까지 기다립니다.
+    flush_discord_notifications(timeout=30)
     print("\n--- Discord 알림 테스트 완료 ---")
\ No newline at end of file
@@ -1,7 +1,13 @@
 # coupang_lib/git_utils.py
 import subprocess
+import threading
+from datetime import datetime
+
 from coupang_lib.logger import logger
 
+# git 명령어 하나의 최대 실행 시간(초). 원격 저장소가 응답하지 않아도 확인 스레드가 멈춰 있지 않도록 합니다.
+GIT_COMMAND_TIMEOUT_SEC = 60
+
 def _run_git_command(command: list[str]) -> str | None:
     """
     Git 명령어를 실행하고 표준 출력을 반환합니다.
@@ -14,7 +20,8 @@ def _run_git_command(command: list[str]) -> str | None:
             capture_output=True,
             text=True,
             check=True,
-            encoding='utf-8'
+            encoding='utf-8',
+            timeout=GIT_COMMAND_TIMEOUT_SEC
         )
         if result.stderr:
             logger.debug(f"Git 명령어 표준 에러 출력 (경고/정보): {' '.join(command)} -> {result.stderr.strip()}")
@@ -24,6 +31,9 @@ def _run_git_command(command: list[str]) -> str | None:
         logger.error(f"Git 명령어 실행 오류: {' '.join(command)}")
         logger.error(f"오류 코드: {e.returncode}, 표준 출력: {e.stdout.strip()}, 표준 에러: {e.stderr.strip()}")
         return None
+    except subprocess.TimeoutExpired:
+        logger.error(f"Git 명령어가 {GIT_COMMAND_TIMEOUT_SEC}초 안에 끝나지 않아 중단했습니다: {' '.join(command)}")
+        return None
     except FileNotFoundError:
         logger.error(f"Git 명령어를 찾을 수 없습니다. Git이 설치되어 있고 PATH에 추가되었는지 확인하세요.")
         return None
@@ -100,6 +110,75 @@ def check_for_git_updates() -> str:
     
     return discord_update_message
 
+class GitUpdateChecker:
+    """
+    원격 업데이트 확인(check_for_git_updates)을 백그라운드 스레드에서 interval_sec마다 실행하고,
+    마지막 결과 메시지와 확인 시각을 보관합니다. 쿠폰 사이클은 cached_message()로 보관된 결과만 읽으므로
+    git 명령어 실행이나 네트워크 지연을 기다리지 않습니다.
+    """
+    def __init__(self, interval_sec: float):
+        self.interval_sec = interval_sec
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._message: str | None = None
+        self._checked_at: datetime | None = None
+
+    def start(self):
+        """확인 스레드를 시작합니다. 첫 확인도 스레드에서 바로 실행합니다."""
+        self._thread = threading.Thread(target=self._run, name="git-update-checker", daemon=True)
+        self._thread.start()
+        logger.info(f"원격 업데이트 확인 시작: {self.interval_sec / 60:g}분마다 확인")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def check_now(self) -> str:
+        """업데이트를 바로 확인하고 결과를 보관한 뒤 반환합니다."""
+        message = check_for_git_updates()
+        with self._lock:
+            self._message = message
+            self._checked_at = datetime.now()
+        return message
+
+    def cached_message(self) -> str:
+        """마지막 확인 결과에 확인 시각을 덧붙여 반환합니다. 아직 확인 결과가 없으면 빈 문자열을 반환합니다."""
+        with self._lock:
+            message, checked_at = self._message, self._checked_at
+        if message is None:
+            return ""
+        return f"{message}\n(업데이트 확인 시각: {checked_at.strftime('%Y-%m-%d %H:%M')})"
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.check_now()
+            except Exception as e:
+                logger.error(f"원격 업데이트 확인 중 예상치 못한 오류: {e}", exc_info=True)
+            self._stop_event.wait(self.interval_sec)
+
+
+_update_checker: GitUpdateChecker | None = None
+
+
+def start_git_update_checker(interval_sec: float) -> GitUpdateChecker:
+    """원격 업데이트 확인 스레드를 시작합니다. (get_cached_update_message로 결과 조회)"""
+    global _update_checker
+    if _update_checker is None:
+        _update_checker = GitUpdateChecker(interval_sec)
+        _update_checker.start()
+    return _update_checker
+
+
+def get_cached_update_message() -> str:
+    """마지막 원격 업데이트 확인 결과(Discord 메시지용)를 반환합니다. 확인 스레드가 없거나 아직 결과가 없으면 빈 문자열입니다."""
+    if _update_checker is None:
+        return ""
+    return _update_checker.cached_message()
+
+
 if __name__ == "__main__":
     print("--- 업데이트 유틸리티 테스트 시작 (디버그 로그 출력) ---")
     message = check_for_git_updates()
@@ -1,22 +1,36 @@
 # coupang_lib/item_loader.py
-import pandas as pd
+import bisect
+import csv
+from array import array
+from typing import Iterable, Iterator, List, Tuple
+
+from coupang_lib import json_codec
+
+# 잘못된 행을 출력할 때 최대 개수 (나머지는 개수만 출력)
+MAX_REPORTED_MALFORMED_ROWS = 20
+# vendorItemId가 가질 수 있는 최댓값 (부호 있는 64비트 정수)
+_MAX_ITEM_ID = 2**63 - 1
 
 def load_vendor_items_from_csv(file_path="vendor_items.csv") -> list:
     """
     제목 열이 없는 CSV 파일에서 vendor items를 로드합니다.
     CSV 파일은 단일 컬럼으로 구성되며, 그 값이 상품 ID로 직접 사용됩니다.
+    파일을 한 줄씩 읽으며 첫 번째 열만 사용하고, 빈 줄은 건너뜁니다. (pandas 없이 표준 csv 모듈 사용)
     """
     try:
-        df = pd.read_csv(file_path, header=None, names=['item_id'])
-        if df.empty:
+        vendor_items_list = []
+        # utf-8-sig: 엑셀 등에서 저장한 파일의 BOM을 제거합니다.
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            for row in csv.reader(f):
+                if not row or not row[0].strip():
+                    continue
+                # API는 보통 ID를 문자열로 받으므로, 문자열 ID 리스트를 반환합니다.
+                vendor_items_list.append(row[0].strip())
+
+        if not vendor_items_list:
             print(f"오류: '{file_path}' 파일에 데이터가 없습니다.")
             return []
 
-        # 이제 딕셔너리 리스트가 아닌, ID 값의 리스트를 반환합니다.
-        # ID가 숫자로 필요하다면 int(), 문자열로 필요하다면 str()로 변환합니다.
-        # API는 보통 ID를 문자열로 받으므로, str()이 안전합니다.
-        vendor_items_list = df['item_id'].astype(str).tolist() 
-
         print(f"CSV 파일 '{file_path}'에서 VENDOR_ITEMS 로드 완료 (단순 ID 리스트).")
         return vendor_items_list
     except FileNotFoundError:
@@ -24,4 +38,168 @@ def load_vendor_items_from_csv(file_path="vendor_items.csv") -> list:
         return []
     except Exception as e:
         print(f"오류: CSV 파일 로드 중 문제가 발생했습니다: {e}")
-        return []
\ No newline at end of file
+        return []
+
+
+class VendorItemIndex:
+    """
+    판매자 품목 ID(vendorItemId)를 정렬/중복 제거된 64비트 정수 배열(array('q'))로 보관하는 인덱스입니다.
+    품목당 8바이트만 사용하므로 수십만 개 품목도 메모리를 적게 차지하며,
+    포함 여부 확인은 이진 탐색, 집합 연산(difference 등)은 정렬된 배열 병합으로 처리합니다.
+    슬라이스(index[a:b])는 VendorItemIndex를 반환하므로 split_into_batches로 그대로 나눌 수 있습니다.
+    """
+    __slots__ = ("_ids",)
+
+    def __init__(self, item_ids: Iterable[int] = ()):
+        self._ids = array('q', sorted(set(int(item_id) for item_id in item_ids)))
+
+    @classmethod
+    def _from_sorted_array(cls, ids: array) -> "VendorItemIndex":
+        index = cls.__new__(cls)
+        index._ids = ids
+        return index
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return VendorItemIndex._from_sorted_array(self._ids[key])
+        return self._ids[key]
+
+    def __contains__(self, item_id) -> bool:
+        try:
+            value = int(item_id)
+        except (TypeError, ValueError):
+            return False
+        position = bisect.bisect_left(self._ids, value)
+        return position < len(self._ids) and self._ids[position] == value
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, VendorItemIndex) and self._ids == other._ids
+
+    def __repr__(self) -> str:
+        return f"VendorItemIndex({len(self._ids)}개 품목)"
+
+    @property
+    def memory_bytes(self) -> int:
+        """ID 배열이 차지하는 메모리(바이트)입니다."""
+        return self._ids.itemsize * len(self._ids)
+
+    def _merge(self, other: "VendorItemIndex", keep_left_only: bool, keep_both: bool, keep_right_only: bool) -> "VendorItemIndex":
+        left, right = self._ids, other._ids
+        result = array('q')
+        i = j = 0
+        while i < len(left) and j < len(right):
+            if left[i] < right[j]:
+                if keep_left_only:
+                    result.append(left[i])
+                i += 1
+            elif left[i] > right[j]:
+                if keep_right_only:
+                    result.append(right[j])
+                j += 1
+            else:
+                if keep_both:
+                    result.append(left[i])
+                i += 1
+                j += 1
+        if keep_left_only:
+            result.extend(left[i:])
+        if keep_right_only:
+            result.extend(right[j:])
+        return VendorItemIndex._from_sorted_array(result)
+
+    def difference(self, other: "VendorItemIndex") -> "VendorItemIndex":
+        """이 인덱스에는 있고 other에는 없는 품목 (예: 지난 사이클 이후 새로 추가된 품목)"""
+        return self._merge(other, keep_left_only=True, keep_both=False, keep_right_only=False)
+
+    def intersection(self, other: "VendorItemIndex") -> "VendorItemIndex":
+        return self._merge(other, keep_left_only=False, keep_both=True, keep_right_only=False)
+
+    def union(self, other: "VendorItemIndex") -> "VendorItemIndex":
+        return self._merge(other, keep_left_only=True, keep_both=True, keep_right_only=True)
+
+    def diff(self, previous: "VendorItemIndex") -> Tuple["VendorItemIndex", "VendorItemIndex"]:
+        """previous와 비교하여 (추가된 품목, 제거된 품목)을 반환합니다."""
+        return self.difference(previous), previous.difference(self)
+
+    def to_id_strings(self) -> List[str]:
+        """기존 load_vendor_items_from_csv와 같은 문자열 ID 리스트로 변환합니다."""
+        return [str(item_id) for item_id in self._ids]
+
+    def apply_request_body(self) -> bytes:
+        """
+        쿠폰 품목 적용 API 요청 바디({"vendorItems": [...]})를 JSON 바이트로 바로 만듭니다.
+        ID는 기존과 같이 문자열로 전송합니다. (CoupangApiClient는 bytes 바디를 그대로 전송)
+        ID마다 str()을 호출하지 않고 정수 배열을 JSON 백엔드로 한 번에 직렬화한 뒤, 구분자만 바꿔 문자열 배열로 만듭니다.
+        """
+        if not self._ids:
+            return b'{"vendorItems":[]}'
+        id_list = json_codec.dumps(self._ids.tolist())  # b'[1,2,3]'
+        return b'{"vendorItems":["' + id_list[1:-1].replace(b',', b'","') + b'"]}'
+
+
+def parse_vendor_item_ids(lines: Iterable[str], start_line: int = 1) -> Tuple[VendorItemIndex, List[Tuple[int, str]], int]:
+    """
+    CSV 행들에서 첫 번째 열을 vendorItemId로 읽어 인덱스를 만듭니다.
+    (인덱스, 잘못된 행 목록 [(줄 번호, 원래 값)], 중복 ID 개수)를 반환합니다. 빈 줄은 건너뜁니다.
+    파일 중간부터 읽는 경우 start_line으로 첫 행의 줄 번호를 지정합니다.
+    """
+    ids = array('q')
+    malformed_rows = []
+    for line_number, row in enumerate(csv.reader(lines), start=start_line):
+        if not row or not row[0].strip():
+            continue
+        value = row[0].strip()
+        # isdigit()은 "²" 같은 비ASCII 숫자도 허용하므로(int() 변환 실패) ASCII 숫자만 받습니다.
+        if not (value.isascii() and value.isdigit()) or int(value) == 0 or int(value) > _MAX_ITEM_ID:
+            malformed_rows.append((line_number, row[0]))
+            continue
+        ids.append(int(value))
+
+    parsed_count = len(ids)
+    unique_ids = array('q', sorted(set(ids)))
+    return VendorItemIndex._from_sorted_array(unique_ids), malformed_rows, parsed_count - len(unique_ids)
+
+
+def load_vendor_item_index(file_path="vendor_items.csv") -> VendorItemIndex:
+    """
+    vendor_items.csv를 VendorItemIndex로 로드합니다.
+    숫자가 아닌 ID 등 잘못된 행은 줄 번호와 함께 출력하고 건너뛰며, 중복 ID는 하나만 남깁니다.
+    파일이 없거나 읽을 수 없으면 빈 인덱스를 반환합니다.
+    """
+    try:
+        # utf-8-sig: 엑셀 등에서 저장한 파일의 BOM을 제거합니다.
+        with open(file_path, newline='', encoding='utf-8-sig') as f:
+            index, malformed_rows, duplicate_count = parse_vendor_item_ids(f)
+    except FileNotFoundError:
+        print(f"오류: '{file_path}' 파일을 찾을 수 없습니다. 파일 경로를 확인해주세요.")
+        return VendorItemIndex()
+    except Exception as e:
+        print(f"오류: CSV 파일 로드 중 문제가 발생했습니다: {e}")
+        return VendorItemIndex()
+
+    report_malformed_rows(file_path, malformed_rows)
+    if duplicate_count:
+        print(f"[주의] '{file_path}'에서 중복된 품목 ID {duplicate_count}개를 제외했습니다.")
+    if not index:
+        print(f"오류: '{file_path}' 파일에 유효한 품목 ID가 없습니다.")
+        return index
+
+    print(f"CSV 파일 '{file_path}'에서 VENDOR_ITEMS 로드 완료 (고유 품목 {len(index)}개).")
+    return index
+
+
+def report_malformed_rows(file_path: str, malformed_rows: List[Tuple[int, str]]):
+    """잘못된 행을 줄 번호와 함께 출력합니다. (최대 MAX_REPORTED_MALFORMED_ROWS개)"""
+    if not malformed_rows:
+        return
+    print(f"[경고] '{file_path}'에서 올바르지 않은 품목 ID {len(malformed_rows)}개를 건너뜁니다.")
+    for line_number, value in malformed_rows[:MAX_REPORTED_MALFORMED_ROWS]:
+        print(f"  - {line_number}번째 줄: {value!r}")
+    if len(malformed_rows) > MAX_REPORTED_MALFORMED_ROWS:
+        print(f"  ... 외 {len(malformed_rows) - MAX_REPORTED_MALFORMED_ROWS}개")
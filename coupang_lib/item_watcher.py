@@ -0,0 +1,134 @@
+# coupang_lib/item_watcher.py
+import hashlib
+import os
+import threading
+from typing import Tuple
+
+from coupang_lib.item_loader import VendorItemIndex, parse_vendor_item_ids, MAX_REPORTED_MALFORMED_ROWS
+from coupang_lib.logger import logger
+
+
+def _file_signature(file_path: str) -> Tuple[int, int] | None:
+    """파일 변경 감지에 사용할 (수정 시각(ns), 크기)를 반환합니다. 파일이 없으면 None입니다."""
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class VendorItemWatcher:
+    """
+    vendor_items.csv의 수정 시각과 크기를 주기적으로 확인하여, 바뀌면 백그라운드 스레드에서 다시 읽어
+    새 VendorItemIndex를 준비(staging)해 둡니다. 준비된 인덱스는 take_staged()로 꺼내 사이클 사이에 교체합니다.
+
+    파일 끝에 줄만 추가된 경우(기존 내용이 그대로인 경우)에는 추가된 부분만 파싱하여 기존 인덱스와 합칩니다.
+    읽는 도중 파일이 다시 바뀌었거나 유효한 품목이 하나도 없으면 이번 변경은 반영하지 않고 다음 확인 때 다시 시도합니다.
+    """
+    def __init__(self, file_path: str, interval_sec: float):
+        self.file_path = file_path
+        self.interval_sec = interval_sec
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._signature: Tuple[int, int] | None = None
+        self._index = VendorItemIndex()
+        # 추가만 된 경우를 알아보기 위한 직전 파일 내용 정보 (길이, 해시, 줄 수)
+        self._content_length = 0
+        self._content_digest = b""
+        self._line_count = 0
+        self._staged: VendorItemIndex | None = None
+        # 시작할 때 파일을 읽지 못했으면, 처음으로 읽는 데 성공한 내용을 기준으로 삼는 대신 변경으로 보고 준비합니다.
+        self._stage_first_load = False
+
+    def start(self):
+        """
+        현재 파일 내용을 기준으로 삼고 감시 스레드를 시작합니다.
+        파일을 읽다가 오류가 나도 감시는 시작하며, 이후 확인에서 읽는 데 성공하면 그 내용을 다음 사이클부터 반영합니다.
+        """
+        try:
+            self.poll()
+        except Exception as e:
+            self._stage_first_load = True
+            logger.error(f"[실패] 품목 파일 '{self.file_path}' 초기 확인 중 오류: {e}. 다음 확인 때 다시 읽습니다.", exc_info=True)
+        self._thread = threading.Thread(target=self._run, name="vendor-item-watcher", daemon=True)
+        self._thread.start()
+        logger.info(f"품목 파일 변경 감시 시작: '{self.file_path}' ({self.interval_sec}초마다 확인)")
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def take_staged(self) -> VendorItemIndex | None:
+        """변경 감지 후 준비된 새 인덱스를 꺼냅니다. 준비된 것이 없으면 None을 반환합니다."""
+        with self._lock:
+            staged, self._staged = self._staged, None
+        return staged
+
+    def _run(self):
+        while not self._stop_event.wait(self.interval_sec):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error(f"[실패] 품목 파일 '{self.file_path}' 변경 확인 중 오류: {e}", exc_info=True)
+
+    def poll(self) -> bool:
+        """파일이 바뀌었는지 확인하고, 바뀌었으면 다시 읽어 새 인덱스를 준비합니다. 새 인덱스를 준비했으면 True를 반환합니다."""
+        signature = _file_signature(self.file_path)
+        if signature is None or signature == self._signature:
+            return False
+
+        with open(self.file_path, "rb") as f:
+            data = f.read()
+        if _file_signature(self.file_path) != signature:
+            logger.info(f"품목 파일 '{self.file_path}'이 읽는 도중 변경되어 다음 확인 때 다시 읽습니다.")
+            return False
+
+        index, malformed_rows, appended_only = self._parse(data)
+        self._log_malformed_rows(malformed_rows)
+        if not index:
+            logger.warning(f"[경고] 품목 파일 '{self.file_path}'에 유효한 품목 ID가 없어 변경을 반영하지 않습니다.")
+            return False
+
+        is_first_load = self._signature is None
+        previous_index = self._index
+        self._signature = signature
+        self._content_length = len(data)
+        self._content_digest = hashlib.blake2b(data, digest_size=16).digest()
+        self._line_count = data.count(b"\n")
+        self._index = index
+        if (is_first_load and not self._stage_first_load) or previous_index == index:
+            return False
+
+        with self._lock:
+            self._staged = index
+        added, removed = index.diff(previous_index)
+        parse_mode = "추가된 줄만 파싱" if appended_only else "전체 파싱"
+        logger.info(f"[품목 변경 감지] '{self.file_path}': 추가 {len(added)}개, 제거 {len(removed)}개, 총 {len(index)}개 ({parse_mode}). 다음 사이클부터 적용합니다.")
+        return True
+
+    def _parse(self, data: bytes):
+        """(인덱스, 잘못된 행 목록, 추가된 부분만 파싱했는지 여부)를 반환합니다."""
+        previous_length = self._content_length
+        if (
+            self._index
+            and len(data) > previous_length
+            and data[previous_length - 1:previous_length] == b"\n"
+            and hashlib.blake2b(data[:previous_length], digest_size=16).digest() == self._content_digest
+        ):
+            tail = data[previous_length:].decode("utf-8").splitlines(keepends=True)
+            appended_index, malformed_rows, _ = parse_vendor_item_ids(tail, start_line=self._line_count + 1)
+            return self._index.union(appended_index), malformed_rows, True
+
+        # utf-8-sig: 엑셀 등에서 저장한 파일의 BOM을 제거합니다.
+        lines = data.decode("utf-8-sig").splitlines(keepends=True)
+        index, malformed_rows, _ = parse_vendor_item_ids(lines)
+        return index, malformed_rows, False
+
+    def _log_malformed_rows(self, malformed_rows):
+        if not malformed_rows:
+            return
+        logger.warning(f"[경고] 품목 파일 '{self.file_path}'에서 올바르지 않은 품목 ID {len(malformed_rows)}개를 건너뜁니다.")
+        for line_number, value in malformed_rows[:MAX_REPORTED_MALFORMED_ROWS]:
+            logger.warning(f"  - {line_number}번째 줄: {value!r}")
@@ -0,0 +1,48 @@
+# coupang_lib/json_codec.py
+"""
+API 요청 바디를 JSON 바이트로 변환하고, 응답 JSON을 파싱합니다.
+JSON_BACKEND가 "auto"(기본값)이면 orjson이 설치되어 있을 때 orjson을, 없으면 표준 json 모듈을 사용합니다.
+("orjson"으로 지정했는데 설치되어 있지 않으면 경고를 남기고 표준 json을 사용합니다.)
+"""
+import json
+from typing import Any, Callable
+
+from coupang_lib.config import JSON_BACKEND
+from coupang_lib.logger import logger
+
+
+def _stdlib_dumps(value: Any) -> bytes:
+    # 공백 없이 한 번만 직렬화합니다. (한글은 이스케이프하지 않고 UTF-8로 전송)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _select_backend(name: str) -> tuple[str, Callable[[Any], bytes], Callable[[bytes | str], Any]]:
+    if name in ("auto", "orjson"):
+        try:
+            import orjson
+        except ImportError:
+            if name == "orjson":
+                logger.warning("JSON_BACKEND=orjson이지만 orjson이 설치되어 있지 않아 표준 json 모듈을 사용합니다. (pip install orjson)")
+        else:
+            return "orjson", orjson.dumps, orjson.loads
+    elif name != "json":
+        logger.warning(f"알 수 없는 JSON_BACKEND '{name}'. 표준 json 모듈을 사용합니다.")
+    return "json", _stdlib_dumps, json.loads
+
+
+# 실제로 사용 중인 백엔드 이름 ("orjson" 또는 "json")
+BACKEND, _dumps, _loads = _select_backend(JSON_BACKEND)
+
+
+def dumps(value: Any) -> bytes:
+    """값을 공백 없는 UTF-8 JSON 바이트로 변환합니다."""
+    return _dumps(value)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    JSON을 파싱합니다. bytes는 UTF-8로 보고 문자열로 바꾸지 않고 바로 파싱합니다.
+    형식 오류와 UTF-8이 아닌 바이트는 ValueError(json.JSONDecodeError 또는 UnicodeDecodeError)로 발생합니다.
+    """
+    return _loads(data)
+
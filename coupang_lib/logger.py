@@ -1,11 +1,111 @@
 # coupang_lib/logger.py
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
 import os
+import queue
+from datetime import datetime
+from typing import Any, Dict
+
+from coupang_lib.config import LOG_FORMAT
+
+# 로그 레코드에 구조화 필드로 붙일 실행 맥락 (사이클 ID, 테넌트 등). 스레드/asyncio 작업마다 따로 유지됩니다.
+_log_context: contextvars.ContextVar[Dict[str, Any]] = contextvars.ContextVar("log_context", default={})
+
+# JSON 형식 로그에 그대로 옮기는 레코드 속성 (logger.info(..., extra={"requested_id": ...})로 지정)
+_STRUCTURED_FIELDS = ("cycle_id", "tenant", "requested_id", "coupon_id")
+
+
+def set_log_context(**fields):
+    """현재 스레드(또는 asyncio 작업)에서 남기는 로그에 붙일 필드를 지정합니다. 값이 None인 필드는 제거합니다."""
+    context = dict(_log_context.get())
+    for key, value in fields.items():
+        if value is None:
+            context.pop(key, None)
+        else:
+            context[key] = value
+    _log_context.set(context)
+
+
+class LazyJson:
+    """
+    로그 메시지 인자로 넘기면 실제로 기록될 때(로그 스레드에서) JSON 문자열로 변환됩니다.
+    예: logger.debug("응답 본문: %s", LazyJson(res)) - 해당 레벨이 꺼져 있으면 변환하지 않습니다.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __str__(self) -> str:
+        return json.dumps(self.value, indent=2, ensure_ascii=False, default=str)
+
+
+class LazyText:
+    """
+    이미 인코딩된 바이트(예: 요청 바디 JSON)를 기록할 때(로그 스레드에서) 문자열로 변환합니다.
+    limit 바이트를 넘는 부분은 잘라내고 생략한 바이트 수만 표시합니다. (다시 직렬화하지 않음)
+    """
+    __slots__ = ("data", "limit", "encoding")
+
+    def __init__(self, data: bytes | bytearray | memoryview, limit: int = 2048, encoding: str = "utf-8"):
+        self.data = data
+        self.limit = limit
+        self.encoding = encoding
+
+    def __str__(self) -> str:
+        data = memoryview(self.data)
+        text = bytes(data[:self.limit]).decode(self.encoding, errors="replace")
+        if data.nbytes > self.limit:
+            text += f"... ({data.nbytes - self.limit}바이트 생략)"
+        return text
+
+
+class _ContextFilter(logging.Filter):
+    """로그를 남긴 스레드의 실행 맥락 필드를 레코드에 복사합니다. (레코드는 이후 로그 스레드에서 출력됨)"""
+    def filter(self, record: logging.LogRecord) -> bool:
+        for key, value in _log_context.get().items():
+            if not hasattr(record, key):
+                setattr(record, key, value)
+        return True
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    레코드를 포맷하지 않고 그대로 대기열에 넣습니다. (같은 프로세스 안의 대기열이므로 직렬화 불필요)
+    메시지 문자열 생성과 LazyJson 변환은 QueueListener 스레드에서 출력할 때 이루어집니다.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """로그 레코드를 한 줄짜리 JSON으로 출력합니다. 사이클 ID, 테넌트, requestedId 등 구조화 필드를 포함합니다."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage().strip(),
+        }
+        for key in _STRUCTURED_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
 
 def setup_logging():
     """
     애플리케이션 전반에 걸쳐 사용할 로깅을 설정합니다.
     콘솔과 파일에 로그를 출력하도록 구성합니다.
+    로그는 대기열(QueueHandler)에 넣기만 하고, 실제 포맷과 출력은 백그라운드 스레드(QueueListener)가 처리합니다.
+    LOG_FORMAT=json이면 파일 로그를 JSON Lines 형식으로 기록합니다.
     """
     # 로그 파일 경로 설정
     log_dir = "logs"
@@ -16,6 +116,10 @@ def setup_logging():
     logger = logging.getLogger("coupang_automation")
     logger.setLevel(logging.DEBUG) # 가장 낮은 DEBUG 레벨부터 모든 로그를 처리
 
+    # 기존 핸들러가 있다면 다시 설정하지 않음 (중복 로깅 방지)
+    if logger.handlers:
+        return logger
+
     # 핸들러 설정
     # 1. 콘솔 핸들러: 화면에 로그 출력
     console_handler = logging.StreamHandler()
@@ -23,9 +127,8 @@ def setup_logging():
 
     # 2. 파일 핸들러: 로그 파일에 저장 (RotatingFileHandler 사용하여 파일 크기 제한)
     # 1MB까지 기록하고, 5개까지 백업 파일을 유지합니다.
-    from logging.handlers import RotatingFileHandler
-    file_handler = RotatingFileHandler(
-        log_file_path, 
+    file_handler = logging.handlers.RotatingFileHandler(
+        log_file_path,
         maxBytes=1024*1024, # 1MB
         backupCount=5,     # 최대 5개 파일
         encoding='utf-8'   # 한글 로그를 위해 utf-8 인코딩
@@ -35,14 +138,20 @@ def setup_logging():
     # 포맷터 설정
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_handler.setFormatter(formatter)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(JsonLinesFormatter() if LOG_FORMAT == "json" else formatter)
+
+    # 3. 대기열 핸들러: 로그를 남기는 스레드는 대기열에 넣기만 합니다.
+    log_queue = queue.SimpleQueue()
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(_ContextFilter())
+    logger.addHandler(queue_handler)
 
-    # 기존 핸들러가 있다면 제거 (중복 로깅 방지)
-    if not logger.handlers:
-        logger.addHandler(console_handler)
-        logger.addHandler(file_handler)
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    # 프로세스 종료 시 대기열에 남은 로그를 모두 출력합니다.
+    atexit.register(listener.stop)
 
     return logger
 
 # 스크립트 전반에서 사용할 로거 인스턴스를 초기화
-logger = setup_logging()
\ No newline at end of file
+logger = setup_logging()
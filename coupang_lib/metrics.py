@@ -0,0 +1,236 @@
+# coupang_lib/metrics.py
+"""
+자동화 데몬의 실행 지표(카운터, 히스토그램)를 수집하고 Prometheus 텍스트 형식으로 노출합니다.
+외부 라이브러리 없이 표준 라이브러리만 사용합니다.
+
+METRICS_PORT 환경 변수를 지정하면 main.py 실행 시 http://127.0.0.1:<포트>/metrics 에서 지표를 조회할 수 있습니다.
+"""
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterator, List, Sequence, Tuple
+
+from coupang_lib.logger import logger
+
+# 초 단위 히스토그램 기본 구간 (API 호출처럼 짧은 작업용)
+DEFAULT_BUCKETS_SEC = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 사이클 단계나 요청 처리 완료까지처럼 오래 걸리는 작업용 구간
+LONG_BUCKETS_SEC = (1.0, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, 900.0, 1800.0, 3600.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str], extra: Tuple[str, str] | None = None) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(label_names)
+        self._lock = threading.Lock()
+
+    def _label_values(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"{self.name} 지표의 라벨은 {self.label_names}이어야 합니다. (입력: {tuple(labels)})")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.metric_type}"]
+        lines.extend(self._render_samples())
+        return lines
+
+    def _render_samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가하는 카운터입니다."""
+    metric_type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._label_values(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        with self._lock:
+            return self._values.get(self._label_values(labels), 0.0)
+
+    def _render_samples(self) -> List[str]:
+        with self._lock:
+            return [
+                f"{self.name}{_format_labels(self.label_names, key)} {_format_number(value)}"
+                for key, value in sorted(self._values.items())
+            ]
+
+
+class Histogram(_Metric):
+    """관측값을 구간별로 누적하는 히스토그램입니다. (_bucket, _sum, _count 시계열로 노출)"""
+    metric_type = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS_SEC):
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple[str, ...], List[float]] = {}  # 라벨 → [구간별 개수..., +Inf 개수, 합계]
+
+    def observe(self, value: float, **labels):
+        key = self._label_values(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._series[key] = series
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels) -> Iterator[None]:
+        """with 블록의 실행 시간(초)을 관측합니다. 예외가 발생해도 기록합니다."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        with self._lock:
+            series = self._series.get(self._label_values(labels))
+            return int(sum(series[:-1])) if series else 0
+
+    def _render_samples(self) -> List[str]:
+        lines = []
+        with self._lock:
+            for key, series in sorted(self._series.items()):
+                cumulative = 0.0
+                for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), series[:-1]):
+                    cumulative += bucket_count
+                    lines.append(
+                        f"{self.name}_bucket{_format_labels(self.label_names, key, ('le', _format_number(upper_bound)))} {_format_number(cumulative)}"
+                    )
+                lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {_format_number(series[-1])}")
+                lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {_format_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """지표를 이름으로 등록하고 한꺼번에 Prometheus 텍스트 형식으로 출력합니다."""
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"이미 등록된 지표입니다: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS_SEC) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# --- 쿠팡 API 호출 ---
+API_REQUESTS_TOTAL = REGISTRY.counter(
+    "coupang_api_requests_total", "CoupangApiClient.send_request 호출 수 (HTTP 상태 코드별, 네트워크 오류는 error, 회로 차단으로 보내지 않은 요청은 circuit_open)",
+    ("method", "endpoint", "status")
+)
+API_REQUEST_DURATION_SECONDS = REGISTRY.histogram(
+    "coupang_api_request_duration_seconds", "CoupangApiClient.send_request 소요 시간(초, 속도 제한 대기 포함)",
+    ("method", "endpoint")
+)
+CIRCUIT_TRANSITIONS_TOTAL = REGISTRY.counter(
+    "coupang_api_circuit_transitions_total", "API Gateway 회로 차단기 상태 전환 수 (엔드포인트별, *는 게이트웨이 전체)",
+    ("endpoint", "state")
+)
+
+# --- requestedId 상태 폴링 ---
+STATUS_POLLS_TOTAL = REGISTRY.counter(
+    "coupang_status_polls_total", "requestedId 상태 조회 시도 수 (조회 결과 상태별)", ("status",)
+)
+STATUS_RESOLUTION_SECONDS = REGISTRY.histogram(
+    "coupang_status_resolution_seconds", "requestedId 등록부터 최종 상태(DONE/FAIL/ERROR/TIMEOUT)까지 걸린 시간(초)",
+    ("status",), LONG_BUCKETS_SEC
+)
+
+# --- 쿠폰 갱신 사이클 ---
+CYCLE_PHASE_DURATION_SECONDS = REGISTRY.histogram(
+    "coupang_cycle_phase_duration_seconds", "쿠폰 갱신 사이클 단계별 소요 시간(초)", ("tenant", "phase"), LONG_BUCKETS_SEC
+)
+CYCLES_TOTAL = REGISTRY.counter(
+    "coupang_cycles_total", "종료된 쿠폰 갱신 사이클 수 (테넌트/결과별, 이전 회차가 실행 중이어서 건너뛴 회차는 SKIPPED)", ("tenant", "result")
+)
+CYCLE_DURATION_SECONDS = REGISTRY.histogram(
+    "coupang_cycle_duration_seconds", "쿠폰 갱신 사이클 전체 소요 시간(초)", ("tenant", "result"), LONG_BUCKETS_SEC
+)
+
+# --- Discord 알림 ---
+DISCORD_SENDS_TOTAL = REGISTRY.counter(
+    "coupang_discord_sends_total", "Discord 알림 수 (success/failure/skipped/dropped, dropped는 전송 대기열이 가득 차 버린 알림)", ("result",)
+)
+DISCORD_WEBHOOK_POSTS_TOTAL = REGISTRY.counter(
+    "coupang_discord_webhook_posts_total", "Discord 웹훅 요청 수 (여러 알림을 묶어 보낸 요청 포함, 상태 코드별)", ("status",)
+)
+DISCORD_SEND_DURATION_SECONDS = REGISTRY.histogram(
+    "coupang_discord_send_duration_seconds", "Discord 웹훅 요청 1회 소요 시간(초)"
+)
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        payload = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port: int, host: str = "127.0.0.1", registry: MetricsRegistry = REGISTRY) -> ThreadingHTTPServer:
+    """지표 조회용 HTTP 서버를 백그라운드 스레드에서 시작합니다. (GET /metrics)"""
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    server.daemon_threads = True
+    server.registry = registry
+    threading.Thread(target=server.serve_forever, name="metrics-server", daemon=True).start()
+    logger.info(f"지표 조회 서버 시작: http://{host}:{server.server_address[1]}/metrics")
+    return server
@@ -0,0 +1,438 @@
+# coupang_lib/mock_gateway.py
+"""
+부하 테스트와 오프라인 실행을 위한 로컬 쿠팡 API Gateway 대역 서버입니다.
+
+coupang_api_utils.py가 사용하는 엔드포인트(쿠폰 생성, 요청 상태 조회, 활성 쿠폰 목록 조회,
+쿠폰 파기(action=expire), 쿠폰 품목 적용)를 구현하고, CoupangApiClient와 같은 방식으로 CEA HMAC 서명을 검증합니다.
+응답 지연, REQUESTED→DONE 전환 시간, 실패율, 429 응답 동작을 옵션으로 조절할 수 있습니다.
+
+실행 방법 (프로젝트 루트에서, openssl 명령어 필요):
+    python -m coupang_lib.mock_gateway --port 8443 --done-delay-sec 3
+    # 다른 터미널에서 (.env의 ACCESS_KEY/SECRET_KEY를 그대로 사용)
+    API_GATEWAY_URL=https://127.0.0.1:8443 python main.py
+"""
+import argparse
+import hashlib
+import hmac
+import itertools
+import json
+import os
+import random
+import re
+import shutil
+import ssl
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.parse
+from collections import Counter, deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Tuple
+
+from coupang_lib.api_client import endpoint_template
+
+_API_PREFIX = "/v2/providers/fms/apis/api"
+_ROUTES = (
+    ("POST", re.compile(rf"^{_API_PREFIX}/v2/vendors/(?P<vendor_id>[^/]+)/coupon$"), "_create_coupon"),
+    ("GET", re.compile(rf"^{_API_PREFIX}/v1/vendors/(?P<vendor_id>[^/]+)/requested/(?P<requested_id>[^/]+)$"), "_requested_status"),
+    ("GET", re.compile(rf"^{_API_PREFIX}/v2/vendors/(?P<vendor_id>[^/]+)/coupons$"), "_list_coupons"),
+    ("PUT", re.compile(rf"^{_API_PREFIX}/v1/vendors/(?P<vendor_id>[^/]+)/coupons/(?P<coupon_id>\d+)$"), "_expire_coupon"),
+    ("POST", re.compile(rf"^{_API_PREFIX}/v1/vendors/(?P<vendor_id>[^/]+)/coupons/(?P<coupon_id>\d+)/items$"), "_apply_items"),
+)
+# 서명 시각(signed-date)과 서버 시각의 최대 허용 차이(초)
+_MAX_SIGNATURE_SKEW_SEC = 300
+
+
+class MockGatewayOptions:
+    """
+    대역 서버 동작 옵션입니다.
+
+    Args:
+        latency_ms: 모든 응답 전에 기다리는 시간(밀리초). latency_jitter_ms만큼 무작위로 더해집니다.
+        done_delay_sec: 생성/파기/적용 요청이 REQUESTED에서 최종 상태로 바뀌기까지 걸리는 시간(초).
+        request_failure_rate: 요청이 DONE 대신 FAIL로 끝날 확률 (0~1).
+        item_failure_rate: 품목 적용 요청이 DONE으로 끝날 때 품목별로 적용에 실패할 확률 (0~1).
+            실패한 품목은 요청 상태 응답의 failedVendorItems에 담깁니다.
+        server_error_rate: 요청에 HTTP 500으로 응답할 확률 (0~1).
+        throttle_rate: 요청에 HTTP 429로 응답할 확률 (0~1).
+        max_requests_per_sec: 전체 요청 수가 초당 이 값을 넘으면 429로 응답합니다. (0이면 제한 없음)
+        retry_after_sec: 429 응답의 Retry-After 헤더 값(초).
+        seed: 확률 동작에 사용할 난수 시드.
+    """
+    def __init__(self, latency_ms: float = 0.0, latency_jitter_ms: float = 0.0, done_delay_sec: float = 0.0,
+                 request_failure_rate: float = 0.0, server_error_rate: float = 0.0, throttle_rate: float = 0.0,
+                 max_requests_per_sec: float = 0.0, retry_after_sec: float = 1.0, seed: int | None = None,
+                 item_failure_rate: float = 0.0):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.done_delay_sec = done_delay_sec
+        self.request_failure_rate = request_failure_rate
+        self.item_failure_rate = item_failure_rate
+        self.server_error_rate = server_error_rate
+        self.throttle_rate = throttle_rate
+        self.max_requests_per_sec = max_requests_per_sec
+        self.retry_after_sec = retry_after_sec
+        self.seed = seed
+
+
+def generate_self_signed_cert(directory: str) -> Tuple[str, str]:
+    """openssl로 localhost용 자체 서명 인증서를 만들고 (인증서 경로, 키 경로)를 반환합니다."""
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-subj", "/CN=localhost", "-keyout", key_path, "-out", cert_path],
+        check=True, capture_output=True
+    )
+    return cert_path, key_path
+
+
+class _MockGatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+    disable_nagle_algorithm = True
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, payload, extra_headers = self.server.gateway.handle(self.command, self.path, self.headers, body)
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in extra_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+        self.server.gateway.record_bytes(len(body), len(data))
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockCoupangGateway:
+    """
+    메모리에 쿠폰과 요청(requestedId) 상태를 보관하는 쿠팡 API Gateway 대역 서버입니다.
+    start()가 반환한 URL을 CoupangApiClient의 api_gateway_url(또는 API_GATEWAY_URL 환경 변수)로 사용합니다.
+    """
+    def __init__(self, access_key: str, secret_key: str, options: MockGatewayOptions | None = None,
+                 host: str = "127.0.0.1", port: int = 0, cert_path: str | None = None, key_path: str | None = None):
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.options = options or MockGatewayOptions()
+        self.host = host
+        self.port = port
+        self.cert_path = cert_path
+        self.key_path = key_path
+        self._random = random.Random(self.options.seed)
+        self._lock = threading.Lock()
+        self._coupon_ids = itertools.count(10_000_001)
+        self._requested_ids = itertools.count(900_000_001)
+        self._coupons: Dict[int, Dict[str, Any]] = {}
+        self._coupon_items: Dict[int, set] = {}
+        self._requests: Dict[str, Dict[str, Any]] = {}
+        self._recent_request_times = deque()
+        self._calls = Counter()
+        self._responses = Counter()
+        self._bytes_received = 0
+        self._bytes_sent = 0
+        self._server = None
+        self._temp_dir = None
+
+    # --- 서버 수명 주기 ---
+    def start(self) -> str:
+        """서버를 백그라운드 스레드에서 시작하고 접속 URL을 반환합니다."""
+        if self.cert_path is None:
+            self._temp_dir = tempfile.mkdtemp(prefix="mock-gateway-")
+            self.cert_path, self.key_path = generate_self_signed_cert(self._temp_dir)
+        self._server = ThreadingHTTPServer((self.host, self.port), _MockGatewayHandler)
+        self._server.daemon_threads = True
+        self._server.gateway = self
+        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ctx.load_cert_chain(self.cert_path, self.key_path)
+        self._server.socket = ctx.wrap_socket(self._server.socket, server_side=True)
+        threading.Thread(target=self._server.serve_forever, name="mock-gateway", daemon=True).start()
+        return self.url
+
+    @property
+    def url(self) -> str:
+        return f"https://{self.host}:{self._server.server_address[1]}"
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    # --- 테스트 데이터 및 통계 ---
+    def seed_coupons(self, count: int, name_prefix: str = "자동쿠폰_seed") -> list[int]:
+        """활성(APPLIED) 상태의 쿠폰 count개를 미리 만들어 두고 쿠폰 ID 목록을 반환합니다."""
+        with self._lock:
+            coupon_ids = []
+            for index in range(count):
+                coupon_id = next(self._coupon_ids)
+                self._coupons[coupon_id] = {"couponId": coupon_id, "promotionName": f"{name_prefix}_{index:05d}", "status": "APPLIED", "items": 0}
+                coupon_ids.append(coupon_id)
+            return coupon_ids
+
+    def active_coupons(self) -> list[Dict[str, Any]]:
+        with self._lock:
+            return [dict(coupon) for coupon in self._coupons.values() if coupon["status"] == "APPLIED"]
+
+    def record_bytes(self, received: int, sent: int):
+        with self._lock:
+            self._bytes_received += received
+            self._bytes_sent += sent
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 호출 수, 응답 상태 코드별 개수, 주고받은 바이트 수를 반환합니다."""
+        with self._lock:
+            return {
+                "calls": dict(self._calls),
+                "total_calls": sum(self._calls.values()),
+                "responses": {str(status): count for status, count in sorted(self._responses.items())},
+                "bytes_received": self._bytes_received,
+                "bytes_sent": self._bytes_sent,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._calls.clear()
+            self._responses.clear()
+            self._bytes_received = 0
+            self._bytes_sent = 0
+
+    # --- 요청 처리 ---
+    def handle(self, method: str, raw_path: str, headers, body: bytes) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """요청 하나를 처리하고 (상태 코드, 응답 JSON, 추가 헤더)를 반환합니다."""
+        path, _, query_string = raw_path.partition("?")
+        with self._lock:
+            self._calls[endpoint_template(method, path)] += 1
+
+        status, payload, extra_headers = self._dispatch(method, path, query_string, headers, body)
+        with self._lock:
+            self._responses[status] += 1
+
+        delay_sec = (self.options.latency_ms + self._random.uniform(0, self.options.latency_jitter_ms)) / 1000
+        if delay_sec > 0:
+            time.sleep(delay_sec)
+        return status, payload, extra_headers
+
+    def _dispatch(self, method: str, path: str, query_string: str, headers, body: bytes):
+        signature_error = self._verify_signature(method, path, query_string, headers.get("Authorization"))
+        if signature_error:
+            return 401, {"code": 401, "message": signature_error}, {}
+
+        if self._is_throttled():
+            return 429, {"code": 429, "message": "Too Many Requests"}, {"Retry-After": f"{self.options.retry_after_sec:g}"}
+        if self.options.server_error_rate and self._random.random() < self.options.server_error_rate:
+            return 500, {"code": 500, "message": "Internal Server Error (mock)"}, {}
+
+        for route_method, pattern, handler_name in _ROUTES:
+            match = pattern.match(path)
+            if match and route_method == method:
+                query = dict(urllib.parse.parse_qsl(query_string))
+                try:
+                    request_body = json.loads(body) if body else {}
+                except json.JSONDecodeError:
+                    return 400, {"code": 400, "message": "요청 바디가 올바른 JSON이 아닙니다."}, {}
+                return 200, getattr(self, handler_name)(query=query, body=request_body, **match.groupdict()), {}
+        return 404, {"code": 404, "message": f"지원하지 않는 엔드포인트: {method} {path}"}, {}
+
+    def _verify_signature(self, method: str, path: str, query_string: str, authorization: str | None) -> str | None:
+        """CoupangApiClient._generate_signature와 같은 규칙으로 서명을 검증하고, 실패 시 사유를 반환합니다."""
+        if not authorization or not authorization.startswith("CEA "):
+            return "Authorization 헤더가 없거나 CEA 형식이 아닙니다."
+        fields = dict(
+            part.strip().split("=", 1) for part in authorization[len("CEA "):].split(",") if "=" in part
+        )
+        if fields.get("algorithm") != "HmacSHA256" or fields.get("access-key") != self.access_key:
+            return "알 수 없는 access-key 또는 알고리즘입니다."
+        signed_date = fields.get("signed-date", "")
+        try:
+            signed_at = datetime.strptime(signed_date, "%y%m%dT%H%M%SZ").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return "signed-date 형식이 올바르지 않습니다."
+        if abs((datetime.now(timezone.utc) - signed_at).total_seconds()) > _MAX_SIGNATURE_SKEW_SEC:
+            return "signed-date가 허용 범위를 벗어났습니다."
+        expected = hmac.new(
+            self.secret_key.encode("utf-8"), f"{signed_date}{method}{path}{query_string}".encode("utf-8"), hashlib.sha256
+        ).hexdigest()
+        if not hmac.compare_digest(expected, fields.get("signature", "")):
+            return "서명이 일치하지 않습니다."
+        return None
+
+    def _is_throttled(self) -> bool:
+        if self.options.throttle_rate and self._random.random() < self.options.throttle_rate:
+            return True
+        if self.options.max_requests_per_sec > 0:
+            now = time.monotonic()
+            with self._lock:
+                while self._recent_request_times and now - self._recent_request_times[0] >= 1.0:
+                    self._recent_request_times.popleft()
+                if len(self._recent_request_times) >= self.options.max_requests_per_sec:
+                    return True
+                self._recent_request_times.append(now)
+        return False
+
+    def _register_request(self, request_type: str, coupon_id: int | None, total: int, vendor_items: list | None = None) -> str:
+        requested_id = str(next(self._requested_ids))
+        failed = bool(self.options.request_failure_rate) and self._random.random() < self.options.request_failure_rate
+        vendor_items = vendor_items or []
+        failed_items = []
+        if not failed and self.options.item_failure_rate:
+            failed_items = [item for item in vendor_items if self._random.random() < self.options.item_failure_rate]
+        self._requests[requested_id] = {
+            "type": request_type,
+            "couponId": coupon_id,
+            "total": total,
+            "ready_at": time.monotonic() + self.options.done_delay_sec,
+            "final_status": "FAIL" if failed else "DONE",
+            "applied": False,
+            "vendor_items": vendor_items,
+            "failed_items": failed_items,
+        }
+        return requested_id
+
+    @staticmethod
+    def _requested_response(requested_id: str) -> Dict[str, Any]:
+        return {"code": 200, "message": "OK", "data": {"success": True, "content": {"requestedId": requested_id, "success": True}}}
+
+    def _create_coupon(self, vendor_id: str, query: dict, body: dict) -> Dict[str, Any]:
+        with self._lock:
+            coupon_id = next(self._coupon_ids)
+            self._coupons[coupon_id] = {"couponId": coupon_id, "promotionName": body.get("name", ""), "status": "PENDING", "items": 0}
+            return self._requested_response(self._register_request("COUPON_PUBLISH", coupon_id, 1))
+
+    def _expire_coupon(self, vendor_id: str, coupon_id: str, query: dict, body: dict) -> Dict[str, Any]:
+        if query.get("action") != "expire":
+            return {"code": 400, "message": "지원하지 않는 action입니다."}
+        with self._lock:
+            if int(coupon_id) not in self._coupons:
+                return {"code": 400, "message": f"쿠폰 {coupon_id}을 찾을 수 없습니다."}
+            return {"code": 200, "message": "OK", "data": {"success": True, "content": {"requestedId": self._register_request("COUPON_EXPIRE", int(coupon_id), 1)}}}
+
+    def _apply_items(self, vendor_id: str, coupon_id: str, query: dict, body: dict) -> Dict[str, Any]:
+        vendor_items = body.get("vendorItems") or []
+        with self._lock:
+            if int(coupon_id) not in self._coupons:
+                return {"code": 400, "message": f"쿠폰 {coupon_id}을 찾을 수 없습니다.", "data": {"success": False}}
+            return self._requested_response(self._register_request("COUPON_ITEM_APPLY", int(coupon_id), len(vendor_items), vendor_items))
+
+    def _requested_status(self, vendor_id: str, requested_id: str, query: dict, body: dict) -> Dict[str, Any]:
+        with self._lock:
+            request = self._requests.get(requested_id)
+            if request is None:
+                return {"code": 400, "message": f"요청 ID {requested_id}을 찾을 수 없습니다.", "data": {"errorMessage": "NOT_FOUND"}}
+            status = "REQUESTED"
+            if time.monotonic() >= request["ready_at"]:
+                status = request["final_status"]
+                if status == "DONE" and not request["applied"]:
+                    self._apply_request_effect(request)
+            done = status == "DONE"
+            failed_items = request["failed_items"] if done else []
+            content = {
+                "requestedId": requested_id,
+                "type": request["type"],
+                "status": status,
+                "couponId": request["couponId"],
+                "succeeded": request["total"] - len(failed_items) if done else 0,
+                "failed": request["total"] if status == "FAIL" else len(failed_items),
+                "total": request["total"],
+            }
+            if failed_items:
+                content["failedVendorItems"] = [{"vendorItemId": int(item), "reason": "MOCK_ITEM_FAILURE"} for item in failed_items]
+            return {"code": 200, "message": "OK", "data": {"success": True, "content": content}}
+
+    def _apply_request_effect(self, request: Dict[str, Any]):
+        request["applied"] = True
+        coupon = self._coupons.get(request["couponId"])
+        if coupon is None:
+            return
+        if request["type"] == "COUPON_PUBLISH":
+            coupon["status"] = "APPLIED"
+        elif request["type"] == "COUPON_EXPIRE":
+            coupon["status"] = "EXPIRED"
+        elif request["type"] == "COUPON_ITEM_APPLY":
+            # 같은 품목을 다시 적용해도 한 번만 세도록 쿠폰별 적용 품목 집합을 유지합니다.
+            failed_items = set(request["failed_items"])
+            applied_items = self._coupon_items.setdefault(coupon["couponId"], set())
+            applied_items.update(str(item) for item in request["vendor_items"] if item not in failed_items)
+            coupon["items"] = len(applied_items)
+
+    def _list_coupons(self, vendor_id: str, query: dict, body: dict) -> Dict[str, Any]:
+        page = max(1, int(query.get("page", 1)))
+        size = max(1, int(query.get("size", 20)))
+        with self._lock:
+            coupons = [coupon for coupon in self._coupons.values() if coupon["status"] == query.get("status", "APPLIED")]
+            if query.get("sort") == "desc":
+                coupons.reverse()
+            total_pages = (len(coupons) + size - 1) // size
+            content = [
+                {"couponId": coupon["couponId"], "promotionName": coupon["promotionName"], "status": coupon["status"]}
+                for coupon in coupons[(page - 1) * size:page * size]
+            ]
+        return {
+            "code": 200,
+            "message": "OK",
+            "data": {
+                "content": content,
+                "pagination": {"currentPage": page, "countPerPage": size, "totalPages": total_pages, "totalElements": len(coupons)},
+            },
+        }
+
+
+def main():
+    from coupang_lib.config import ACCESS_KEY, SECRET_KEY
+
+    parser = argparse.ArgumentParser(description="로컬 쿠팡 API Gateway 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="응답 지연(밀리초)")
+    parser.add_argument("--latency-jitter-ms", type=float, default=0.0, help="응답 지연에 더할 무작위 시간(밀리초)")
+    parser.add_argument("--done-delay-sec", type=float, default=0.0, help="REQUESTED → DONE/FAIL 전환 시간(초)")
+    parser.add_argument("--request-failure-rate", type=float, default=0.0, help="요청이 FAIL로 끝날 확률")
+    parser.add_argument("--item-failure-rate", type=float, default=0.0, help="품목 적용 시 품목별 실패 확률")
+    parser.add_argument("--server-error-rate", type=float, default=0.0, help="HTTP 500 응답 확률")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="HTTP 429 응답 확률")
+    parser.add_argument("--max-requests-per-sec", type=float, default=0.0, help="초당 요청 수 한도 (초과 시 429)")
+    parser.add_argument("--retry-after-sec", type=float, default=1.0, help="429 응답의 Retry-After 값(초)")
+    parser.add_argument("--seed-coupons", type=int, default=0, help="미리 만들어 둘 활성 자동 쿠폰 수")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    options = MockGatewayOptions(
+        latency_ms=args.latency_ms, latency_jitter_ms=args.latency_jitter_ms, done_delay_sec=args.done_delay_sec,
+        request_failure_rate=args.request_failure_rate, item_failure_rate=args.item_failure_rate,
+        server_error_rate=args.server_error_rate, throttle_rate=args.throttle_rate, max_requests_per_sec=args.max_requests_per_sec,
+        retry_after_sec=args.retry_after_sec, seed=args.seed,
+    )
+    gateway = MockCoupangGateway(ACCESS_KEY or "mock-access-key", SECRET_KEY or "mock-secret-key", options, host=args.host, port=args.port)
+    gateway.seed_coupons(args.seed_coupons)
+    url = gateway.start()
+    print(f"대역 서버 실행 중: {url} (종료: Ctrl+C)")
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(json.dumps(gateway.stats(), indent=2, ensure_ascii=False))
+        gateway.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# coupang_lib/rate_limiter.py
+import threading
+import time
+from typing import Dict
+
+from coupang_lib.logger import logger
+
+
+class _TokenBucket:
+    """초당 rate개씩 토큰이 채워지는 버킷입니다. 최대 max(1, rate)개까지 쌓입니다."""
+    def __init__(self, rate_per_sec: float):
+        self.max_rate_per_sec = rate_per_sec
+        self.rate_per_sec = rate_per_sec
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0  # Retry-After 등으로 요청을 멈춰야 하는 시각
+        self.waiting = 0  # 토큰을 기다리는 요청 수
+
+    @property
+    def capacity(self) -> float:
+        return max(1.0, self.rate_per_sec)
+
+    def refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_sec)
+        self.updated_at = now
+
+    def seconds_until_available(self, now: float) -> float:
+        wait_sec = max(0.0, self.blocked_until - now)
+        if self.tokens < 1:
+            wait_sec = max(wait_sec, (1 - self.tokens) / self.rate_per_sec)
+        return wait_sec
+
+
+class AdaptiveRateLimiter:
+    """
+    API Gateway 호출 속도를 제한하는 토큰 버킷 리미터입니다. 모든 호출이 하나의 인스턴스를 공유해야 합니다.
+
+    - 전체 호출에 대한 전역 버킷과, 엔드포인트별 버킷을 함께 적용합니다.
+      endpoint_rates는 {엔드포인트 패턴: 초당 요청 수} 형태이며, 엔드포인트 키가 패턴으로 끝나면 해당 속도를 사용합니다.
+      (예: {"/requested/{id}": 8} → 상태 조회 요청)
+    - 429 또는 5xx 응답을 받으면 해당 엔드포인트의 속도를 절반으로 줄이고, Retry-After가 있으면 그 시간 동안 요청을 멈춥니다.
+    - 성공 응답이 이어지면 설정한 최대 속도까지 조금씩 다시 올립니다.
+    """
+    def __init__(self, default_rate_per_sec: float, endpoint_rates: Dict[str, float] | None = None,
+                 global_rate_per_sec: float | None = None, min_rate_per_sec: float = 0.2, recovery_step_ratio: float = 0.1):
+        self.default_rate_per_sec = default_rate_per_sec
+        self.endpoint_rates = endpoint_rates or {}
+        self.min_rate_per_sec = min_rate_per_sec
+        self.recovery_step_ratio = recovery_step_ratio
+        self._global_bucket = _TokenBucket(global_rate_per_sec) if global_rate_per_sec else None
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._condition = threading.Condition()
+
+    def _bucket_for(self, endpoint_key: str) -> _TokenBucket:
+        bucket = self._buckets.get(endpoint_key)
+        if bucket is None:
+            rate = next((r for pattern, r in self.endpoint_rates.items() if endpoint_key.endswith(pattern)), self.default_rate_per_sec)
+            bucket = _TokenBucket(rate)
+            self._buckets[endpoint_key] = bucket
+        return bucket
+
+    def acquire(self, endpoint_key: str):
+        """endpoint_key에 대한 요청을 보내도 될 때까지 대기합니다."""
+        with self._condition:
+            bucket = self._bucket_for(endpoint_key)
+            buckets = [bucket, self._global_bucket] if self._global_bucket else [bucket]
+            bucket.waiting += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    for b in buckets:
+                        b.refill(now)
+                    wait_sec = max(b.seconds_until_available(now) for b in buckets)
+                    if wait_sec <= 0:
+                        for b in buckets:
+                            b.tokens -= 1
+                        return
+                    self._condition.wait(timeout=wait_sec)
+            finally:
+                bucket.waiting -= 1
+
+    def on_response(self, endpoint_key: str, status_code: int, retry_after_sec: float | None = None):
+        """응답 상태 코드를 반영하여 엔드포인트별 요청 속도를 조정합니다."""
+        with self._condition:
+            bucket = self._bucket_for(endpoint_key)
+            now = time.monotonic()
+            if status_code == 429 or status_code >= 500:
+                bucket.refill(now)
+                bucket.rate_per_sec = max(self.min_rate_per_sec, bucket.rate_per_sec / 2)
+                bucket.tokens = min(bucket.tokens, bucket.capacity)
+                if retry_after_sec:
+                    bucket.blocked_until = max(bucket.blocked_until, now + retry_after_sec)
+                logger.warning(
+                    f"[요청 제한] {endpoint_key} 응답 {status_code}. 요청 속도를 초당 {bucket.rate_per_sec:.2f}회로 낮춥니다."
+                    + (f" ({retry_after_sec:.0f}초 대기)" if retry_after_sec else "")
+                )
+            elif bucket.rate_per_sec < bucket.max_rate_per_sec:
+                bucket.refill(now)
+                bucket.rate_per_sec = min(bucket.max_rate_per_sec, bucket.rate_per_sec + bucket.max_rate_per_sec * self.recovery_step_ratio)
+            self._condition.notify_all()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """엔드포인트별 현재 요청 속도, 대기 중인 요청 수, 남은 차단 시간을 반환합니다."""
+        with self._condition:
+            now = time.monotonic()
+            return {
+                endpoint_key: {
+                    "rate_per_sec": round(bucket.rate_per_sec, 3),
+                    "max_rate_per_sec": bucket.max_rate_per_sec,
+                    "queue_depth": bucket.waiting,
+                    "blocked_for_sec": round(max(0.0, bucket.blocked_until - now), 3),
+                }
+                for endpoint_key, bucket in self._buckets.items()
+            }
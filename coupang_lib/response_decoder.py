@@ -0,0 +1,71 @@
+# coupang_lib/response_decoder.py
+import codecs
+from typing import Any, Dict
+
+from coupang_lib import json_codec
+from coupang_lib.logger import logger
+
+# 선언된 charset으로 디코딩하지 못했을 때 차례로 시도하는 charset (마지막에는 latin-1로 손실 디코딩)
+FALLBACK_CHARSETS = ("cp949", "euc-kr")
+
+
+def _normalize_charset(charset: str | None) -> str:
+    """charset 이름을 codecs 기준 이름으로 바꿉니다. (예: "UTF8" → "utf-8", 알 수 없는 이름은 소문자 그대로)"""
+    if not charset:
+        return "utf-8"
+    try:
+        return codecs.lookup(charset).name
+    except LookupError:
+        return charset.lower()
+
+
+class ResponseDecoder:
+    """
+    API 응답 바이트를 JSON 또는 문자열로 변환합니다.
+
+    - 응답이 UTF-8이면 문자열로 바꾸지 않고 바이트에서 바로 JSON을 파싱합니다.
+    - 그 외에는 선언된 charset → cp949 → euc-kr 순서로 디코딩하고, 모두 실패하면 latin-1로 손실 디코딩합니다.
+    - 디코딩에 성공한 charset을 엔드포인트별로 기억해 두고, charset을 선언하지 않은 응답에는 그 charset을 먼저 시도합니다.
+      (선언된 charset이 있으면 항상 선언된 charset을 먼저 사용합니다. UTF-8 한글 바이트 중에는 cp949로도 디코딩되는 경우가 있어
+      기억한 charset을 우선하면 글자가 깨진 채로 성공할 수 있기 때문입니다.)
+    """
+    def __init__(self):
+        self._charsets: Dict[str, str] = {}  # 엔드포인트 키 → 마지막으로 디코딩에 성공한 charset
+
+    def charset_for(self, endpoint_key: str) -> str | None:
+        """엔드포인트에서 마지막으로 디코딩에 성공한 charset을 반환합니다. (기록이 없으면 None)"""
+        return self._charsets.get(endpoint_key)
+
+    def parse_json(self, raw: bytes, declared_charset: str | None, endpoint_key: str) -> Any:
+        """응답 바이트를 JSON으로 파싱합니다. 형식 오류는 json.JSONDecodeError로 발생합니다."""
+        if declared_charset:
+            charset = _normalize_charset(declared_charset)
+        else:
+            charset = self._charsets.get(endpoint_key) or "utf-8"
+        if charset == "utf-8":
+            try:
+                return json_codec.loads(raw)
+            except ValueError:
+                # UTF-8이 아닌 바이트가 섞였거나 형식 오류입니다. 문자열 디코딩을 거쳐 한 번 더 시도합니다.
+                pass
+        return json_codec.loads(self.decode_text(raw, declared_charset, endpoint_key))
+
+    def decode_text(self, raw: bytes, declared_charset: str | None, endpoint_key: str) -> str:
+        """응답 바이트를 문자열로 디코딩합니다. 실패하지 않으며, 모든 charset이 맞지 않으면 latin-1로 손실 디코딩합니다."""
+        remembered = self._charsets.get(endpoint_key)
+        declared = _normalize_charset(declared_charset)
+        preferred = (declared, remembered) if declared_charset else (remembered, declared)
+        candidates = dict.fromkeys(
+            charset for charset in (*preferred, *map(_normalize_charset, FALLBACK_CHARSETS)) if charset
+        )
+        for charset in candidates:
+            try:
+                text = raw.decode(charset)
+            except (UnicodeDecodeError, LookupError):
+                logger.warning(f"WARNING: '{charset}' 디코딩 실패, 다음 charset으로 재시도. ({endpoint_key})")
+                continue
+            if charset != remembered:
+                self._charsets[endpoint_key] = charset
+            return text
+        logger.warning(f"WARNING: 모든 디코딩 시도 실패, 'latin-1'으로 디코딩 (데이터 손실 가능). ({endpoint_key})")
+        return raw.decode('latin-1', errors='ignore')
@@ -0,0 +1,222 @@
+# coupang_lib/state_store.py
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from coupang_lib.logger import logger
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cycles (
+    cycle_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    vendor_id TEXT NOT NULL,
+    rotation_mode TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    coupon_id INTEGER,
+    started_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    finished_at TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_cycles_unfinished ON cycles (vendor_id, finished_at);
+
+CREATE TABLE IF NOT EXISTS pending_requests (
+    requested_id TEXT PRIMARY KEY,
+    cycle_id INTEGER NOT NULL REFERENCES cycles (cycle_id),
+    kind TEXT NOT NULL,
+    coupon_id INTEGER,
+    registered_at TEXT NOT NULL,
+    status TEXT,
+    resolved_coupon_id INTEGER,
+    resolved_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_pending_requests_cycle ON pending_requests (cycle_id);
+
+CREATE TABLE IF NOT EXISTS applied_items (
+    coupon_id INTEGER NOT NULL,
+    vendor_item_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    requested_id TEXT,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (coupon_id, vendor_item_id)
+) WITHOUT ROWID;
+"""
+
+# applied_items.status 값
+ITEM_APPLIED = "APPLIED"
+ITEM_FAILED = "FAILED"
+
+
+def _now_str() -> str:
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+
+class CouponStateStore:
+    """
+    쿠폰 사이클 진행 상태를 SQLite(WAL 모드)에 기록합니다.
+    사이클별 단계(phase)와 쿠폰 ID, 아직 결과를 받지 못한 requestedId를 저장하므로
+    프로세스가 사이클 도중 재시작되어도 처음부터 다시 하지 않고 폴링을 이어갈 수 있습니다.
+    이 프로세스의 스레드가 실행 중인 사이클은 메모리에 따로 기록해 두고, 다른 스레드가 이어서 진행하거나 종료 처리하지 않도록 제외합니다.
+    """
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._owned_cycle_ids: set[int] = set()  # 이 프로세스에서 실행 중인(스레드가 맡고 있는) 사이클 ID
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        logger.debug(f"상태 저장소 초기화 완료: {db_path}")
+
+    def _execute(self, sql: str, params: Iterable[Any] = ()):
+        with self._lock:
+            self._conn.execute(sql, tuple(params))
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[sqlite3.Row]:
+        # 연결을 여러 스레드가 함께 쓰므로, 결과 행도 잠금을 잡은 상태에서 모두 읽어 옵니다.
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+
+    def _not_owned_clause(self) -> tuple[str, list[int]]:
+        # 실행 중인 사이클을 제외하는 WHERE 조건 (self._lock을 잡은 상태에서 호출)
+        if not self._owned_cycle_ids:
+            return "", []
+        owned = sorted(self._owned_cycle_ids)
+        return f" AND cycle_id NOT IN ({', '.join('?' for _ in owned)})", owned
+
+    def start_cycle(self, vendor_id: str, rotation_mode: str, phase: str) -> int:
+        """새 사이클을 기록하고 cycle_id를 반환합니다. 새 사이클은 호출한 스레드가 실행 중인 것으로 기록됩니다."""
+        now = _now_str()
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO cycles (vendor_id, rotation_mode, phase, started_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+                (vendor_id, rotation_mode, phase, now, now)
+            )
+            self._owned_cycle_ids.add(cursor.lastrowid)
+        return cursor.lastrowid
+
+    def release_cycle(self, cycle_id: int):
+        """사이클을 실행 중 목록에서 뺍니다. (끝나지 않은 사이클이라면 이후 claim_unfinished_cycle로 이어서 진행할 수 있음)"""
+        with self._lock:
+            self._owned_cycle_ids.discard(cycle_id)
+
+    def set_phase(self, cycle_id: int, phase: str, coupon_id: int | None = None):
+        """사이클의 현재 단계를 기록합니다. coupon_id를 주면 함께 저장합니다."""
+        if coupon_id is None:
+            self._execute("UPDATE cycles SET phase = ?, updated_at = ? WHERE cycle_id = ?", (phase, _now_str(), cycle_id))
+        else:
+            self._execute(
+                "UPDATE cycles SET phase = ?, coupon_id = ?, updated_at = ? WHERE cycle_id = ?",
+                (phase, coupon_id, _now_str(), cycle_id)
+            )
+
+    def finish_cycle(self, cycle_id: int, result: str):
+        """사이클을 종료 상태로 기록합니다. 종료된 사이클은 재시작 시 이어서 진행하지 않습니다."""
+        now = _now_str()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE cycles SET finished_at = ?, updated_at = ?, result = ? WHERE cycle_id = ?",
+                (now, now, result, cycle_id)
+            )
+            self._owned_cycle_ids.discard(cycle_id)
+
+    def _select_unfinished_cycle(self, vendor_id: str) -> sqlite3.Row | None:
+        # self._lock을 잡은 상태에서 호출
+        owned_sql, owned_params = self._not_owned_clause()
+        return self._conn.execute(
+            f"SELECT * FROM cycles WHERE vendor_id = ? AND finished_at IS NULL{owned_sql} ORDER BY cycle_id DESC LIMIT 1",
+            (vendor_id, *owned_params)
+        ).fetchone()
+
+    def get_unfinished_cycle(self, vendor_id: str) -> Dict[str, Any] | None:
+        """해당 판매자의 가장 최근 미완료 사이클 중 이 프로세스에서 실행 중이 아닌 사이클을 반환합니다."""
+        with self._lock:
+            row = self._select_unfinished_cycle(vendor_id)
+        return dict(row) if row else None
+
+    def claim_unfinished_cycle(self, vendor_id: str) -> Dict[str, Any] | None:
+        """
+        get_unfinished_cycle과 같은 사이클을 찾아 호출한 스레드가 실행 중인 것으로 기록한 뒤 반환합니다. (조회와 기록을 한 번에 처리)
+        이어서 진행을 마치면 finish_cycle 또는 release_cycle을 호출해야 합니다.
+        """
+        with self._lock:
+            row = self._select_unfinished_cycle(vendor_id)
+            if row is None:
+                return None
+            self._owned_cycle_ids.add(row['cycle_id'])
+        return dict(row)
+
+    def abandon_older_cycles(self, vendor_id: str, keep_cycle_id: int):
+        """keep_cycle_id 이전의 미완료 사이클 중 이 프로세스에서 실행 중이 아닌 사이클을 모두 종료 처리합니다."""
+        with self._lock:
+            owned_sql, owned_params = self._not_owned_clause()
+            self._conn.execute(
+                f"UPDATE cycles SET finished_at = ?, result = 'ABANDONED' WHERE vendor_id = ? AND finished_at IS NULL AND cycle_id < ?{owned_sql}",
+                (_now_str(), vendor_id, keep_cycle_id, *owned_params)
+            )
+
+    def add_pending_requests(self, cycle_id: int, kind: str, requested_ids: Iterable[str], coupon_id: int | None = None):
+        """결과를 기다리는 requestedId들을 기록합니다. kind는 "deactivate", "create", "apply" 중 하나입니다."""
+        now = _now_str()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO pending_requests (requested_id, cycle_id, kind, coupon_id, registered_at) VALUES (?, ?, ?, ?, ?)",
+                [(str(requested_id), cycle_id, kind, coupon_id, now) for requested_id in requested_ids]
+            )
+
+    def resolve_request(self, requested_id: str, status: str, coupon_id: int | None = None):
+        """requestedId의 최종 결과(DONE/FAIL/ERROR/TIMEOUT)를 기록합니다."""
+        self._execute(
+            "UPDATE pending_requests SET status = ?, resolved_coupon_id = ?, resolved_at = ? WHERE requested_id = ?",
+            (status, coupon_id, _now_str(), str(requested_id))
+        )
+
+    def list_requests(self, cycle_id: int, kind: str | None = None) -> List[Dict[str, Any]]:
+        """사이클에 기록된 requestedId 목록을 (결과가 있다면 결과와 함께) 반환합니다."""
+        if kind is None:
+            rows = self._query("SELECT * FROM pending_requests WHERE cycle_id = ? ORDER BY registered_at", (cycle_id,))
+        else:
+            rows = self._query(
+                "SELECT * FROM pending_requests WHERE cycle_id = ? AND kind = ? ORDER BY registered_at", (cycle_id, kind)
+            )
+        return [dict(row) for row in rows]
+
+    def record_item_results(self, coupon_id: int, vendor_item_ids: Iterable[int], status: str, requested_id: str | None = None):
+        """쿠폰에 품목을 적용한 결과(ITEM_APPLIED 또는 ITEM_FAILED)를 품목별로 기록합니다. 같은 품목은 마지막 결과로 덮어씁니다."""
+        now = _now_str()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO applied_items (coupon_id, vendor_item_id, status, requested_id, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(coupon_id, int(item_id), status, requested_id, now) for item_id in vendor_item_ids]
+            )
+
+    def get_item_ids(self, coupon_id: int, status: str) -> List[int]:
+        """쿠폰에 기록된 품목 중 status인 품목 ID를 오름차순으로 반환합니다."""
+        rows = self._query(
+            "SELECT vendor_item_id FROM applied_items WHERE coupon_id = ? AND status = ? ORDER BY vendor_item_id",
+            (coupon_id, status)
+        )
+        return [row[0] for row in rows]
+
+    def prune_item_results(self, vendor_id: str, keep_coupon_ids: Iterable[int]):
+        """
+        판매자의 쿠폰 중 keep_coupon_ids 이외의 쿠폰(비활성화된 이전 쿠폰)에 대한 품목 적용 기록을 삭제합니다.
+        아직 끝나지 않은 사이클의 쿠폰 기록과 다른 판매자의 기록은 남겨 둡니다.
+        """
+        keep_coupon_ids = [int(coupon_id) for coupon_id in keep_coupon_ids]
+        placeholders = ", ".join("?" for _ in keep_coupon_ids) or "NULL"
+        self._execute(
+            f"DELETE FROM applied_items WHERE coupon_id NOT IN ({placeholders}) "
+            "AND coupon_id IN (SELECT coupon_id FROM cycles WHERE vendor_id = ? AND coupon_id IS NOT NULL) "
+            "AND coupon_id NOT IN (SELECT coupon_id FROM cycles WHERE finished_at IS NULL AND coupon_id IS NOT NULL)",
+            keep_coupon_ids + [vendor_id]
+        )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,229 @@
+# coupang_lib/status_tracker.py
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+from coupang_lib.api_client import CoupangApiClient
+from coupang_lib.coupang_api_utils import STATUS_GATEWAY_UNAVAILABLE, check_coupon_status_detail_util
+from coupang_lib.discord_notifier import send_discord_failure_notification
+from coupang_lib.logger import logger
+from coupang_lib.metrics import STATUS_POLLS_TOTAL, STATUS_RESOLUTION_SECONDS
+
+# 최대 폴링 시간 (초) 및 경고 임계값 기본값
+DEFAULT_MAX_POLLING_TIME_SEC = 3600  # 총 1시간 (60분)까지 폴링 시도
+DEFAULT_NOTIFICATION_THRESHOLD_SEC = 900  # 15분 (900초) 이상 지연 시 경고 로깅
+
+# 완료된 것으로 보는 상태 (더 이상 폴링하지 않음)
+FINAL_STATUSES = ("DONE", "FAIL", "ERROR")
+
+
+def _error_result(requested_id: str) -> Dict[str, Any]:
+    return {"requestedId": requested_id, "status": "ERROR", "couponId": None, "type": None, "succeeded": 0, "failed": 0, "total": 0, "failedItems": []}
+
+
+def polling_interval_sec(total_elapsed_time_sec: float) -> int:
+    """요청 등록 후 경과된 시간에 따라 다음 조회까지의 대기 간격(초)을 결정합니다."""
+    if total_elapsed_time_sec < 60: # 1분 미만: 5초 단위
+        return 5
+    elif total_elapsed_time_sec < 5 * 60: # 1분 이상 5분 미만: 30초 단위
+        return 30
+    elif total_elapsed_time_sec < 30 * 60: # 5분 이상 30분 미만: 1분 단위 (60초)
+        return 60
+    else: # 30분 이상: 5분 단위 (300초)
+        return 300
+
+
+class _TrackedRequest:
+    def __init__(self, requested_id: str, now: float):
+        self.requested_id = requested_id
+        self.registered_at = now
+        self.next_poll_at = now
+        self.attempts = 0
+        self.delay_notified = False
+        self.future: Future = Future()
+
+
+class RequestedStatusTracker:
+    """
+    여러 단계(파기/생성/적용)에서 받은 requestedId를 한 곳에 모아 추적합니다.
+
+    백그라운드 스레드가 매 틱(tick_interval_sec)마다 조회 시점이 된 요청들을 모아 한꺼번에 동시 조회하며,
+    한 틱에 보내는 조회 요청 수는 max_requests_per_tick으로 제한됩니다.
+    조회 간격은 요청별로 등록 후 경과 시간에 따라 늘어납니다. (polling_interval_sec 참고)
+    요청이 DONE/FAIL/ERROR가 되거나 최대 폴링 시간을 넘기면(TIMEOUT) register()가 돌려준 Future가 완료됩니다.
+    API Gateway 회로가 열려 조회할 수 없으면 기다리던 모든 요청의 Future를 GATEWAY_UNAVAILABLE로 바로 완료합니다.
+    (회로가 닫힐 때까지 폴링을 이어 가지 않으며, 호출한 쪽이 나중에 다시 등록해야 합니다)
+    Future의 결과는 check_coupon_status_detail_util과 같은 형태의 딕셔너리입니다.
+    """
+    def __init__(self, api: CoupangApiClient, vendor_id: str, max_requests_per_tick: int = 20,
+                 tick_interval_sec: float = 1.0, max_concurrency: int = 8,
+                 max_polling_time_sec: float = DEFAULT_MAX_POLLING_TIME_SEC,
+                 notification_threshold_sec: float = DEFAULT_NOTIFICATION_THRESHOLD_SEC):
+        self.api = api
+        self.vendor_id = vendor_id
+        self.max_requests_per_tick = max(1, max_requests_per_tick)
+        self.tick_interval_sec = tick_interval_sec
+        self.max_polling_time_sec = max_polling_time_sec
+        self.notification_threshold_sec = notification_threshold_sec
+        self._pending: Dict[str, _TrackedRequest] = {}
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_concurrency), thread_name_prefix="status-poll")
+        self._thread = None
+        self._stopped = False
+
+    def register(self, requested_id: str, callback: Callable[[Dict[str, Any]], None] | None = None) -> Future:
+        """
+        requestedId를 추적 대상에 추가하고 결과 Future를 반환합니다.
+        이미 추적 중인 ID라면 기존 Future를 반환합니다. callback은 완료 시 결과 딕셔너리로 호출됩니다.
+        """
+        with self._condition:
+            tracked = self._pending.get(requested_id)
+            if tracked is None:
+                tracked = _TrackedRequest(requested_id, time.monotonic())
+                self._pending[requested_id] = tracked
+                logger.debug(f"요청 ID {requested_id} 상태 추적 등록 (추적 중: {len(self._pending)}개)", extra={"requested_id": requested_id})
+            self._ensure_started()
+            self._condition.notify()
+        if callback is not None:
+            tracked.future.add_done_callback(lambda future: callback(future.result()))
+        return tracked.future
+
+    def wait_for(self, requested_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 requestedId를 등록하고 모두 완료될 때까지 기다린 뒤 ID별 결과를 반환합니다."""
+        futures = {requested_id: self.register(requested_id) for requested_id in dict.fromkeys(requested_ids)}
+        return {requested_id: future.result() for requested_id, future in futures.items()}
+
+    def pending_count(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def stop(self):
+        """추적 스레드를 종료합니다. 완료되지 않은 요청의 Future는 그대로 남습니다."""
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+        self._executor.shutdown(wait=False)
+
+    def _ensure_started(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="requested-status-tracker", daemon=True)
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._stopped and not self._due_requests():
+                    if not self._pending:
+                        # 추적할 요청이 없으면 스레드를 끝냅니다. (다음 register()에서 다시 시작,
+                        # 클라이언트가 더 이상 쓰이지 않을 때 추적기와 함께 정리될 수 있도록)
+                        self._thread = None
+                        return
+                    self._condition.wait(timeout=self._seconds_until_next_due())
+                if self._stopped:
+                    return
+                batch = self._due_requests()[:self.max_requests_per_tick]
+            try:
+                self._poll_batch(batch)
+            except Exception as e:
+                # 추적 스레드가 죽으면 모든 대기자가 멈추므로, 이번 배치를 ERROR로 완료 처리합니다.
+                logger.error(f"[실패] 요청 상태 일괄 확인 중 예외 발생: {e}", exc_info=True)
+                with self._condition:
+                    for tracked in batch:
+                        self._pending.pop(tracked.requested_id, None)
+                for tracked in batch:
+                    if not tracked.future.done():
+                        tracked.future.set_result(_error_result(tracked.requested_id))
+            time.sleep(self.tick_interval_sec)
+
+    def _due_requests(self) -> List[_TrackedRequest]:
+        now = time.monotonic()
+        due = [tracked for tracked in self._pending.values() if tracked.next_poll_at <= now]
+        due.sort(key=lambda tracked: tracked.next_poll_at)
+        return due
+
+    def _seconds_until_next_due(self) -> float | None:
+        if not self._pending:
+            return None
+        return max(0.0, min(tracked.next_poll_at for tracked in self._pending.values()) - time.monotonic())
+
+    def _poll_batch(self, batch: List[_TrackedRequest]):
+        logger.info(f"요청 ID {len(batch)}개 상태 일괄 확인 중... ({', '.join(str(tracked.requested_id) for tracked in batch)})")
+        results = list(self._executor.map(
+            lambda tracked: check_coupon_status_detail_util(self.api, self.vendor_id, tracked.requested_id), batch
+        ))
+
+        now = time.monotonic()
+        finished = []
+        delayed_ids = []
+        timed_out_ids = []
+        unavailable = next((result for result in results if result['status'] == STATUS_GATEWAY_UNAVAILABLE), None)
+        if unavailable is not None:
+            final_results = {tracked.requested_id: result for tracked, result in zip(batch, results) if result['status'] in FINAL_STATUSES}
+            self._fail_pending(unavailable, final_results)
+            return
+
+        for tracked, result in zip(batch, results):
+            tracked.attempts += 1
+            elapsed_sec = now - tracked.registered_at
+            STATUS_POLLS_TOTAL.inc(status=result['status'])
+
+            if result['status'] in FINAL_STATUSES:
+                if result['status'] == "DONE":
+                    logger.info(f"요청 ID {tracked.requested_id} 처리 완료. 쿠폰 ID: {result['couponId']} (시도 {tracked.attempts}, 경과 시간: {elapsed_sec:.0f}초)", extra={"requested_id": tracked.requested_id})
+                else:
+                    logger.error(f"요청 ID {tracked.requested_id} 처리 실패 또는 오류 발생. 폴링 중단.", extra={"requested_id": tracked.requested_id})
+                finished.append((tracked, result))
+                continue
+
+            # REQUESTED 상태: 다음 조회 시점을 정하고, 지연/시간 초과 여부를 확인합니다.
+            sleep_interval_sec = polling_interval_sec(elapsed_sec)
+            if elapsed_sec + sleep_interval_sec >= self.max_polling_time_sec:
+                finished.append((tracked, dict(result, status="TIMEOUT")))
+                timed_out_ids.append(tracked.requested_id)
+                continue
+            if elapsed_sec >= self.notification_threshold_sec and not tracked.delay_notified:
+                tracked.delay_notified = True
+                delayed_ids.append(tracked.requested_id)
+            tracked.next_poll_at = now + sleep_interval_sec
+            logger.debug(f"요청 ID {tracked.requested_id} 상태 아직 완료되지 않음. {sleep_interval_sec}초 후 재시도... (시도 {tracked.attempts}, 경과 시간: {elapsed_sec:.0f}초)", extra={"requested_id": tracked.requested_id})
+
+        with self._condition:
+            for tracked, _ in finished:
+                self._pending.pop(tracked.requested_id, None)
+
+        if delayed_ids:
+            alert_message = (
+                f"요청 ID '{', '.join(map(str, delayed_ids))}'의 쿠폰 처리가 "
+                f"{self.notification_threshold_sec:.0f}초 ({self.notification_threshold_sec / 60:.1f}분) 이상 지연 중입니다. "
+                "수동 확인이 필요할 수 있습니다."
+            )
+            logger.warning(f"[쿠폰 처리 지연 알림] {alert_message}")
+            send_discord_failure_notification(alert_message, "긴급 알림: 쿠폰 처리 지연")
+
+        if timed_out_ids:
+            alert_message = (
+                f"요청 ID '{', '.join(map(str, timed_out_ids))}'의 쿠폰 처리가 "
+                f"지정된 최대 폴링 시간 ({self.max_polling_time_sec:.0f}초, 약 {self.max_polling_time_sec / 60:.0f}분) 내에 완료되지 않았습니다. 폴링을 중단합니다."
+            )
+            logger.warning(f"[쿠폰 처리 시간 초과] {alert_message}")
+            send_discord_failure_notification(alert_message, "긴급 알림: 쿠폰 처리 시간 초과")
+
+        for tracked, result in finished:
+            STATUS_RESOLUTION_SECONDS.observe(now - tracked.registered_at, status=result['status'])
+            tracked.future.set_result(result)
+
+    def _fail_pending(self, unavailable: Dict[str, Any], final_results: Dict[str, Dict[str, Any]]):
+        """
+        회로 차단으로 조회할 수 없을 때, 추적 중인 모든 요청을 완료하고 추적 대상에서 뺍니다.
+        이번 배치에서 이미 최종 결과를 받은 요청(final_results)은 그 결과로, 나머지는 GATEWAY_UNAVAILABLE로 완료합니다.
+        """
+        with self._condition:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        logger.warning(f"[회로 차단] 요청 ID {len(pending)}개의 상태 조회를 중단합니다. (다시 예약된 사이클에서 이어서 확인)")
+        STATUS_POLLS_TOTAL.inc(status=STATUS_GATEWAY_UNAVAILABLE)
+        for tracked in pending:
+            if not tracked.future.done():
+                result = final_results.get(tracked.requested_id) or dict(unavailable, requestedId=tracked.requested_id)
+                tracked.future.set_result(result)
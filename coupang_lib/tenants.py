@@ -0,0 +1,218 @@
+# coupang_lib/tenants.py
+"""
+여러 판매자 계정(테넌트)을 한 프로세스에서 운영하기 위한 설정과 실행 상태를 관리합니다.
+
+TENANTS_FILE 환경 변수에 JSON 파일 경로를 지정하면 파일에 적힌 계정마다 쿠폰 갱신 사이클을 따로 실행합니다.
+지정하지 않으면 기존처럼 .env의 ACCESS_KEY/SECRET_KEY/VENDOR_ID/CONTRACT_ID로 계정 하나만 운영합니다.
+
+TENANTS_FILE 예시 (access_key_env/secret_key_env로 비밀 키를 환경 변수 이름으로 지정할 수도 있습니다):
+    [
+      {"name": "store_a", "vendor_id": "A00012345", "access_key_env": "STORE_A_ACCESS_KEY", "secret_key_env": "STORE_A_SECRET_KEY",
+       "contract_id": "12345", "items_path": "vendor_items_a.csv", "cycle_minutes": 60},
+      {"name": "store_b", "vendor_id": "A00067890", "access_key": "...", "secret_key": "...",
+       "contract_id": "67890", "items_path": "vendor_items_b.csv", "cycle_minutes": 30, "discount_rate": 30}
+    ]
+"""
+import json
+import os
+import threading
+from typing import Any, Dict, List
+
+from coupang_lib.config import ACCESS_KEY, SECRET_KEY, VENDOR_ID, CONTRACT_ID, API_GATEWAY_URL
+from coupang_lib.config import COUPON_CYCLE_MINUTES, COUPON_DISCOUNT_RATE, COUPON_MAX_DISCOUNT_PRICE, COUPON_ROTATION_MODE, COUPON_OVERLAP_MINUTES
+from coupang_lib.config import API_KEEP_ALIVE, API_POOL_MAX_SIZE, API_POOL_IDLE_TIMEOUT_SEC, API_THROTTLE_MAX_RETRIES
+from coupang_lib.config import API_RATE_LIMIT_PER_SEC, API_STATUS_RATE_LIMIT_PER_SEC, API_COUPON_CREATE_RATE_LIMIT_PER_SEC
+from coupang_lib.config import API_CIRCUIT_BREAKER_ENABLED, API_CIRCUIT_WINDOW_SIZE, API_CIRCUIT_MIN_CALLS, API_CIRCUIT_FAILURE_RATE
+from coupang_lib.config import API_CIRCUIT_CONSECUTIVE_FAILURES, API_CIRCUIT_SLOW_CALL_SEC, API_CIRCUIT_OPEN_SEC, API_CIRCUIT_MAX_OPEN_SEC
+from coupang_lib.config import VENDOR_ITEMS_PATH
+from coupang_lib.api_client import CoupangApiClient
+from coupang_lib.rate_limiter import AdaptiveRateLimiter
+from coupang_lib.circuit_breaker import CircuitBreaker
+from coupang_lib.item_loader import VendorItemIndex, load_vendor_item_index
+from coupang_lib.item_watcher import VendorItemWatcher
+from coupang_lib.logger import logger
+
+# 단일 계정 모드(.env 설정)에서 사용하는 테넌트 이름
+DEFAULT_TENANT_NAME = "default"
+
+
+def create_api_rate_limiter() -> AdaptiveRateLimiter:
+    """한 판매자 계정의 모든 API 호출(상태 조회, 생성, 파기, 적용)이 공유하는 요청 속도 제한기를 설정값으로 만듭니다."""
+    return AdaptiveRateLimiter(
+        default_rate_per_sec=API_RATE_LIMIT_PER_SEC,
+        endpoint_rates={
+            "/requested/{id}": API_STATUS_RATE_LIMIT_PER_SEC,
+            "/coupon": API_COUPON_CREATE_RATE_LIMIT_PER_SEC,
+        },
+        global_rate_per_sec=API_RATE_LIMIT_PER_SEC
+    )
+
+
+def create_api_circuit_breaker() -> CircuitBreaker | None:
+    """한 판매자 계정의 API 호출이 공유하는 회로 차단기를 설정값으로 만듭니다. (API_CIRCUIT_BREAKER_ENABLED=false이면 None)"""
+    if not API_CIRCUIT_BREAKER_ENABLED:
+        return None
+    return CircuitBreaker(
+        window_size=API_CIRCUIT_WINDOW_SIZE,
+        min_calls=API_CIRCUIT_MIN_CALLS,
+        failure_rate_threshold=API_CIRCUIT_FAILURE_RATE,
+        consecutive_failure_threshold=API_CIRCUIT_CONSECUTIVE_FAILURES,
+        slow_call_sec=API_CIRCUIT_SLOW_CALL_SEC,
+        open_sec=API_CIRCUIT_OPEN_SEC,
+        max_open_sec=API_CIRCUIT_MAX_OPEN_SEC
+    )
+
+
+class TenantConfig:
+    """판매자 계정 하나의 인증 정보, 계약, 품목 파일, 쿠폰 설정입니다. 지정하지 않은 쿠폰 설정은 .env 값을 따릅니다."""
+    def __init__(self, name: str, vendor_id: str, access_key: str, secret_key: str, contract_id: str,
+                 items_path: str = VENDOR_ITEMS_PATH, cycle_minutes: int = COUPON_CYCLE_MINUTES,
+                 rotation_mode: str = COUPON_ROTATION_MODE, discount_rate: int = COUPON_DISCOUNT_RATE,
+                 max_discount_price: int = COUPON_MAX_DISCOUNT_PRICE, overlap_minutes: int = COUPON_OVERLAP_MINUTES):
+        self.name = name
+        self.vendor_id = vendor_id
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.contract_id = contract_id
+        self.items_path = items_path
+        self.cycle_minutes = cycle_minutes
+        self.rotation_mode = rotation_mode
+        self.discount_rate = discount_rate
+        self.max_discount_price = max_discount_price
+        self.overlap_minutes = overlap_minutes
+
+    def coupon_options(self) -> Dict[str, Any]:
+        """쿠폰 생성 요청 바디에 사용할 설정입니다. (coupang_api_utils.create_new_coupon_util의 coupon_options)"""
+        return {
+            "contract_id": self.contract_id,
+            "discount_rate": self.discount_rate,
+            "max_discount_price": self.max_discount_price,
+            "cycle_minutes": self.cycle_minutes,
+            "rotation_mode": self.rotation_mode,
+            "overlap_minutes": self.overlap_minutes,
+        }
+
+
+def default_tenant_config() -> TenantConfig:
+    """.env 설정으로 단일 계정 테넌트 설정을 만듭니다."""
+    return TenantConfig(DEFAULT_TENANT_NAME, VENDOR_ID, ACCESS_KEY, SECRET_KEY, CONTRACT_ID)
+
+
+def _secret_value(entry: Dict[str, Any], key: str, position: int):
+    """key 값을 직접 읽거나, key_env에 적힌 환경 변수에서 읽습니다."""
+    if entry.get(key):
+        return entry[key]
+    env_name = entry.get(f"{key}_env")
+    if env_name and os.getenv(env_name):
+        return os.getenv(env_name)
+    raise ValueError(f"테넌트 설정 {position}번째 항목에 '{key}' 또는 '{key}_env'(값이 있는 환경 변수)가 필요합니다.")
+
+
+def load_tenant_configs(file_path: str) -> List[TenantConfig]:
+    """
+    TENANTS_FILE(JSON 배열)에서 테넌트 설정 목록을 읽습니다.
+    필수 값이 없거나 이름/판매자 ID가 중복되면 ValueError를 발생시킵니다.
+    """
+    with open(file_path, encoding="utf-8") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list) or not entries:
+        raise ValueError(f"테넌트 설정 파일 '{file_path}'은 비어 있지 않은 JSON 배열이어야 합니다.")
+
+    configs = []
+    for position, entry in enumerate(entries, start=1):
+        missing_keys = [key for key in ("name", "vendor_id", "contract_id") if not entry.get(key)]
+        if missing_keys:
+            raise ValueError(f"테넌트 설정 {position}번째 항목에 필수 값이 없습니다: {', '.join(missing_keys)}")
+        configs.append(TenantConfig(
+            name=str(entry["name"]),
+            vendor_id=str(entry["vendor_id"]),
+            access_key=_secret_value(entry, "access_key", position),
+            secret_key=_secret_value(entry, "secret_key", position),
+            contract_id=str(entry["contract_id"]),
+            items_path=entry.get("items_path", VENDOR_ITEMS_PATH),
+            cycle_minutes=int(entry.get("cycle_minutes", COUPON_CYCLE_MINUTES)),
+            rotation_mode=str(entry.get("rotation_mode", COUPON_ROTATION_MODE)).strip().lower(),
+            discount_rate=int(entry.get("discount_rate", COUPON_DISCOUNT_RATE)),
+            max_discount_price=int(entry.get("max_discount_price", COUPON_MAX_DISCOUNT_PRICE)),
+            overlap_minutes=int(entry.get("overlap_minutes", COUPON_OVERLAP_MINUTES)),
+        ))
+
+    for attribute in ("name", "vendor_id"):
+        values = [getattr(config, attribute) for config in configs]
+        duplicates = sorted({value for value in values if values.count(value) > 1})
+        if duplicates:
+            raise ValueError(f"테넌트 설정 파일 '{file_path}'에 중복된 {attribute}가 있습니다: {', '.join(duplicates)}")
+    return configs
+
+
+class Tenant:
+    """
+    테넌트 하나의 실행 상태입니다. API 클라이언트(요청 속도 제한기 포함)와 품목 인덱스는 처음 사용할 때 만듭니다.
+    connection_pool을 지정하면 여러 테넌트가 같은 keep-alive 연결 풀을 사용하며, 요청 속도 제한은 테넌트마다 따로 적용됩니다.
+    """
+    def __init__(self, config: TenantConfig, connection_pool=None):
+        self.config = config
+        self.api_client: CoupangApiClient | None = None
+        self.vendor_items: VendorItemIndex | None = None
+        self.item_watcher: VendorItemWatcher | None = None
+        self._connection_pool = connection_pool
+        self._lock = threading.Lock()
+        # 같은 테넌트의 사이클은 한 번에 하나만 실행합니다. (겹쳐 실행되면 서로의 쿠폰을 파기할 수 있음)
+        self.cycle_lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.config.name
+
+    @property
+    def vendor_id(self) -> str:
+        return self.config.vendor_id
+
+    def get_api_client(self) -> CoupangApiClient:
+        """API 클라이언트 인스턴스를 반환합니다. (처음 호출할 때 생성)"""
+        if self.api_client is None:
+            with self._lock:
+                if self.api_client is None:
+                    self.api_client = CoupangApiClient(
+                        self.config.access_key, self.config.secret_key, API_GATEWAY_URL,
+                        keep_alive=API_KEEP_ALIVE,
+                        pool_max_size=API_POOL_MAX_SIZE,
+                        pool_idle_timeout_sec=API_POOL_IDLE_TIMEOUT_SEC,
+                        rate_limiter=create_api_rate_limiter(),
+                        max_throttle_retries=API_THROTTLE_MAX_RETRIES,
+                        connection_pool=self._connection_pool,
+                        circuit_breaker=create_api_circuit_breaker()
+                    )
+        return self.api_client
+
+    def get_vendor_items(self) -> VendorItemIndex:
+        """판매자 품목 인덱스를 반환합니다. (처음 호출할 때 품목 파일에서 로드, 중복 제거 및 검증)"""
+        if self.vendor_items is None:
+            with self._lock:
+                if self.vendor_items is None:
+                    self.vendor_items = load_vendor_item_index(self.config.items_path)
+        return self.vendor_items
+
+    def refresh_vendor_items(self) -> VendorItemIndex:
+        """
+        품목 파일 감시기가 새 품목 인덱스를 준비해 두었으면 교체하고 변경 내역을 기록한 뒤, 현재 품목 인덱스를 반환합니다.
+        사이클 시작 시에만 호출하므로 진행 중인 사이클은 시작할 때의 품목을 끝까지 사용합니다.
+        """
+        current_items = self.get_vendor_items()
+        staged_items = self.item_watcher.take_staged() if self.item_watcher is not None else None
+        if staged_items is None or staged_items == current_items:
+            return current_items
+        with self._lock:
+            added, removed = staged_items.diff(self.vendor_items)
+            self.vendor_items = staged_items
+        logger.info(f"[품목 교체] {self.log_prefix()}변경된 품목 파일을 반영합니다. 추가 {len(added)}개, 제거 {len(removed)}개, 총 {len(staged_items)}개")
+        return staged_items
+
+    def start_item_watcher(self, interval_sec: float):
+        """품목 파일 변경 감시를 시작합니다. 바뀐 품목은 refresh_vendor_items() 호출 시(다음 사이클 시작 시) 반영됩니다."""
+        self.item_watcher = VendorItemWatcher(self.config.items_path, interval_sec)
+        self.item_watcher.start()
+
+    def log_prefix(self) -> str:
+        """로그/알림 메시지 앞에 붙일 테넌트 표시입니다. (단일 계정 모드에서는 빈 문자열)"""
+        return "" if self.name == DEFAULT_TENANT_NAME else f"[{self.name}] "
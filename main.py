@@ -1,46 +1,143 @@
+import contextvars
 import datetime
+import threading
 import time
-import schedule
-from typing import Callable, Any, Tuple
+from typing import Callable, Any, Dict, List, Set, Tuple
 import traceback
 
 
-from coupang_lib.config import VENDOR_ID, COUPON_CYCLE_MINUTES, API_GATEWAY_URL, ACCESS_KEY, SECRET_KEY
-from coupang_lib.api_client import CoupangApiClient
-from coupang_lib.coupang_api_utils import create_new_coupon_util, check_coupon_status_util, apply_coupon_to_items_util, get_active_coupons_by_keyword, deactivate_coupon
-from coupang_lib.item_loader import load_vendor_items_from_csv
-from coupang_lib.logger import logger
+from coupang_lib.config import API_GATEWAY_URL, API_KEEP_ALIVE, API_POOL_MAX_SIZE, API_POOL_IDLE_TIMEOUT_SEC, API_MAX_CONCURRENCY, STATUS_POLL_TICK_SEC, STATUS_POLL_MAX_REQUESTS_PER_TICK, APPLY_BATCH_SIZE, COUPON_ROTATION_MODE, STATE_DB_PATH
+from coupang_lib.config import SCHEDULE_ALIGN_TO_WALL_CLOCK, SCHEDULE_MAX_CONCURRENT_CYCLES, POST_CREATE_WAIT_SEC, PRE_APPLY_WAIT_SEC, METRICS_PORT, APPLY_INCREMENTAL
+from coupang_lib.config import VENDOR_ITEMS_RELOAD_INTERVAL_SEC, TENANTS_FILE, GIT_UPDATE_CHECK_INTERVAL_MINUTES
+from coupang_lib.api_client import CoupangApiClient, create_connection_pool
+from coupang_lib.coupang_api_utils import create_new_coupon_util, check_coupon_status_util, apply_coupon_to_items_util, get_active_coupons_by_keyword, deactivate_coupon, deactivate_coupon_async, apply_coupon_to_items_util_async, split_into_batches, STATUS_GATEWAY_UNAVAILABLE
+from coupang_lib.status_tracker import RequestedStatusTracker
+from coupang_lib.state_store import CouponStateStore, ITEM_APPLIED, ITEM_FAILED
+from coupang_lib.cycle_scheduler import CycleScheduler
+from coupang_lib.metrics import CYCLE_PHASE_DURATION_SECONDS, CYCLES_TOTAL, CYCLE_DURATION_SECONDS, start_metrics_server
+from coupang_lib.item_loader import VendorItemIndex
+from coupang_lib.tenants import Tenant, DEFAULT_TENANT_NAME, create_api_rate_limiter, default_tenant_config, load_tenant_configs
+from coupang_lib.logger import logger, set_log_context
 from coupang_lib.discord_notifier import send_discord_success_notification, send_discord_failure_notification
-from coupang_lib.git_utils import check_for_git_updates
+from coupang_lib.git_utils import get_cached_update_message, start_git_update_checker
 
 # --- 설정 가능한 상수 정의 (config.config.py로 이동을 고려) ---
 MAX_DEACTIVATION_RETRIES = 3
 MAX_APPLY_RETRIES = 3
 APPLY_RETRY_DELAY_SEC = 5
+DEFERRED_RETRY_MIN_SEC = 5  # API Gateway 장애로 미룬 사이클을 다시 시도하기까지의 최소 대기 시간
 # ----------------------------------------------------
 
 
-# API 클라이언트 인스턴스 초기화
-api_client = CoupangApiClient(ACCESS_KEY, SECRET_KEY, API_GATEWAY_URL)
+# 테넌트(판매자 계정)의 API 클라이언트와 판매자 품목, 상태 저장소는 모듈을 불러올 때가 아니라 처음 사용할 때 만듭니다.
+# (재시작이나 import만 하는 경우의 시작 시간을 줄이기 위함. 아래 get_* 함수로 접근합니다.)
+default_tenant: Tenant | None = None  # .env 설정으로 운영하는 단일 계정 테넌트
+state_store: CouponStateStore | None = None  # 모든 테넌트가 공유 (판매자 ID로 구분)
+_lazy_init_lock = threading.Lock()
 
-# 판매자 품목 데이터 로드
-VENDOR_ITEMS = load_vendor_items_from_csv()
+# 현재 스레드에서 사이클을 실행 중인 테넌트 (사이클을 실행하는 스레드마다 별도로 유지, 없으면 default_tenant)
+_current_tenant: contextvars.ContextVar[Tenant | None] = contextvars.ContextVar("current_tenant", default=None)
+
+
+def get_default_tenant() -> Tenant:
+    """.env 설정으로 만든 단일 계정 테넌트를 반환합니다. (처음 호출할 때 생성)"""
+    global default_tenant
+    if default_tenant is None:
+        with _lazy_init_lock:
+            if default_tenant is None:
+                default_tenant = Tenant(default_tenant_config())
+    return default_tenant
+
+
+def _tenant() -> Tenant:
+    """현재 사이클을 실행 중인 테넌트를 반환합니다."""
+    return _current_tenant.get() or get_default_tenant()
+
+
+def get_api_client() -> CoupangApiClient:
+    """현재 테넌트의 API 클라이언트 인스턴스를 반환합니다. (처음 호출할 때 생성)"""
+    return _tenant().get_api_client()
+
+
+def get_vendor_items() -> VendorItemIndex:
+    """현재 테넌트의 판매자 품목 인덱스를 반환합니다. (처음 호출할 때 품목 파일에서 로드, 중복 제거 및 검증)"""
+    return _tenant().get_vendor_items()
+
+
+def refresh_vendor_items() -> VendorItemIndex:
+    """
+    현재 테넌트의 품목 파일 감시기가 새 품목 인덱스를 준비해 두었으면 교체한 뒤, 현재 품목 인덱스를 반환합니다.
+    사이클 시작 시에만 호출하므로 진행 중인 사이클은 시작할 때의 품목을 끝까지 사용합니다.
+    """
+    return _tenant().refresh_vendor_items()
+
+
+def get_state_store() -> CouponStateStore:
+    """사이클 진행 상태 저장소를 반환합니다. (재시작 시 진행 중이던 사이클을 이어서 처리, 처음 호출할 때 생성)"""
+    global state_store
+    if state_store is None:
+        with _lazy_init_lock:
+            if state_store is None:
+                state_store = CouponStateStore(STATE_DB_PATH)
+    return state_store
+
+
+# 현재 실행 중인 사이클 ID (사이클을 실행하는 스레드마다 별도로 유지)
+_current_cycle_id: contextvars.ContextVar[int | None] = contextvars.ContextVar("current_cycle_id", default=None)
+
+# 사이클 단계 (교체 방식별 실행 순서)
+PHASE_DEACTIVATE = "DEACTIVATE"
+PHASE_CREATE = "CREATE"
+PHASE_APPLY = "APPLY"
+PHASE_DEACTIVATE_PREVIOUS = "DEACTIVATE_PREVIOUS"
+CYCLE_PHASES = {
+    "expire_first": [PHASE_DEACTIVATE, PHASE_CREATE, PHASE_APPLY],
+    "overlap": [PHASE_CREATE, PHASE_APPLY, PHASE_DEACTIVATE_PREVIOUS],
+}
+
+
+def _finish_cycle(cycle_id: int, result: str, started_at: float):
+    """사이클 종료 결과를 상태 저장소와 지표에 기록합니다."""
+    get_state_store().finish_cycle(cycle_id, result)
+    CYCLES_TOTAL.inc(tenant=_tenant().name, result=result)
+    CYCLE_DURATION_SECONDS.observe(time.monotonic() - started_at, tenant=_tenant().name, result=result)
+
+
+def _record_pending_requests(kind: str, requested_ids: List[str], coupon_id: int | None = None):
+    """현재 사이클에서 결과를 기다리는 requestedId를 상태 저장소에 기록합니다."""
+    cycle_id = _current_cycle_id.get()
+    if cycle_id is not None and requested_ids:
+        get_state_store().add_pending_requests(cycle_id, kind, requested_ids, coupon_id)
 
 
 # --- 핵심 API 유틸리티 함수를 감싸는 래퍼 함수들 ---
-def create_coupon_request():
-    """새로운 쿠폰 생성 요청을 수행합니다."""
-    return create_new_coupon_util(api_client, VENDOR_ID)
+def create_coupon_request(scheduled_at: datetime.datetime | None = None):
+    """새로운 쿠폰 생성 요청을 수행합니다. scheduled_at은 쿠폰 종료 시각 계산 기준이 되는 사이클 예정 시각입니다."""
+    return create_new_coupon_util(get_api_client(), _tenant().vendor_id, scheduled_at, _tenant().config.coupon_options())
 
 
 def check_requested_status(requested_id):
     """요청 ID에 대한 상태를 확인하고, 완료되면 쿠폰 ID를 반환합니다."""
-    return check_coupon_status_util(api_client, VENDOR_ID, requested_id)
+    return check_coupon_status_util(get_api_client(), _tenant().vendor_id, requested_id)
 
 
 def apply_coupon_to_items_request(coupon_id):
     """생성된 쿠폰을 로드된 품목에 적용 요청합니다. (Requested ID 반환)"""
-    return apply_coupon_to_items_util(api_client, VENDOR_ID, coupon_id, VENDOR_ITEMS)
+    return apply_coupon_to_items_util(get_api_client(), _tenant().vendor_id, coupon_id, get_vendor_items())
+
+
+class GatewayUnavailableError(Exception):
+    """API Gateway 회로가 열려 있어 사이클의 남은 단계를 진행할 수 없을 때 발생합니다. (사이클은 중단된 단계부터 다시 예약)"""
+    def __init__(self, retry_after_sec: float):
+        super().__init__(f"API Gateway 장애로 요청이 차단되었습니다. {retry_after_sec:.0f}초 후 다시 시도할 수 있습니다.")
+        self.retry_after_sec = retry_after_sec
+
+
+def _raise_if_gateway_unavailable(api_client_instance: CoupangApiClient):
+    """API 클라이언트의 회로 차단기가 게이트웨이 전체를 차단 중이면 재시도로 사이클 시간을 쓰지 않고 바로 GatewayUnavailableError를 발생시킵니다."""
+    breaker = api_client_instance.circuit_breaker
+    if breaker is not None and breaker.gateway_open():
+        raise GatewayUnavailableError(breaker.seconds_until_probe())
 
 
 # 최대 폴링 시간 (초) 및 경고 임계값 설정
@@ -48,6 +145,66 @@ MAX_POLLING_TIME_SEC = 3600  # 총 1시간 (60분)까지 폴링 시도
 NOTIFICATION_THRESHOLD_SEC = 900 # 15분 (900초) 이상 지연 시 경고 로깅
 
 
+# requestedId 상태를 모아서 폴링하는 추적기는 API 클라이언트 객체(status_trackers)에 판매자별로 보관합니다.
+# (클라이언트가 사라지면 추적기도 함께 정리되며, close() 시 추적 스레드가 종료됩니다.)
+_status_trackers_lock = threading.Lock()  # 동시에 실행되는 사이클 스레드가 같은 추적기를 중복으로 만들지 않도록 보호
+
+
+def _get_status_tracker(api_client_instance: CoupangApiClient, vendor_id: str) -> RequestedStatusTracker:
+    """API 클라이언트와 판매자 ID에 해당하는 상태 추적기를 반환합니다. (없으면 생성)"""
+    with _status_trackers_lock:
+        tracker = api_client_instance.status_trackers.get(vendor_id)
+        if tracker is None:
+            tracker = RequestedStatusTracker(
+                api_client_instance, vendor_id,
+                max_requests_per_tick=STATUS_POLL_MAX_REQUESTS_PER_TICK,
+                tick_interval_sec=STATUS_POLL_TICK_SEC,
+                max_concurrency=API_MAX_CONCURRENCY,
+                max_polling_time_sec=MAX_POLLING_TIME_SEC,
+                notification_threshold_sec=NOTIFICATION_THRESHOLD_SEC
+            )
+            api_client_instance.status_trackers[vendor_id] = tracker
+    return tracker
+
+
+def _poll_status_for_requested_ids(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    requested_ids: List[str]
+) -> Dict[str, Tuple[str, int | None]]:
+    """
+    여러 requestedId를 상태 추적기에 등록하고 모두 끝날 때까지 기다립니다.
+    추적기는 다른 단계에서 등록한 요청과 함께 한꺼번에 폴링하므로,
+    전체 소요 시간은 가장 느린 요청 하나의 처리 시간과 비슷합니다.
+
+    Returns:
+        requestedId별 (status, coupon_id) 딕셔너리.
+        status는 "DONE", "FAIL", "ERROR", "TIMEOUT"(최대 폴링 시간 초과) 중 하나입니다.
+        회로 차단으로 조회하지 못한 요청이 있으면 GatewayUnavailableError가 발생합니다.
+    """
+    results = _wait_for_requested_ids(api_client_instance, vendor_id, requested_ids)
+    return {requested_id: (result['status'], result['couponId']) for requested_id, result in results.items()}
+
+
+def _wait_for_requested_ids(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    requested_ids: List[str]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    상태 추적기로 requestedId들의 최종 결과를 기다린 뒤 상태 저장소에 기록하고, ID별 상세 결과를 반환합니다.
+    회로 차단으로 조회하지 못한 요청이 있으면 결과를 기록하지 않고(재실행 시 이어서 확인) GatewayUnavailableError를 발생시킵니다.
+    """
+    results = _get_status_tracker(api_client_instance, vendor_id).wait_for(requested_ids)
+    unavailable = [result for result in results.values() if result['status'] == STATUS_GATEWAY_UNAVAILABLE]
+    for requested_id, result in results.items():
+        if result['status'] != STATUS_GATEWAY_UNAVAILABLE:
+            get_state_store().resolve_request(requested_id, result['status'], result['couponId'])
+    if unavailable:
+        raise GatewayUnavailableError(max(result['retryAfterSec'] for result in unavailable))
+    return results
+
+
 def _poll_status_for_requested_id(
     api_client_instance: CoupangApiClient,
     vendor_id: str,
@@ -55,80 +212,93 @@ def _poll_status_for_requested_id(
 ) -> int | None:
     """
     requestedId에 대해 특정 상태가 될 때까지 API를 폴링합니다.
-    총 폴링 시간에 따라 대기 간격을 점진적으로 늘립니다.
     성공적으로 'DONE' 상태가 되면 해당 couponId (int)를 반환하고,
     그 외의 경우 (FAIL, ERROR, 또는 최대 폴링 시간 초과) None을 반환합니다.
     """
-    start_time = time.monotonic()
-    attempt = 0
-    total_elapsed_time_sec = 0
-    
-    # 알림이 이미 한 번 발생했는지 추적하는 플래그
-    notification_sent = False 
+    status, coupon_id = _poll_status_for_requested_ids(api_client_instance, vendor_id, [requested_id])[requested_id]
+    return coupon_id if status == "DONE" else None
 
-    while total_elapsed_time_sec < MAX_POLLING_TIME_SEC:
-        attempt += 1
-        
-        # 현재까지 경과된 시간에 따라 동적으로 대기 간격 결정
-        if total_elapsed_time_sec < 60: # 1분 미만: 5초 단위
-            sleep_interval_sec = 5
-        elif total_elapsed_time_sec < 5 * 60: # 1분 이상 5분 미만: 30초 단위
-            sleep_interval_sec = 30
-        elif total_elapsed_time_sec < 30 * 60: # 5분 이상 30분 미만: 1분 단위 (60초)
-            sleep_interval_sec = 60
-        else: # 30분 이상: 5분 단위 (300초)
-            sleep_interval_sec = 300 
-        
-        logger.info(f"요청 ID {requested_id} 상태 확인 중... (시도 {attempt}, 경과 시간: {total_elapsed_time_sec:.0f}초, 다음 대기: {sleep_interval_sec}초)")
-        
-        status, coupon_id = check_coupon_status_util(api_client_instance, vendor_id, requested_id)
-        
-        if status == "DONE":
-            logger.info(f"요청 ID {requested_id} 처리 완료. 쿠폰 ID: {coupon_id}")
-            return coupon_id
-        elif status == "FAIL" or status == "ERROR":
-            logger.error(f"요청 ID {requested_id} 처리 실패 또는 오류 발생. 폴링 중단.")
-            return None
-        
-        # REQUESTED 상태일 경우 대기 후 재시도
-        total_elapsed_time_sec = time.monotonic() - start_time
-        
-        # 특정 시간 이상 지연될 경우 상세 알림 로깅 및 Discord 알림 전송 (한 번만)
-        if total_elapsed_time_sec >= NOTIFICATION_THRESHOLD_SEC and not notification_sent:
-            alert_message = (
-                f"요청 ID '{requested_id}'의 쿠폰 처리가 "
-                f"{total_elapsed_time_sec:.0f}초 ({total_elapsed_time_sec / 60:.1f}분) 이상 지연 중입니다. "
-                "수동 확인이 필요할 수 있습니다."
-            )
-            logger.warning(f"[쿠폰 처리 지연 알림] {alert_message}")
-            send_discord_failure_notification(alert_message, "긴급 알림: 쿠폰 처리 지연")
-            notification_sent = True
-            
-        # MAX_POLLING_TIME_SEC에 도달하기 전에만 sleep
-        # 다음 대기 후에도 MAX_POLLING_TIME_SEC를 초과하지 않을 경우에만 sleep
-        if total_elapsed_time_sec + sleep_interval_sec < MAX_POLLING_TIME_SEC:
-            logger.debug(f"요청 ID {requested_id} 상태 아직 완료되지 않음 ({status}). {sleep_interval_sec}초 후 재시도...")
-            time.sleep(sleep_interval_sec)
+
+def _issue_deactivation_requests(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    coupons: List[Dict[str, Any]]
+) -> List[str | None]:
+    """쿠폰 파기 요청을 동시에 보내고, coupons 순서대로 Requested ID(실패 시 None) 목록을 반환합니다."""
+    import asyncio
+    from coupang_lib.async_api_client import AsyncCoupangApiClient
+
+    async def _issue_all():
+        async_api = AsyncCoupangApiClient.wrap(api_client_instance, API_MAX_CONCURRENCY)
+        try:
+            return await asyncio.gather(*(
+                deactivate_coupon_async(async_api, vendor_id, coupon['couponId'], coupon.get('promotionName', '이름 없음'))
+                for coupon in coupons
+            ))
+        finally:
+            async_api.close()
+
+    return asyncio.run(_issue_all())
+
+
+def deactivate_coupons_concurrently(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    coupons: List[Dict[str, Any]]
+) -> Dict[int, str]:
+    """
+    주어진 쿠폰들을 한꺼번에 파기합니다.
+    모든 파기 요청을 먼저 보낸 뒤, 받은 requestedId들을 동시에 폴링합니다.
+
+    Returns:
+        쿠폰 ID별 결과 딕셔너리. 값은 "DONE", "FAIL", "ERROR", "TIMEOUT",
+        "REQUEST_FAILED"(파기 요청 실패 또는 Requested ID 없음) 중 하나입니다.
+    """
+    outcomes: Dict[int, str] = {}
+    valid_coupons = []
+    for coupon in coupons:
+        if coupon.get('couponId'):
+            valid_coupons.append(coupon)
         else:
-            # 최대 시간 초과 직전 또는 초과 후에는 더 이상 대기하지 않고 루프를 종료
-            break # 루프를 빠져나와 최종 실패 메시지로 이동
-
-    # while 루프가 종료될 경우 (MAX_POLLING_TIME_SEC 초과했거나 break에 의해)
-    # 이때만 최종 실패 알림을 보냅니다.
-    alert_message = (
-        f"요청 ID '{requested_id}'의 쿠폰 처리가 "
-        f"지정된 최대 폴링 시간 ({MAX_POLLING_TIME_SEC}초, 약 {MAX_POLLING_TIME_SEC / 60:.0f}분) 내에 완료되지 않았습니다. 폴링을 중단합니다."
-    )
-    logger.warning(f"[쿠폰 처리 시간 초과] {alert_message}")
-    send_discord_failure_notification(alert_message, "긴급 알림: 쿠폰 처리 시간 초과")
-    return None
+            logger.warning(f"[실패] 쿠폰 비활성화 시도 실패: 쿠폰 ID를 찾을 수 없음 (이름: {coupon.get('promotionName', '이름 없음')}).")
+
+    if not valid_coupons:
+        return outcomes
+
+    logger.info(f"쿠폰 {len(valid_coupons)}개 비활성화 요청을 동시에 전송 중...")
+    requested_ids = _issue_deactivation_requests(api_client_instance, vendor_id, valid_coupons)
+
+    requested_by_coupon = {}
+    for coupon, requested_id in zip(valid_coupons, requested_ids):
+        if requested_id:
+            requested_by_coupon[coupon['couponId']] = requested_id
+            _record_pending_requests("deactivate", [requested_id], coupon['couponId'])
+        else:
+            logger.warning(f"[실패] 쿠폰 {coupon['couponId']} 비활성화 요청 실패 또는 Requested ID를 받지 못했습니다.")
+            outcomes[coupon['couponId']] = "REQUEST_FAILED"
+
+    if requested_by_coupon:
+        poll_results = _poll_status_for_requested_ids(api_client_instance, vendor_id, list(requested_by_coupon.values()))
+        for coupon_id, requested_id in requested_by_coupon.items():
+            status, _ = poll_results[requested_id]
+            outcomes[coupon_id] = status
+            if status == "DONE":
+                logger.info(f"[성공] 쿠폰 {coupon_id} 비활성화 요청 ({requested_id}) 완료.", extra={"requested_id": requested_id})
+            else:
+                logger.warning(f"[경고] 쿠폰 {coupon_id} 비활성화 요청 ({requested_id})이 지정된 시간 내에 완료되지 않았거나 실패했습니다. (결과: {status})", extra={"requested_id": requested_id})
 
+    return outcomes
 
 
-def get_and_deactivate_auto_coupons_request(api_client_instance: CoupangApiClient, vendor_id: str) -> bool:
+def get_and_deactivate_auto_coupons_request(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    exclude_coupon_ids: Set[int] | None = None
+) -> bool:
     """
     API를 사용하여 활성화된 "자동쿠폰_" 쿠폰을 조회하고 모두 파기(비활성화)합니다.
-    개별 비활성화 요청 후 그 상태를 폴링합니다.
+    모든 파기 요청을 먼저 보낸 뒤 그 상태를 한꺼번에 폴링합니다.
+    exclude_coupon_ids에 포함된 쿠폰(예: 방금 적용한 새 쿠폰)은 비활성화하지 않습니다.
     """
     logger.info("[쿠폰 자동화] API로 기존 '자동쿠폰_' 쿠폰 비활성화 프로세스 시작...")
 
@@ -138,74 +308,62 @@ def get_and_deactivate_auto_coupons_request(api_client_instance: CoupangApiClien
         logger.error("[실패] 활성 쿠폰 목록 조회 중 치명적인 오류가 발생하여 비활성화 프로세스를 진행할 수 없습니다.")
         return False
 
+    if exclude_coupon_ids:
+        coupons_to_deactivate = [c for c in coupons_to_deactivate if c.get('couponId') not in exclude_coupon_ids]
+
     if not coupons_to_deactivate:
         logger.info("API로 비활성화할 '자동쿠폰_' 쿠폰이 없습니다.")
         return True
 
     logger.info(f"API로 비활성화할 '자동쿠폰_' 쿠폰 {len(coupons_to_deactivate)}개 발견.")
 
-    successfully_deactivated_count = 0
     total_coupons_to_deactivate = len(coupons_to_deactivate)
-
-    for coupon in coupons_to_deactivate:
-        coupon_id = coupon.get('couponId')
-        accurate_coupon_name = coupon.get('promotionName', '이름 없음')
-
-        if not coupon_id:
-            logger.warning(f"[실패] 쿠폰 비활성화 시도 실패: 쿠폰 ID를 찾을 수 없음 (이름: {accurate_coupon_name}).")
-            continue
-
-        logger.info(f"쿠폰 {coupon_id} 비활성화 요청 중... (이름: '{accurate_coupon_name}')")
-        deactivation_requested_id = deactivate_coupon(api_client_instance, vendor_id, coupon_id, accurate_coupon_name)
-
-        if not deactivation_requested_id:
-            logger.warning(f"[실패] 쿠폰 {coupon_id} 비활성화 요청 실패 또는 Requested ID를 받지 못했습니다.")
-            continue
-
-        poll_result = _poll_status_for_requested_id(
-            api_client_instance,
-            vendor_id,
-            deactivation_requested_id
-        )
-
-        if poll_result is not None:
-            successfully_deactivated_count += 1
-            logger.info(f"[성공] 쿠폰 {coupon_id} 비활성화 요청 ({deactivation_requested_id}) 완료.")
-        else:
-            logger.warning(f"[경고] 쿠폰 {coupon_id} 비활성화 요청 ({deactivation_requested_id})이 지정된 시간 내에 완료되지 않았거나 실패했습니다.")
+    outcomes = deactivate_coupons_concurrently(api_client_instance, vendor_id, coupons_to_deactivate)
+    successfully_deactivated_count = sum(1 for outcome in outcomes.values() if outcome == "DONE")
 
     logger.info(f"API로 총 {total_coupons_to_deactivate}개 '자동쿠폰_' 쿠폰 중 {successfully_deactivated_count}개 비활성화 완료.")
     return successfully_deactivated_count == total_coupons_to_deactivate
 
 
-def _handle_deactivation_phase(api_client_instance: CoupangApiClient, vendor_id: str) -> bool:
+def _handle_deactivation_phase(api_client_instance: CoupangApiClient, vendor_id: str, exclude_coupon_ids: Set[int] | None = None) -> bool:
     """
     기존 자동 생성 쿠폰을 비활성화하는 단계를 처리합니다.
     재시도 로직을 포함합니다.
     """
     for attempt in range(MAX_DEACTIVATION_RETRIES):
+        _raise_if_gateway_unavailable(api_client_instance)
         logger.info(f"기존 쿠폰 비활성화 시도 중... (시도 {attempt + 1}/{MAX_DEACTIVATION_RETRIES})")
-        if get_and_deactivate_auto_coupons_request(api_client_instance, vendor_id):
+        if get_and_deactivate_auto_coupons_request(api_client_instance, vendor_id, exclude_coupon_ids):
             logger.info("[성공] 기존 쿠폰 비활성화 프로세스 완료.")
             return True
         else:
+            _raise_if_gateway_unavailable(api_client_instance)
             logger.warning(f"[실패] 기존 쿠폰 비활성화 실패 (시도 {attempt + 1}/{MAX_DEACTIVATION_RETRIES}). {APPLY_RETRY_DELAY_SEC}초 후 재시도...")
             time.sleep(APPLY_RETRY_DELAY_SEC)
     logger.error("[오류] 기존 쿠폰 비활성화가 반복 실패하여 다음 단계로 진행하지 않습니다.")
     return False
 
-def _create_and_poll_coupon(api_client_instance: CoupangApiClient, vendor_id: str) -> int | None:
+def _fixed_wait(seconds: float, reason: str):
+    """단계 사이의 고정 대기 시간입니다. (0 이하이면 대기하지 않음)"""
+    if seconds <= 0:
+        return
+    logger.info(f"{reason} {seconds:g}초 대기 중...")
+    time.sleep(seconds)
+
+def _create_and_poll_coupon(api_client_instance: CoupangApiClient, vendor_id: str, scheduled_at: datetime.datetime | None = None) -> int | None:
     """
     새로운 쿠폰을 생성하고, 생성 완료 상태를 폴링하여 쿠폰 ID를 반환합니다.
     """
-    requested_id = create_coupon_request()
+    _raise_if_gateway_unavailable(api_client_instance)
+    requested_id = create_coupon_request(scheduled_at)
     if not requested_id:
+        _raise_if_gateway_unavailable(api_client_instance)
         logger.error("쿠폰 생성 요청 실패.")
         return None
 
-    logger.info(f"쿠폰 생성 요청 완료. Requested ID: {requested_id}")
-    time.sleep(5)
-    logger.info(f"쿠폰 생성 후 5초 대기 중...")
+    logger.info(f"쿠폰 생성 요청 완료. Requested ID: {requested_id}", extra={"requested_id": requested_id})
+    _record_pending_requests("create", [requested_id])
+    _fixed_wait(POST_CREATE_WAIT_SEC, "쿠폰 생성 후")
 
     coupon_id = _poll_status_for_requested_id(
         api_client_instance, 
@@ -218,106 +376,405 @@ def _create_and_poll_coupon(api_client_instance: CoupangApiClient, vendor_id: st
     return coupon_id
 
 
-def _apply_coupon_with_retries(api_client_instance: CoupangApiClient, coupon_id: int, vendor_items: list) -> bool:
+def _submit_apply_batches(
+    api_client_instance: CoupangApiClient,
+    vendor_id: str,
+    coupon_id: int,
+    batches: List[list]
+) -> List[str | None]:
+    """품목 배치별 쿠폰 적용 요청을 동시에 보내고, batches 순서대로 Requested ID(실패 시 None) 목록을 반환합니다."""
+    import asyncio
+    from coupang_lib.async_api_client import AsyncCoupangApiClient
+
+    async def _submit_all():
+        async_api = AsyncCoupangApiClient.wrap(api_client_instance, API_MAX_CONCURRENCY)
+        try:
+            return await asyncio.gather(*(
+                apply_coupon_to_items_util_async(async_api, vendor_id, coupon_id, batch) for batch in batches
+            ))
+        finally:
+            async_api.close()
+
+    return asyncio.run(_submit_all())
+
+
+def _pending_items_for_coupon(coupon_id: int, vendor_items: VendorItemIndex) -> VendorItemIndex:
+    """증분 적용 시, 상태 저장소 기록 기준으로 쿠폰에 아직 적용되지 않았거나 적용에 실패한 품목만 반환합니다."""
+    applied_items = VendorItemIndex(get_state_store().get_item_ids(coupon_id, ITEM_APPLIED))
+    if not applied_items:
+        return vendor_items
+    pending_items = vendor_items.difference(applied_items)
+    logger.info(f"[증분 적용] 쿠폰 {coupon_id}에 이미 적용된 품목 {len(vendor_items) - len(pending_items)}개를 제외하고 {len(pending_items)}개만 적용합니다.")
+    return pending_items
+
+
+def _apply_coupon_with_retries(api_client_instance: CoupangApiClient, coupon_id: int, vendor_items: VendorItemIndex) -> bool:
     """
     생성된 쿠폰을 품목에 적용합니다. 재시도 로직을 포함합니다.
+    품목은 APPLY_BATCH_SIZE개씩 나누어 동시에 적용 요청하며,
+    재시도 시에는 실패한 배치만 다시 보냅니다.
+    APPLY_INCREMENTAL이 켜져 있으면 품목별 적용 결과를 상태 저장소에 기록하여, 이미 적용된 품목은 보내지 않고
+    요청이 DONE이어도 일부 품목이 실패했다면(failedVendorItems) 그 품목만 다시 보냅니다.
     """
+    pending_items = _pending_items_for_coupon(coupon_id, vendor_items) if APPLY_INCREMENTAL else vendor_items
+    if not pending_items:
+        logger.info(f"[성공] 쿠폰 {coupon_id}에 모든 품목이 이미 적용되어 있습니다.")
+        return True
+    logger.info(f"쿠폰 {coupon_id} 적용 대상 품목 {len(pending_items)}개를 {len(split_into_batches(pending_items, APPLY_BATCH_SIZE))}개 배치로 나누어 적용합니다. (배치 크기: {APPLY_BATCH_SIZE})")
+
     for attempt_apply in range(MAX_APPLY_RETRIES):
-        logger.info(f"쿠폰 {coupon_id} 품목 적용 시도 중... (시도 {attempt_apply + 1}/{MAX_APPLY_RETRIES})")
-        apply_requested_id = apply_coupon_to_items_request(coupon_id)
-        
-        if apply_requested_id:
-            poll_result = _poll_status_for_requested_id(
-                api_client_instance, 
-                VENDOR_ID, 
-                apply_requested_id
-            )
-            
-            if poll_result is not None:
-                logger.info("[성공] 쿠폰 적용 완료!")
-                return True
+        _raise_if_gateway_unavailable(api_client_instance)
+        batches = split_into_batches(pending_items, APPLY_BATCH_SIZE)
+        logger.info(f"쿠폰 {coupon_id} 품목 적용 시도 중... (시도 {attempt_apply + 1}/{MAX_APPLY_RETRIES}, 품목 {len(pending_items)}개, 배치 {len(batches)}개)")
+        requested_ids = _submit_apply_batches(api_client_instance, _tenant().vendor_id, coupon_id, batches)
+
+        submitted_ids = [requested_id for requested_id in requested_ids if requested_id]
+        _record_pending_requests("apply", submitted_ids, coupon_id)
+        if len(submitted_ids) < len(requested_ids):
+            # 보낸 요청은 기록해 두었으므로, 다시 예약된 사이클이 결과를 이어서 확인합니다.
+            _raise_if_gateway_unavailable(api_client_instance)
+        batch_results = _wait_for_requested_ids(api_client_instance, _tenant().vendor_id, submitted_ids)
+
+        retry_items = VendorItemIndex()
+        failed_batch_count = 0
+        for index, (batch, requested_id) in enumerate(zip(batches, requested_ids)):
+            if not requested_id:
+                logger.warning(f"[실패] 쿠폰 {coupon_id} 배치 {index + 1}/{len(batches)} 품목 적용 요청 실패 또는 Requested ID를 받지 못했습니다.")
+                retry_items = retry_items.union(batch)
+                failed_batch_count += 1
+                continue
+
+            result = batch_results[requested_id]
+            if result['status'] != "DONE":
+                logger.warning(f"[경고] 쿠폰 {coupon_id} 배치 {index + 1}/{len(batches)} 품목 적용 요청 ({requested_id})이 지정된 시간 내에 완료되지 않았거나 실패했습니다. (결과: {result['status']}, 실패: {result['failed']}/{result['total']})", extra={"requested_id": requested_id})
+                retry_items = retry_items.union(batch)
+                failed_batch_count += 1
+                continue
+
+            failed_items = VendorItemIndex(result['failedItems']).intersection(batch) if APPLY_INCREMENTAL else VendorItemIndex()
+            if APPLY_INCREMENTAL:
+                get_state_store().record_item_results(coupon_id, batch.difference(failed_items), ITEM_APPLIED, requested_id)
+                get_state_store().record_item_results(coupon_id, failed_items, ITEM_FAILED, requested_id)
+            if failed_items:
+                logger.warning(f"[주의] 쿠폰 {coupon_id} 배치 {index + 1}/{len(batches)} ({requested_id}) 일부 품목 적용 실패. 성공: {result['succeeded']}/{result['total']}, 실패 품목 {len(failed_items)}개는 다시 적용합니다.", extra={"requested_id": requested_id})
+                retry_items = retry_items.union(failed_items)
+            elif result['failed']:
+                logger.warning(f"[주의] 쿠폰 {coupon_id} 배치 {index + 1}/{len(batches)} ({requested_id}) 일부 품목 적용 실패. 성공: {result['succeeded']}/{result['total']}, 실패: {result['failed']}", extra={"requested_id": requested_id})
             else:
-                logger.warning(f"[경고] 쿠폰 {coupon_id} 품목 적용 요청 ({apply_requested_id})이 지정된 시간 내에 완료되지 않았거나 실패했습니다.")
-        else:
-            logger.warning(f"[실패] 쿠폰 {coupon_id} 품목 적용 요청 실패 또는 Requested ID를 받지 못했습니다.")
+                logger.info(f"[성공] 쿠폰 {coupon_id} 배치 {index + 1}/{len(batches)} ({requested_id}) 적용 완료. 성공: {result['succeeded']}/{result['total']}", extra={"requested_id": requested_id})
+
+        if not retry_items:
+            logger.info("[성공] 쿠폰 적용 완료!")
+            return True
+        pending_items = retry_items
 
         if (attempt_apply + 1) < MAX_APPLY_RETRIES:
-            logger.warning(f"[실패] 쿠폰 {coupon_id} 품목 적용 실패 (시도 {attempt_apply + 1}/{MAX_APPLY_RETRIES}). {APPLY_RETRY_DELAY_SEC}초 후 재시도...")
+            logger.warning(f"[실패] 쿠폰 {coupon_id} 품목 적용 실패 (시도 {attempt_apply + 1}/{MAX_APPLY_RETRIES}, 실패 배치 {failed_batch_count}개, 재시도 품목 {len(retry_items)}개). {APPLY_RETRY_DELAY_SEC}초 후 실패한 품목만 재시도...")
             time.sleep(APPLY_RETRY_DELAY_SEC)
-    
+
     logger.error(f"[오류] 쿠폰 {coupon_id} 품목 적용이 반복 실패하여 다음 사이클까지 기다립니다.")
     return False
 
 
 # 메인 쿠폰 자동화 사이클 함수
-def run_coupon_cycle():
+def run_coupon_cycle(resume_from: Dict[str, Any] | None = None, scheduled_at: datetime.datetime | None = None, tenant: Tenant | None = None) -> str:
     """
     쿠폰 자동화의 전체 사이클을 실행합니다.
     기존 자동 생성 쿠폰 비활성화, 새 쿠폰 생성, 상태 확인 및 품목 적용을 포함합니다.
+    쿠폰 교체 방식(COUPON_ROTATION_MODE)이 "overlap"이면 새 쿠폰 적용이 끝난 뒤에 기존 쿠폰을 비활성화합니다.
+    tenant를 지정하면 해당 판매자 계정의 클라이언트, 품목, 쿠폰 설정으로 실행합니다. (지정하지 않으면 .env 계정)
+    각 단계는 상태 저장소에 기록되며, resume_from(resume_interrupted_cycle 참고)이 주어지면 해당 단계부터 이어서 실행합니다.
+    scheduled_at은 스케줄러가 정한 예정 실행 시각이며, 새 쿠폰의 종료 시각과 다음 실행 예정 시각을 이 시각 기준으로 계산합니다.
     최종 성공 또는 실패 여부를 Discord 알림으로 보냅니다.
+    사이클 결과("SUCCESS", "FAILED", "ERROR", "SKIPPED", "DEFERRED")를 반환합니다.
+    API Gateway 회로가 열려 있으면 남은 단계를 재시도하지 않고 "DEFERRED"를 반환하며, 사이클은 끝나지 않은 상태로 남아
+    resume_interrupted_cycle로 중단된 단계부터 이어서 진행할 수 있습니다.
     """
-    logger.info("\n--- 쿠폰 자동화: 새로운 쿠폰 갱신 사이클 시작 ---")
+    if tenant is not None:
+        _current_tenant.set(tenant)
+    tenant = _tenant()
+    set_log_context(tenant=tenant.name, cycle_id=None)
+    logger.info(f"\n--- {tenant.log_prefix()}쿠폰 자동화: 새로운 쿠폰 갱신 사이클 시작 ---" if resume_from is None else f"\n--- {tenant.log_prefix()}쿠폰 자동화: 중단된 쿠폰 갱신 사이클 이어서 진행 ---")
     
     notification_message = ""
-    notification_subject_prefix = "쿠폰 자동화 스크립트" # 제목 접두사
+    notification_subject_prefix = f"{tenant.log_prefix()}쿠폰 자동화 스크립트" # 제목 접두사
+    cycle_id = None
+    cycle_started_at = time.monotonic()
 
     try:
-        discord_update_message = check_for_git_updates()
+        # 원격 업데이트 확인은 백그라운드 스레드가 하므로, 마지막 확인 결과만 가져옵니다.
+        discord_update_message = get_cached_update_message()
 
-        if not VENDOR_ITEMS:
+        # 사이클 동안 같은 품목 목록을 사용하도록 시작 시 한 번만 가져옵니다.
+        vendor_items = refresh_vendor_items()
+        if not vendor_items:
             notification_message = "[경고] VENDOR_ITEMS가 로드되지 않아 쿠폰 생성 및 적용을 건너뜁니다."
             logger.warning(notification_message)
             send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
-            return 
-
-        if not _handle_deactivation_phase(api_client, VENDOR_ID):
-            notification_message = "[오류] 기존 쿠폰 비활성화 단계 실패. 다음 단계로 진행하지 않습니다."
-            logger.error(notification_message)
-            send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
-            return
-
-        coupon_id = _create_and_poll_coupon(api_client, VENDOR_ID)
-        if not coupon_id:
-            notification_message = "[오류] 새 쿠폰 생성 단계 실패. 다음 단계로 진행하지 않습니다."
-            logger.error(notification_message)
-            send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
-            return
-
-        time.sleep(5)
-        logger.info(f"쿠폰 상태 확인 후 5초 대기 중...")
-
-        if not _apply_coupon_with_retries(api_client, coupon_id, VENDOR_ITEMS):
-            notification_message = "[오류] 쿠폰 품목 적용 단계 실패."
-            logger.error(notification_message)
-            send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
-            return
+            return "SKIPPED"
+
+        if resume_from is None:
+            rotation_mode = tenant.config.rotation_mode if tenant.config.rotation_mode in CYCLE_PHASES else "expire_first"
+            phases = CYCLE_PHASES[rotation_mode]
+            start_phase = phases[0]
+            coupon_id = None
+            cycle_id = get_state_store().start_cycle(tenant.vendor_id, rotation_mode, start_phase)
+        else:
+            rotation_mode = resume_from['rotation_mode']
+            phases = CYCLE_PHASES[rotation_mode]
+            start_phase = resume_from['phase']
+            coupon_id = resume_from['coupon_id']
+            cycle_id = resume_from['cycle_id']
+        _current_cycle_id.set(cycle_id)
+        set_log_context(cycle_id=cycle_id)
+
+        # overlap 모드에서는 새 쿠폰을 먼저 생성/적용한 뒤 이전 쿠폰을 비활성화하여 할인 공백을 없앱니다.
+        overlap_rotation = rotation_mode == "overlap"
+        remaining_phases = phases[phases.index(start_phase):]
+
+        if PHASE_DEACTIVATE in remaining_phases:
+            get_state_store().set_phase(cycle_id, PHASE_DEACTIVATE)
+            with CYCLE_PHASE_DURATION_SECONDS.time(tenant=tenant.name, phase=PHASE_DEACTIVATE):
+                deactivated = _handle_deactivation_phase(get_api_client(), tenant.vendor_id)
+            if not deactivated:
+                notification_message = "[오류] 기존 쿠폰 비활성화 단계 실패. 다음 단계로 진행하지 않습니다."
+                logger.error(notification_message)
+                send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
+                _finish_cycle(cycle_id, "FAILED", cycle_started_at)
+                return "FAILED"
+
+        if PHASE_CREATE in remaining_phases:
+            get_state_store().set_phase(cycle_id, PHASE_CREATE)
+            with CYCLE_PHASE_DURATION_SECONDS.time(tenant=tenant.name, phase=PHASE_CREATE):
+                coupon_id = _create_and_poll_coupon(get_api_client(), tenant.vendor_id, scheduled_at)
+            if not coupon_id:
+                notification_message = "[오류] 새 쿠폰 생성 단계 실패. 다음 단계로 진행하지 않습니다."
+                logger.error(notification_message)
+                send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
+                _finish_cycle(cycle_id, "FAILED", cycle_started_at)
+                return "FAILED"
+
+            with CYCLE_PHASE_DURATION_SECONDS.time(tenant=tenant.name, phase="PRE_APPLY_WAIT"):
+                _fixed_wait(PRE_APPLY_WAIT_SEC, "쿠폰 상태 확인 후")
+
+        if PHASE_APPLY in remaining_phases:
+            get_state_store().set_phase(cycle_id, PHASE_APPLY, coupon_id)
+            with CYCLE_PHASE_DURATION_SECONDS.time(tenant=tenant.name, phase=PHASE_APPLY):
+                applied = _apply_coupon_with_retries(get_api_client(), coupon_id, vendor_items)
+            if not applied:
+                notification_message = "[오류] 쿠폰 품목 적용 단계 실패."
+                if overlap_rotation:
+                    notification_message += " 기존 쿠폰은 비활성화하지 않고 유지합니다."
+                logger.error(notification_message)
+                send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
+                _finish_cycle(cycle_id, "FAILED", cycle_started_at)
+                return "FAILED"
+
+        if PHASE_DEACTIVATE_PREVIOUS in remaining_phases:
+            get_state_store().set_phase(cycle_id, PHASE_DEACTIVATE_PREVIOUS, coupon_id)
+            with CYCLE_PHASE_DURATION_SECONDS.time(tenant=tenant.name, phase=PHASE_DEACTIVATE_PREVIOUS):
+                previous_deactivated = _handle_deactivation_phase(get_api_client(), tenant.vendor_id, exclude_coupon_ids={coupon_id})
+            if not previous_deactivated:
+                notification_message = f"[오류] 새 쿠폰 {coupon_id} 적용은 완료되었으나 이전 쿠폰 비활성화 단계 실패."
+                logger.error(notification_message)
+                send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (실패)")
+                _finish_cycle(cycle_id, "FAILED", cycle_started_at)
+                return "FAILED"
+
+        _finish_cycle(cycle_id, "SUCCESS", cycle_started_at)
+        if APPLY_INCREMENTAL:
+            # 이전 쿠폰은 비활성화되었으므로 현재 쿠폰의 품목 적용 기록만 남깁니다.
+            get_state_store().prune_item_results(tenant.vendor_id, {coupon_id})
         
-        next_run_time = datetime.datetime.now() + datetime.timedelta(minutes=COUPON_CYCLE_MINUTES)
+        next_run_time = (scheduled_at or datetime.datetime.now()) + datetime.timedelta(minutes=tenant.config.cycle_minutes)
         next_run_time_str = next_run_time.strftime('%Y년 %m월 %d일 %H시 %M분')
 
         notification_message = f"다음 실행 예정: {next_run_time_str}"
 
         send_discord_success_notification(notification_message + discord_update_message, f"{notification_subject_prefix} (성공)")
-        logger.info(f"--- 쿠폰 자동화: 쿠폰 갱신 사이클 종료 (성공) ---")
+        logger.info(f"--- {tenant.log_prefix()}쿠폰 자동화: 쿠폰 갱신 사이클 종료 (성공) ---")
         logger.info(notification_message)
         logger.info(discord_update_message)
-
+        return "SUCCESS"
+
+    except GatewayUnavailableError as e:
+        notification_message = f"[지연] {e} 사이클을 중단하고, 중단된 단계부터 다시 시도합니다."
+        logger.warning(notification_message)
+        send_discord_failure_notification(notification_message, f"{notification_subject_prefix} (지연)")
+        # 사이클은 종료하지 않고 남겨 두어 다시 예약된 실행에서 이어서 진행합니다.
+        CYCLES_TOTAL.inc(tenant=tenant.name, result="DEFERRED")
+        return "DEFERRED"
     except Exception as e:
         error_details = traceback.format_exc()
         notification_message = f"[치명적 오류] 쿠폰 자동화 사이클 실행 중 예상치 못한 오류 발생: {e}\n\n상세 정보:\n```{error_details}```"
         critical_subject = f"긴급 알림: {notification_subject_prefix} 치명적 오류"
         logger.critical(notification_message)
         send_discord_failure_notification(notification_message, critical_subject)
+        if cycle_id is not None:
+            _finish_cycle(cycle_id, "ERROR", cycle_started_at)
+        return "ERROR"
+    finally:
+        if cycle_id is not None:
+            # 끝나지 않은 사이클(DEFERRED 등)은 다른 실행에서 이어서 진행할 수 있도록 실행 중 기록을 지웁니다.
+            get_state_store().release_cycle(cycle_id)
 
 
-# 자동 실행 설정
-if __name__ == "__main__":
-    logger.info(f"쿠폰 자동화 시작: {COUPON_CYCLE_MINUTES}분마다 쿠폰 갱신 실행 대기 중")
+def resume_interrupted_cycle(tenant: Tenant | None = None, scheduled_at: datetime.datetime | None = None) -> str | None:
+    """
+    프로세스 재시작 전(또는 API Gateway 장애로 미루기 전)에 끝나지 않은 사이클이 있으면, 기록된 requestedId들의 결과를 먼저 폴링한 뒤
+    중단된 단계부터 사이클을 이어서 실행합니다. 이어서 진행한 사이클의 결과(run_coupon_cycle 참고)를 반환하고, 없으면 None을 반환합니다.
+    tenant를 지정하면 해당 판매자 계정의 중단된 사이클만 이어서 진행합니다.
+    """
+    if tenant is not None:
+        _current_tenant.set(tenant)
+    tenant = _tenant()
+    set_log_context(tenant=tenant.name)
+    # 다른 스레드가 실행 중인 사이클은 제외하고, 찾은 사이클은 이 스레드가 실행 중인 것으로 기록합니다.
+    unfinished_cycle = get_state_store().claim_unfinished_cycle(tenant.vendor_id)
+    if unfinished_cycle is None:
+        return None
 
-    run_coupon_cycle() # 최초 1회 실행
+    cycle_id = unfinished_cycle['cycle_id']
+    try:
+        return _resume_claimed_cycle(tenant, unfinished_cycle, scheduled_at)
+    finally:
+        get_state_store().release_cycle(cycle_id)
+
+
+def _resume_claimed_cycle(tenant: Tenant, unfinished_cycle: Dict[str, Any], scheduled_at: datetime.datetime | None) -> str | None:
+    """claim_unfinished_cycle로 가져온 사이클을 중단된 단계부터 이어서 실행합니다. (resume_interrupted_cycle 참고)"""
+    cycle_id = unfinished_cycle['cycle_id']
+    get_state_store().abandon_older_cycles(tenant.vendor_id, cycle_id)
+    if unfinished_cycle['rotation_mode'] not in CYCLE_PHASES:
+        get_state_store().finish_cycle(cycle_id, "ABANDONED")
+        return None
+
+    logger.info(f"[재시작 복구] {tenant.log_prefix()}중단된 사이클 {cycle_id} 발견 (단계: {unfinished_cycle['phase']}, 쿠폰 ID: {unfinished_cycle['coupon_id']}). 이어서 진행합니다.")
+    _current_cycle_id.set(cycle_id)
+    set_log_context(cycle_id=cycle_id)
+
+    unresolved_ids = [request['requested_id'] for request in get_state_store().list_requests(cycle_id) if request['status'] is None]
+    if unresolved_ids:
+        logger.info(f"[재시작 복구] 결과를 받지 못한 요청 {len(unresolved_ids)}개의 상태 폴링을 재개합니다.")
+        try:
+            _wait_for_requested_ids(get_api_client(), tenant.vendor_id, unresolved_ids)
+        except GatewayUnavailableError as e:
+            logger.warning(f"[재시작 복구] {e} 사이클 {cycle_id}은 다시 예약된 실행에서 이어서 진행합니다.")
+            CYCLES_TOTAL.inc(tenant=tenant.name, result="DEFERRED")
+            return "DEFERRED"
+
+    phases = CYCLE_PHASES[unfinished_cycle['rotation_mode']]
+    resume_phase = unfinished_cycle['phase']
+    coupon_id = unfinished_cycle['coupon_id']
+
+    if resume_phase == PHASE_CREATE:
+        # 생성 요청이 이미 완료되었다면 새 쿠폰을 다시 만들지 않고 적용 단계부터 진행합니다.
+        create_requests = get_state_store().list_requests(cycle_id, "create")
+        done_create = next((request for request in reversed(create_requests) if request['status'] == "DONE" and request['resolved_coupon_id']), None)
+        if done_create:
+            coupon_id = done_create['resolved_coupon_id']
+            resume_phase = PHASE_APPLY
+    elif resume_phase == PHASE_APPLY:
+        # 기록된 적용 요청이 모두 완료(DONE)되었다면 적용 단계를 건너뜁니다.
+        # (하나라도 실패했다면 다시 적용하며, 증분 적용 시 적용 완료가 기록된 품목은 제외)
+        apply_requests = get_state_store().list_requests(cycle_id, "apply")
+        if apply_requests and all(request['status'] == "DONE" for request in apply_requests):
+            next_index = phases.index(PHASE_APPLY) + 1
+            if next_index >= len(phases):
+                get_state_store().finish_cycle(cycle_id, "SUCCESS")
+                logger.info(f"[재시작 복구] 사이클 {cycle_id}의 품목 적용이 이미 완료되어 사이클을 종료 처리합니다.")
+                return "SUCCESS"
+            resume_phase = phases[next_index]
+
+    return run_coupon_cycle(resume_from={
+        'cycle_id': cycle_id,
+        'rotation_mode': unfinished_cycle['rotation_mode'],
+        'phase': resume_phase,
+        'coupon_id': coupon_id,
+    }, scheduled_at=scheduled_at, tenant=tenant)
+
+
+def build_tenants() -> List[Tenant]:
+    """
+    운영할 테넌트 목록을 만듭니다. TENANTS_FILE이 지정되어 있으면 파일의 계정들을, 없으면 .env 계정 하나를 사용합니다.
+    keep-alive 모드에서는 모든 테넌트가 API Gateway 연결 풀 하나를 함께 사용하며,
+    한 테넌트의 느린 요청이 다른 테넌트의 연결을 막지 않도록 풀 크기를 테넌트 수만큼 늘립니다.
+    """
+    if not TENANTS_FILE:
+        return [get_default_tenant()]
+    configs = load_tenant_configs(TENANTS_FILE)
+    connection_pool = None
+    if API_KEEP_ALIVE:
+        connection_pool = create_connection_pool(API_GATEWAY_URL, API_POOL_MAX_SIZE * len(configs), API_POOL_IDLE_TIMEOUT_SEC)
+    return [Tenant(config, connection_pool) for config in configs]
 
-    schedule.every(COUPON_CYCLE_MINUTES).minutes.do(run_coupon_cycle)
 
-    while True:
-        schedule.run_pending()
-        time.sleep(10)
\ No newline at end of file
+def _tenant_cycle_job(tenant: Tenant, scheduler: CycleScheduler | None = None, job_name: str | None = None) -> Callable[[datetime.datetime], None]:
+    """
+    스케줄러에 등록할 테넌트별 사이클 작업을 만듭니다.
+    첫 회차에서는 재시작 전에 중단된 사이클이 있으면 이어서 처리하고, 없으면 새 사이클을 실행합니다.
+    복구 폴링도 테넌트별 작업 스레드에서 진행하므로 한 테넌트의 복구가 다른 테넌트의 첫 사이클을 늦추지 않습니다.
+    API Gateway 장애로 사이클을 미뤘으면(DEFERRED) 회로 차단기가 시험 요청을 허용하는 시각에 재실행을 예약하고,
+    재실행(또는 그보다 먼저 온 다음 회차)에서 미룬 사이클을 이어서 진행합니다.
+    스케줄러가 회차를 겹쳐 실행하더라도 같은 테넌트의 사이클은 tenant.cycle_lock으로 하나씩 차례로 실행합니다.
+    (겹쳐 실행되면 한 사이클의 기존 쿠폰 파기 단계가 다른 사이클이 적용 중인 쿠폰까지 파기할 수 있음)
+    """
+    # 중단된 사이클을 이어서 진행할 차례인지 여부 (동시에 실행되는 회차 중 하나만 가져가도록 잠금으로 확인 후 해제)
+    resume_lock = threading.Lock()
+    resume_pending = True
+
+    def take_resume_pending() -> bool:
+        nonlocal resume_pending
+        with resume_lock:
+            pending, resume_pending = resume_pending, False
+        return pending
+
+    def job(scheduled_at: datetime.datetime):
+        nonlocal resume_pending
+        result = None
+        with tenant.cycle_lock:
+            if take_resume_pending():
+                result = resume_interrupted_cycle(tenant, scheduled_at)
+            if result is None:
+                result = run_coupon_cycle(scheduled_at=scheduled_at, tenant=tenant)
+        if result == "DEFERRED":
+            with resume_lock:
+                resume_pending = True
+            if scheduler is not None and job_name is not None:
+                breaker = tenant.get_api_client().circuit_breaker
+                retry_after_sec = breaker.seconds_until_probe() if breaker is not None else 0.0
+                scheduler.run_once(job_name, max(DEFERRED_RETRY_MIN_SEC, retry_after_sec), scheduled_at)
+
+    return job
+
+
+# 자동 실행 설정
+if __name__ == "__main__":
+    tenants = build_tenants()
+    for tenant in tenants:
+        logger.info(f"{tenant.log_prefix()}쿠폰 자동화 시작: {tenant.config.cycle_minutes}분마다 쿠폰 갱신 실행 대기 중 (판매자 ID: {tenant.vendor_id})")
+
+    if METRICS_PORT > 0:
+        start_metrics_server(METRICS_PORT)
+
+    if GIT_UPDATE_CHECK_INTERVAL_MINUTES > 0:
+        start_git_update_checker(GIT_UPDATE_CHECK_INTERVAL_MINUTES * 60)
+
+    if VENDOR_ITEMS_RELOAD_INTERVAL_SEC > 0:
+        for tenant in tenants:
+            tenant.start_item_watcher(VENDOR_ITEMS_RELOAD_INTERVAL_SEC)
+
+    # 마감 시각까지 잠들었다가 사이클을 테넌트별 스레드에서 실행합니다.
+    # (사이클이 길어지거나 한 테넌트의 폴링이 멈춰도 다음 일정이나 다른 테넌트의 사이클이 밀리지 않음)
+    scheduler = CycleScheduler(align_to_wall_clock=SCHEDULE_ALIGN_TO_WALL_CLOCK)
+    for tenant in tenants:
+        job_name = "coupon-cycle" if tenant.name == DEFAULT_TENANT_NAME else f"coupon-cycle-{tenant.name}"
+        scheduler.add_job(
+            job_name,
+            _tenant_cycle_job(tenant, scheduler, job_name),
+            tenant.config.cycle_minutes,
+            run_immediately=True, # 최초 1회 실행 (중단된 사이클이 있으면 이어서 처리)
+            max_concurrent_runs=SCHEDULE_MAX_CONCURRENT_CYCLES,
+            on_skip=lambda scheduled_at, tenant=tenant: CYCLES_TOTAL.inc(tenant=tenant.name, result="SKIPPED"),
+        )
+    scheduler.run_forever()